@@ -0,0 +1,74 @@
+"""Plain-Python operations behind the CLI commands.
+
+Every function takes an open connection, so scripts can run many operations
+over one connection and transaction without going through Typer:
+
+    with get_db_connection(db_path) as conn, transaction(conn):
+        for article_id in article_ids:
+            mark_read(conn, article_id)
+"""
+
+from __future__ import annotations
+
+import logging
+from sqlite3 import Connection, Row
+from typing import Iterable
+
+from rss_rag.database import (
+    add_feed,
+    add_reading_history,
+    get_article,
+)
+
+logger = logging.getLogger(__name__)
+
+READING_ACTIONS = ("opened", "read", "starred", "dismissed")
+
+
+def mark_read(conn: Connection, article_id: int, action: str = "read") -> Row:
+    """Record a reading action for an article.
+
+    Args:
+        conn: Database connection.
+        article_id: Article ID.
+        action: One of READING_ACTIONS.
+
+    Returns:
+        The article that was marked.
+
+    Raises:
+        ValueError: If the action is unknown or the article does not exist.
+    """
+    if action not in READING_ACTIONS:
+        raise ValueError(f"Invalid action. Use: {', '.join(READING_ACTIONS)}")
+
+    article = get_article(conn, article_id)
+    if not article:
+        raise ValueError(f"Article {article_id} not found")
+
+    add_reading_history(conn, article_id, action)
+    return article
+
+
+def add_feeds(conn: Connection, urls: Iterable[str]) -> int:
+    """Add feeds that are not already in the database.
+
+    Args:
+        conn: Database connection.
+        urls: Feed URLs.
+
+    Returns:
+        Number of new feeds added.
+    """
+    new_count = 0
+    for url in urls:
+        # add_feed leaves an existing feed untouched, so only a new row
+        # changes the connection's total_changes
+        changes = conn.total_changes
+        add_feed(conn, url)
+        if conn.total_changes > changes:
+            new_count += 1
+            logger.info("Added new feed: %s", url)
+        else:
+            logger.debug("Feed already exists: %s", url)
+    return new_count
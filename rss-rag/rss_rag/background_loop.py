@@ -0,0 +1,87 @@
+"""Background event loop behind the sync wrappers of the async APIs.
+
+asyncio.run creates and tears down an event loop per call and fails inside a
+running loop (Jupyter, web servers). The sync wrappers instead submit their
+coroutines to one long-lived loop on a daemon thread, which also keeps
+loop-bound state such as the LightRAG instance's locks on a single loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import Any, AsyncIterator, Coroutine, Iterator, TypeVar
+
+T = TypeVar("T")
+
+_loop: asyncio.AbstractEventLoop | None = None
+_loop_thread: threading.Thread | None = None
+_lock = threading.Lock()
+
+
+def get_background_loop() -> asyncio.AbstractEventLoop:
+    """Get the background event loop, starting it on first use.
+
+    Returns:
+        Event loop running forever on a daemon thread.
+    """
+    global _loop, _loop_thread
+    with _lock:
+        if _loop is None:
+            loop = asyncio.new_event_loop()
+            _loop_thread = threading.Thread(
+                target=loop.run_forever, name="rss-rag-loop", daemon=True
+            )
+            _loop_thread.start()
+            _loop = loop
+    return _loop
+
+
+def run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine on the background loop and wait for its result.
+
+    Args:
+        coro: Coroutine to run.
+
+    Returns:
+        The coroutine's result.
+
+    Raises:
+        RuntimeError: If called from the background loop itself, which would
+            deadlock.
+    """
+    loop = get_background_loop()
+    if threading.current_thread() is _loop_thread:
+        coro.close()
+        raise RuntimeError("run_sync called from the background loop")
+    return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+
+def iter_sync(aiterator: AsyncIterator[T]) -> Iterator[T]:
+    """Iterate an async iterator from sync code, one item at a time.
+
+    Items are pulled only as the caller consumes them, so results stream
+    instead of being collected first. Closing the generator early closes
+    the async iterator too.
+
+    Args:
+        aiterator: Async iterator to drain.
+
+    Yields:
+        Items of the async iterator.
+    """
+
+    async def next_item() -> T:
+        return await aiterator.__anext__()
+
+    try:
+        while True:
+            try:
+                item = run_sync(next_item())
+            except StopAsyncIteration:
+                return
+            yield item
+    finally:
+        aclose = getattr(aiterator, "aclose", None)
+        if aclose is not None:
+            run_sync(aclose())
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from pathlib import Path
 from typing import Optional
@@ -11,22 +12,22 @@ from rich.console import Console
 from rich.table import Table
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
+from rss_rag import api
 from rss_rag.config import get_config, load_config, set_config
 from rss_rag.cost_tracker import get_cost_tracker, format_cost_summary
 from rss_rag.database import (
+    close_all_connections,
     init_db,
-    get_connection,
     get_stats,
-    add_reading_history,
-    get_article,
+    pooled_connection,
 )
 from rss_rag.discovery import discover_articles, format_discovery_result
 from rss_rag.feed_manager import (
     import_feeds_from_file,
-    fetch_all_feeds,
+    fetch_all_feeds_async,
     fetch_and_store_feed,
 )
-from rss_rag.ingestion import ingest_pending_articles, get_pending_count
+from rss_rag.ingestion import ingest_pending_articles_async, get_pending_count
 from rss_rag.logging_config import setup_logging
 from rss_rag.search import search, QueryMode, format_search_result
 
@@ -40,6 +41,10 @@ app = typer.Typer(
 console = Console()
 logger = logging.getLogger(__name__)
 
+# Rich redraws on its own timer; successes only rename the task every Nth item
+PROGRESS_REFRESH_PER_SECOND = 4
+PROGRESS_DESCRIBE_EVERY = 10
+
 
 @app.callback()
 def main(
@@ -75,6 +80,8 @@ def init(
     # Initialize database
     db_path = config.storage.sqlite_db
     if db_path.exists() and not force:
+        # Schema is idempotent; re-applying it adds any new tables/indexes
+        init_db(db_path)
         console.print(f"[yellow]![/yellow] Database already exists: {db_path}")
         console.print("  Use --force to reinitialize")
     else:
@@ -158,24 +165,34 @@ def fetch(
         total_found = 0
         errors = 0
 
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            task = progress.add_task("Fetching feeds...", total=None)
+        async def _run() -> None:
+            nonlocal total_new, total_found, errors
 
-            for result in fetch_all_feeds(db_path, feeds_file, max_articles):
+            done = 0
+            async for result in fetch_all_feeds_async(
+                db_path, feeds_file, max_articles
+            ):
+                done += 1
                 if result.error:
                     errors += 1
                     progress.update(task, description=f"[red]✗[/red] {result.feed_url}")
                 else:
                     total_new += result.articles_new
                     total_found += result.articles_found
-                    progress.update(
-                        task,
-                        description=f"[green]✓[/green] {result.feed_title or result.feed_url}",
-                    )
+                    if done % PROGRESS_DESCRIBE_EVERY == 0:
+                        progress.update(
+                            task,
+                            description=f"[green]✓[/green] {result.feed_title or result.feed_url}",
+                        )
+
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=console,
+            refresh_per_second=PROGRESS_REFRESH_PER_SECOND,
+        ) as progress:
+            task = progress.add_task("Fetching feeds...", total=None)
+            asyncio.run(_run())
 
         console.print()
         console.print(f"[bold]Fetch complete:[/bold]")
@@ -212,21 +229,20 @@ def ingest(
     success_count = 0
     error_count = 0
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
-        task = progress.add_task("Ingesting...", total=to_process)
+    async def _run() -> None:
+        nonlocal success_count, error_count
 
-        for result in ingest_pending_articles(db_path, limit):
+        async for result in ingest_pending_articles_async(db_path, limit):
             if result.success:
                 success_count += 1
-                progress.update(
-                    task,
-                    advance=1,
-                    description=f"[green]✓[/green] {result.title[:40]}...",
-                )
+                if success_count % PROGRESS_DESCRIBE_EVERY == 0:
+                    progress.update(
+                        task,
+                        advance=1,
+                        description=f"[green]✓[/green] {result.title[:40]}...",
+                    )
+                else:
+                    progress.advance(task)
             else:
                 error_count += 1
                 progress.update(
@@ -235,6 +251,15 @@ def ingest(
                     description=f"[red]✗[/red] {result.title[:40]}: {result.error}",
                 )
 
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console,
+        refresh_per_second=PROGRESS_REFRESH_PER_SECOND,
+    ) as progress:
+        task = progress.add_task("Ingesting...", total=to_process)
+        asyncio.run(_run())
+
     console.print()
     console.print("[bold]Ingestion complete:[/bold]")
     console.print(f"  Successful: {success_count}")
@@ -254,11 +279,8 @@ def stats() -> None:
         )
         raise typer.Exit(1)
 
-    conn = get_connection(db_path)
-    try:
+    with pooled_connection(db_path) as conn:
         db_stats = get_stats(conn)
-    finally:
-        conn.close()
 
     table = Table(title="RSS-RAG Statistics")
     table.add_column("Metric", style="cyan")
@@ -271,7 +293,7 @@ def stats() -> None:
     table.add_row("Unread Articles", str(db_stats.get("unread_articles", 0)))
 
     # Show ingested count if available
-    ingested = db_stats.get("ingested_articles", 0)
+    ingested = db_stats.get("indexed_articles", 0)
     if ingested > 0:
         table.add_row("Ingested to LightRAG", str(ingested))
 
@@ -336,26 +358,16 @@ def mark_read(
         )
         raise typer.Exit(1)
 
-    valid_actions = ["opened", "read", "starred", "dismissed"]
-    if action not in valid_actions:
-        console.print(
-            f"[red]Error:[/red] Invalid action. Use: {', '.join(valid_actions)}"
-        )
-        raise typer.Exit(1)
-
-    conn = get_connection(db_path)
-    try:
-        article = get_article(conn, article_id)
-        if not article:
-            console.print(f"[red]Error:[/red] Article {article_id} not found")
+    with pooled_connection(db_path) as conn:
+        try:
+            article = api.mark_read(conn, article_id, action)
+        except ValueError as e:
+            console.print(f"[red]Error:[/red] {e}")
             raise typer.Exit(1)
 
-        add_reading_history(conn, article_id, action)
-        console.print(
-            f"[green]✓[/green] Marked article {article_id} as '{action}': {article['title'][:50]}..."
-        )
-    finally:
-        conn.close()
+    console.print(
+        f"[green]✓[/green] Marked article {article_id} as '{action}': {article['title'][:50]}..."
+    )
 
 
 @app.command()
@@ -402,7 +414,10 @@ def costs(
 
 def main_cli() -> None:
     """Entry point for CLI."""
-    app()
+    try:
+        app()
+    finally:
+        close_all_connections()
 
 
 if __name__ == "__main__":
@@ -1,10 +1,11 @@
 """Configuration loading and validation."""
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Literal
 
 import yaml
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 
 class StorageConfig(BaseModel):
@@ -20,6 +21,10 @@ class EmbeddingsConfig(BaseModel):
 
     provider: Literal["sentence-transformers", "openai"] = "sentence-transformers"
     model: str = "all-MiniLM-L6-v2"
+    # sentence-transformers only: inference backend and optional weights file,
+    # e.g. backend "onnx" with "onnx/model_qint8_avx512_vnni.onnx" for int8 CPU
+    backend: Literal["torch", "onnx", "openvino"] = "torch"
+    model_file: str | None = None
 
 
 class LLMConfig(BaseModel):
@@ -40,6 +45,9 @@ class LLMsConfig(BaseModel):
         )
     )
     summarizer: LLMConfig = Field(default_factory=lambda: LLMConfig(temperature=0.3))
+    # Reuse responses of similar (not only identical) prompts for sampled
+    # calls; loads the embedding model for every cache miss
+    semantic_cache: bool = False
 
 
 class LightRAGConfig(BaseModel):
@@ -48,6 +56,7 @@ class LightRAGConfig(BaseModel):
     chunk_size: int = 1200
     chunk_overlap: int = 100
     max_graph_depth: int = 3
+    max_parallel_insert: int = 4
 
 
 class FeedsConfig(BaseModel):
@@ -55,6 +64,7 @@ class FeedsConfig(BaseModel):
 
     fetch_interval: int = 3600
     max_articles_per_fetch: int = 50
+    max_concurrent_fetches: int = 16
 
 
 class Config(BaseModel):
@@ -67,9 +77,17 @@ class Config(BaseModel):
     feeds: FeedsConfig = Field(default_factory=FeedsConfig)
 
 
+# Built once at import and shared by every config load
+_CONFIG_ADAPTER = TypeAdapter(Config)
+
+
 def load_config(config_path: Path | None = None) -> Config:
     """Load config from YAML file, or use defaults.
 
+    Parsed files are memoized by path and modification time, so repeated
+    loads of an unchanged file skip YAML parsing and validation. Each call
+    returns its own copy, so callers may modify it.
+
     Args:
         config_path: Path to the YAML configuration file.
 
@@ -77,10 +95,23 @@ def load_config(config_path: Path | None = None) -> Config:
         Config instance with loaded or default values.
     """
     if config_path and config_path.exists():
-        with open(config_path) as f:
-            data = yaml.safe_load(f)
-        return Config.model_validate(data or {})
-    return Config()
+        cached = _load_config_file(
+            str(config_path.resolve()), config_path.stat().st_mtime_ns
+        )
+        return cached.model_copy(deep=True)
+    # Defaults are known-valid, so skip validation
+    return Config.model_construct()
+
+
+@lru_cache(maxsize=4)
+def _load_config_file(path: str, mtime_ns: int) -> Config:
+    """Parse and validate a YAML config file.
+
+    mtime_ns is only part of the cache key, so an edited file is reparsed.
+    """
+    with open(path) as f:
+        data = yaml.safe_load(f)
+    return _CONFIG_ADAPTER.validate_python(data or {})
 
 
 # Global config instance
@@ -2,13 +2,22 @@
 
 from __future__ import annotations
 
+import atexit
 import json
 import logging
-from dataclasses import dataclass, field, asdict
+import queue
+from bisect import bisect_left
+from dataclasses import dataclass, field, asdict, replace
 from datetime import datetime
+from operator import attrgetter, itemgetter
 from pathlib import Path
-from threading import Lock
-from typing import Literal
+from threading import Lock, Thread
+from typing import Iterator, Literal
+
+try:
+    import orjson
+except ImportError:  # fall back to the stdlib encoder
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +31,13 @@ PRICING = {
     "text-embedding-3-large": {"input": 0.13, "output": 0.0},
 }
 
+# (input, output) USD per token, precomputed from PRICING
+_PRICE_PER_TOKEN = {
+    model: (p["input"] / 1_000_000, p["output"] / 1_000_000)
+    for model, p in PRICING.items()
+}
+_DEFAULT_PRICE_PER_TOKEN = (0.01 / 1_000_000, 0.01 / 1_000_000)
+
 
 @dataclass
 class APICall:
@@ -33,6 +49,13 @@ class APICall:
     input_tokens: int
     output_tokens: int
     cost_usd: float
+    # Epoch seconds of `timestamp`, for cheap date filtering. Computed from the
+    # ISO string for records persisted before this field existed.
+    timestamp_epoch: float = 0.0
+
+    def __post_init__(self) -> None:
+        if not self.timestamp_epoch:
+            self.timestamp_epoch = datetime.fromisoformat(self.timestamp).timestamp()
 
 
 @dataclass
@@ -46,19 +69,56 @@ class CostSummary:
     by_operation: dict[str, float] = field(default_factory=dict)
     by_model: dict[str, float] = field(default_factory=dict)
 
+    def add(self, call: APICall) -> None:
+        """Fold a single call into the totals."""
+        self.total_calls += 1
+        self.total_input_tokens += call.input_tokens
+        self.total_output_tokens += call.output_tokens
+        self.total_cost_usd += call.cost_usd
+
+        # By operation
+        self.by_operation[call.operation] = (
+            self.by_operation.get(call.operation, 0) + call.cost_usd
+        )
+
+        # By model
+        self.by_model[call.model] = self.by_model.get(call.model, 0) + call.cost_usd
+
+
+def _encode_line(call: APICall) -> bytes:
+    """Serialize a call as one newline-terminated JSON line."""
+    if orjson is not None:
+        return orjson.dumps(asdict(call), option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(asdict(call)) + "\n").encode()
+
+
+def _decode_line(line: bytes) -> APICall:
+    """Parse one JSON line back into a call."""
+    data = orjson.loads(line) if orjson is not None else json.loads(line)
+    return APICall(**data)
+
 
 class CostTracker:
-    """Thread-safe API cost tracker with persistence."""
+    """Thread-safe API cost tracker with persistence.
+
+    Calls are written to storage by a background thread, so recording never
+    blocks on disk I/O. Use flush() to wait until everything is written.
+    """
 
     def __init__(self, storage_path: Path | None = None):
         """Initialize cost tracker.
 
         Args:
-            storage_path: Path to store cost history (JSON)
+            storage_path: Path to store cost history (JSON Lines)
         """
         self.storage_path = storage_path
         self.calls: list[APICall] = []
         self._lock = Lock()
+        # Running all-time totals so summaries don't rescan the history
+        self._totals = CostSummary()
+        # Calls waiting for the writer thread (started on first record)
+        self._queue: queue.Queue[APICall] = queue.Queue()
+        self._writer: Thread | None = None
 
         if storage_path and storage_path.exists():
             self._load()
@@ -82,23 +142,29 @@ class CostTracker:
             Estimated cost in USD
         """
         # Calculate cost
-        pricing = PRICING.get(model, {"input": 0.01, "output": 0.01})
-        cost = (input_tokens / 1_000_000) * pricing["input"] + (
-            output_tokens / 1_000_000
-        ) * pricing["output"]
-
-        call = APICall(
-            timestamp=datetime.now().isoformat(),
-            operation=operation,
-            model=model,
-            input_tokens=input_tokens,
-            output_tokens=output_tokens,
-            cost_usd=cost,
+        input_price, output_price = _PRICE_PER_TOKEN.get(
+            model, _DEFAULT_PRICE_PER_TOKEN
         )
+        cost = input_tokens * input_price + output_tokens * output_price
 
         with self._lock:
+            # Timestamp under the lock so self.calls stays in time order
+            now = datetime.now()
+            call = APICall(
+                timestamp=now.isoformat(),
+                timestamp_epoch=now.timestamp(),
+                operation=operation,
+                model=model,
+                input_tokens=input_tokens,
+                output_tokens=output_tokens,
+                cost_usd=cost,
+            )
             self.calls.append(call)
-            self._save()
+            self._totals.add(call)
+            if self.storage_path:
+                if self._writer is None:
+                    self._start_writer()
+                self._queue.put_nowait(call)
 
         logger.debug(
             f"API call: {operation} ({model}) - "
@@ -116,42 +182,60 @@ class CostTracker:
         Returns:
             CostSummary with aggregated data
         """
-        summary = CostSummary()
-
         with self._lock:
-            for call in self.calls:
-                # Filter by date if specified
-                if since:
-                    call_time = datetime.fromisoformat(call.timestamp)
-                    if call_time < since:
-                        continue
-
-                summary.total_calls += 1
-                summary.total_input_tokens += call.input_tokens
-                summary.total_output_tokens += call.output_tokens
-                summary.total_cost_usd += call.cost_usd
-
-                # By operation
-                summary.by_operation[call.operation] = (
-                    summary.by_operation.get(call.operation, 0) + call.cost_usd
+            if since is None:
+                return replace(
+                    self._totals,
+                    by_operation=dict(self._totals.by_operation),
+                    by_model=dict(self._totals.by_model),
                 )
 
-                # By model
-                summary.by_model[call.model] = (
-                    summary.by_model.get(call.model, 0) + call.cost_usd
-                )
+            # Calls are in time order: skip straight to the first one >= since
+            summary = CostSummary()
+            start = bisect_left(
+                self.calls, since.timestamp(), key=attrgetter("timestamp_epoch")
+            )
+            for call in self.calls[start:]:
+                summary.add(call)
 
         return summary
 
-    def _save(self) -> None:
-        """Save calls to storage."""
+    def flush(self) -> None:
+        """Block until every recorded call has been written to storage."""
+        self._queue.join()
+
+    def _start_writer(self) -> None:
+        """Start the background writer thread."""
+        self._writer = Thread(
+            target=self._write_loop, name="cost-tracker-writer", daemon=True
+        )
+        self._writer.start()
+        # The thread is a daemon; make sure queued calls reach disk on exit
+        atexit.register(self.flush)
+
+    def _write_loop(self) -> None:
+        """Append queued calls to storage, batching whatever has piled up."""
+        while True:
+            batch = [self._queue.get()]
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            self._append(batch)
+            for _ in batch:
+                self._queue.task_done()
+
+    def _append(self, calls: list[APICall]) -> None:
+        """Append calls to storage, one JSON line each."""
         if not self.storage_path:
             return
 
         try:
             self.storage_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.storage_path, "w") as f:
-                json.dump([asdict(c) for c in self.calls], f, indent=2)
+            with open(self.storage_path, "ab") as f:
+                f.write(b"".join(_encode_line(c) for c in calls))
         except Exception as e:
             logger.error(f"Failed to save cost data: {e}")
 
@@ -161,18 +245,58 @@ class CostTracker:
             return
 
         try:
-            with open(self.storage_path) as f:
-                data = json.load(f)
-            self.calls = [APICall(**c) for c in data]
+            with open(self.storage_path, "rb") as f:
+                calls = [_decode_line(line) for line in f if line.strip()]
         except Exception as e:
             logger.error(f"Failed to load cost data: {e}")
-            self.calls = []
+            calls = []
+
+        self.calls = sorted(calls, key=attrgetter("timestamp_epoch"))
+        self._totals = CostSummary()
+        for call in self.calls:
+            self._totals.add(call)
 
     def clear(self) -> None:
         """Clear all recorded calls."""
         with self._lock:
+            # Holding the lock stops new calls being queued while we drain
+            self.flush()
             self.calls.clear()
-            self._save()
+            self._totals = CostSummary()
+            if self.storage_path:
+                # Nothing left to persist; drop the file rather than rewrite it
+                try:
+                    self.storage_path.unlink(missing_ok=True)
+                except Exception as e:
+                    logger.error(f"Failed to clear cost data: {e}")
+
+
+def _migrate_legacy_history(legacy_path: Path, storage_path: Path) -> None:
+    """Move calls from a JSON array history file into the JSON Lines one.
+
+    Cost history used to be rewritten as one JSON array on every call. Its
+    calls are appended to storage_path, then the old file is renamed with a
+    ".migrated" suffix so it is only imported once.
+
+    Args:
+        legacy_path: JSON array file written by earlier versions
+        storage_path: JSON Lines file the tracker reads
+    """
+    if not legacy_path.exists():
+        return
+
+    try:
+        with open(legacy_path) as f:
+            calls = [APICall(**c) for c in json.load(f)]
+        storage_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(storage_path, "ab") as f:
+            f.write(b"".join(_encode_line(c) for c in calls))
+        legacy_path.rename(legacy_path.with_name(legacy_path.name + ".migrated"))
+    except Exception as e:
+        logger.error(f"Failed to migrate cost data from {legacy_path}: {e}")
+        return
+
+    logger.info(f"Migrated {len(calls)} API calls from {legacy_path}")
 
 
 # Global cost tracker instance
@@ -186,29 +310,31 @@ def get_cost_tracker() -> CostTracker:
         from rss_rag.config import get_config
 
         config = get_config()
-        storage_path = config.storage.lightrag_dir / "cost_history.json"
+        storage_path = config.storage.lightrag_dir / "cost_history.jsonl"
+        _migrate_legacy_history(storage_path.with_suffix(".json"), storage_path)
         _tracker = CostTracker(storage_path)
     return _tracker
 
 
 def format_cost_summary(summary: CostSummary) -> str:
     """Format cost summary for display."""
-    lines = [
-        "💰 API Cost Summary",
-        f"   Total calls: {summary.total_calls:,}",
-        f"   Input tokens: {summary.total_input_tokens:,}",
-        f"   Output tokens: {summary.total_output_tokens:,}",
-        f"   Total cost: ${summary.total_cost_usd:.4f}",
-    ]
+    return "\n".join(_cost_summary_lines(summary))
+
+
+def _cost_summary_lines(summary: CostSummary) -> Iterator[str]:
+    """Yield the display lines of a cost summary."""
+    yield "💰 API Cost Summary"
+    yield f"   Total calls: {summary.total_calls:,}"
+    yield f"   Input tokens: {summary.total_input_tokens:,}"
+    yield f"   Output tokens: {summary.total_output_tokens:,}"
+    yield f"   Total cost: ${summary.total_cost_usd:.4f}"
 
     if summary.by_operation:
-        lines.append("\n   By Operation:")
-        for op, cost in sorted(summary.by_operation.items()):
-            lines.append(f"     {op}: ${cost:.4f}")
+        yield "\n   By Operation:"
+        for op, cost in sorted(summary.by_operation.items(), key=itemgetter(0)):
+            yield f"     {op}: ${cost:.4f}"
 
     if summary.by_model:
-        lines.append("\n   By Model:")
-        for model, cost in sorted(summary.by_model.items()):
-            lines.append(f"     {model}: ${cost:.4f}")
-
-    return "\n".join(lines)
+        yield "\n   By Model:"
+        for model, cost in sorted(summary.by_model.items(), key=itemgetter(0)):
+            yield f"     {model}: ${cost:.4f}"
@@ -1,11 +1,19 @@
 """SQLite database for article metadata and state tracking."""
 
+import functools
+import json
+import os
 import sqlite3
+import threading
+import time
 from contextlib import contextmanager
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from sqlite3 import Connection, IntegrityError
-from typing import Iterator
+from sqlite3 import Connection, IntegrityError, Row
+from typing import Callable, Iterable, Iterator, TypeVar
+
+T = TypeVar("T")
 
 # SQL schema for database initialization
 SCHEMA = """
@@ -28,7 +36,8 @@ CREATE TABLE IF NOT EXISTS articles (
     pub_date TIMESTAMP,
     fetched_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     lightrag_id TEXT,
-    FOREIGN KEY (feed_id) REFERENCES feeds(id)
+    is_read INTEGER NOT NULL DEFAULT 0,
+    FOREIGN KEY (feed_id) REFERENCES feeds(id) ON DELETE CASCADE
 );
 
 CREATE TABLE IF NOT EXISTS reading_history (
@@ -37,15 +46,167 @@ CREATE TABLE IF NOT EXISTS reading_history (
     action TEXT NOT NULL,
     timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     read_duration INTEGER,
-    FOREIGN KEY (article_id) REFERENCES articles(id)
+    FOREIGN KEY (article_id) REFERENCES articles(id) ON DELETE CASCADE
 );
 
 CREATE INDEX IF NOT EXISTS idx_articles_feed_id ON articles(feed_id);
 CREATE INDEX IF NOT EXISTS idx_articles_link ON articles(link);
 CREATE INDEX IF NOT EXISTS idx_articles_pub_date ON articles(pub_date);
-CREATE INDEX IF NOT EXISTS idx_reading_history_article_id ON reading_history(article_id);
+
+-- Ingestion queue: articles not yet in LightRAG, newest first
+CREATE INDEX IF NOT EXISTS idx_articles_pending ON articles(pub_date)
+    WHERE lightrag_id IS NULL;
+-- Per-action history lookups, e.g. the is_read backfill
+CREATE INDEX IF NOT EXISTS idx_reading_history_action ON reading_history(action, article_id);
+-- Ingested-article count scans this instead of the whole table
+CREATE INDEX IF NOT EXISTS idx_articles_ingested ON articles(lightrag_id)
+    WHERE lightrag_id IS NOT NULL;
+-- Per-feed listing, already in pub_date order
+CREATE INDEX IF NOT EXISTS idx_articles_feed_pub_date ON articles(feed_id, pub_date DESC);
+-- Unread listings and read-ID lookups, newest first
+CREATE INDEX IF NOT EXISTS idx_articles_is_read ON articles(is_read, pub_date DESC);
+-- Per-article history, newest first; also serves the foreign key. Replaces
+-- the single-column index, which it makes redundant.
+DROP INDEX IF EXISTS idx_reading_history_article_id;
+CREATE INDEX IF NOT EXISTS idx_reading_history_article_time
+    ON reading_history(article_id, timestamp DESC);
+-- Whole-history listing, newest first
+CREATE INDEX IF NOT EXISTS idx_reading_history_timestamp ON reading_history(timestamp DESC);
+
+-- Keeps articles.is_read in step with the reading history
+CREATE TRIGGER IF NOT EXISTS trg_reading_history_mark_read
+AFTER INSERT ON reading_history WHEN NEW.action = 'read'
+BEGIN
+    UPDATE articles SET is_read = 1 WHERE id = NEW.article_id AND is_read = 0;
+END;
+"""
+
+# Stored in PRAGMA user_version once a database has the current SCHEMA and
+# migrations; bump it whenever either changes. Databases created before it
+# existed report 0.
+SCHEMA_VERSION = 1
+
+# Applied to every connection opened by get_connection. WAL lets readers (like
+# ingestion's open cursor) run alongside a writer, and with synchronous=NORMAL
+# avoids an fsync per commit. The mode persists in the file, so this converts
+# a database created without it once and is a no-op afterwards.
+CONNECTION_PRAGMAS = (
+    "PRAGMA foreign_keys = ON",  # needed for ON DELETE CASCADE
+    "PRAGMA busy_timeout = 5000",  # wait for a competing writer, don't fail
+    "PRAGMA journal_mode = WAL",  # after busy_timeout: converting needs a lock
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA mmap_size = 268435456",  # 256 MiB
+    "PRAGMA cache_size = -65536",  # 64 MiB
+)
+
+# Adds and backfills articles.is_read on databases created before it existed
+_IS_READ_MIGRATION = """
+ALTER TABLE articles ADD COLUMN is_read INTEGER NOT NULL DEFAULT 0;
+UPDATE articles SET is_read = 1
+    WHERE id IN (SELECT article_id FROM reading_history WHERE action = 'read');
 """
 
+# Rebuilds articles/reading_history created before their foreign keys were
+# declared ON DELETE CASCADE; SQLite cannot alter a constraint in place.
+_CASCADE_MIGRATION = """
+ALTER TABLE reading_history RENAME TO reading_history_old;
+ALTER TABLE articles RENAME TO articles_old;
+{schema}
+INSERT INTO articles SELECT * FROM articles_old;
+INSERT INTO reading_history SELECT * FROM reading_history_old;
+DROP TABLE reading_history_old;
+DROP TABLE articles_old;
+"""
+
+
+def _needs_is_read_migration(conn: Connection) -> bool:
+    """Check whether an existing articles table lacks the is_read column."""
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(articles)")}
+    return bool(columns) and "is_read" not in columns
+
+
+def _needs_cascade_migration(conn: Connection) -> bool:
+    """Check whether existing tables lack ON DELETE CASCADE foreign keys."""
+    for table in ("articles", "reading_history"):
+        for fk in conn.execute(f"PRAGMA foreign_key_list({table})"):
+            if fk[6] != "CASCADE":  # on_delete column
+                return True
+    return False
+
+
+def _has_table(conn: Connection, name: str) -> bool:
+    return (
+        conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (name,)
+        ).fetchone()
+        is not None
+    )
+
+
+def _schema_version(conn: Connection) -> int:
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def _run_script(conn: Connection, script: str) -> None:
+    """Run an SQL script statement by statement.
+
+    Unlike executescript, this doesn't commit first, so the script joins
+    the caller's transaction.
+    """
+    statement = ""
+    for line in script.splitlines(keepends=True):
+        statement += line
+        if sqlite3.complete_statement(statement):
+            conn.execute(statement)
+            statement = ""
+
+
+def _migrate_schema(conn: Connection, create: bool) -> None:
+    """Bring the schema up to SCHEMA_VERSION in one transaction.
+
+    Args:
+        conn: Autocommit connection, without foreign key enforcement (the
+            cascade rebuild copies rows table by table).
+        create: Create the schema in a database without an articles table;
+            otherwise such a database (not initialized yet, or another
+            SQLite file such as a cache) is left alone.
+    """
+    if _schema_version(conn) >= SCHEMA_VERSION:
+        return
+    if not create and not _has_table(conn, "articles"):
+        return
+
+    with transaction(conn):
+        # Another connection may have migrated while this one waited
+        if _schema_version(conn) >= SCHEMA_VERSION:
+            return
+        # Before the cascade rebuild, which copies rows with SELECT *
+        if _needs_is_read_migration(conn):
+            _run_script(conn, _IS_READ_MIGRATION)
+        if _needs_cascade_migration(conn):
+            _run_script(conn, _CASCADE_MIGRATION.format(schema=SCHEMA))
+        # Also recreates indexes dropped along with migrated tables
+        _run_script(conn, SCHEMA)
+        # Planner statistics, so the partial/covering indexes get used
+        conn.execute("ANALYZE")
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+
+def init_schema(conn: Connection) -> None:
+    """Migrate and create the schema on an open connection.
+
+    Lets an in-memory database, which has no path to pass to init_db, get
+    the same schema.
+
+    Args:
+        conn: Autocommit database connection.
+    """
+    _migrate_schema(conn, create=True)
+    # A full ANALYZE ran if the schema was just created or migrated; this
+    # refreshes only statistics that have drifted since
+    conn.execute("PRAGMA optimize")
+
 
 def init_db(db_path: Path) -> None:
     """Initialize the database with schema.
@@ -53,16 +214,77 @@ def init_db(db_path: Path) -> None:
     Args:
         db_path: Path to the SQLite database file.
     """
-    conn = sqlite3.connect(db_path)
+    conn = sqlite3.connect(db_path, isolation_level=None)
     try:
-        conn.executescript(SCHEMA)
-        conn.commit()
+        # Stored in the database file, so it only needs setting once
+        conn.execute("PRAGMA journal_mode = WAL")
+        init_schema(conn)
     finally:
         conn.close()
 
 
+# Prepared statements kept per connection (sqlite3 default: 128). The
+# chunked IN (...) and multi-row VALUES helpers produce several distinct
+# statement texts, which shouldn't push the fixed queries out.
+STATEMENT_CACHE_SIZE = 256
+
+# Seconds a cached aggregate may be served even when nothing has written
+QUERY_CACHE_TTL = 30.0
+
+
+class CachingConnection(Connection):
+    """Connection that keeps results of `cached_query` functions."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # {function name: (expires at, data version, result)}
+        self.query_cache: dict[str, tuple[float, tuple[int, int], object]] = {}
+
+
+def cached_query(func: Callable[[Connection], T]) -> Callable[[Connection], T]:
+    """Memoize a read-only query on the connection it runs against.
+
+    A result is reused until QUERY_CACHE_TTL expires or the database changes:
+    PRAGMA data_version moves when another connection commits, and
+    total_changes moves on this connection's own writes. The wrapped
+    function must return a list or dict; callers get a copy.
+    """
+
+    @functools.wraps(func)
+    def wrapper(conn: Connection) -> T:
+        cache = getattr(conn, "query_cache", None)
+        if cache is None:
+            return func(conn)
+
+        version = (
+            conn.execute("PRAGMA data_version").fetchone()[0],
+            conn.total_changes,
+        )
+        now = time.monotonic()
+        hit = cache.get(func.__name__)
+        if hit is not None and hit[0] > now and hit[1] == version:
+            return hit[2].copy()
+
+        result = func(conn)
+        cache[func.__name__] = (now + QUERY_CACHE_TTL, version, result)
+        return result.copy()
+
+    return wrapper
+
+
 def get_connection(db_path: Path) -> Connection:
-    """Get a connection to the database.
+    """Open a new connection to the database.
+
+    The connection runs in autocommit mode: each statement commits on its
+    own unless it runs inside a `transaction` block. A database created by
+    an older version is migrated to SCHEMA_VERSION first (a no-op once its
+    user_version is current), then CONNECTION_PRAGMAS are applied. The
+    connection can hold `cached_query` results.
+
+    Callers own (and must close) the connection; most code should borrow a
+    pooled one from pooled_connection instead. Open one directly only when
+    it must not be shared, like ingestion's reader, whose cursor stays open
+    across the writes made through the pool.
 
     Args:
         db_path: Path to the SQLite database file.
@@ -70,11 +292,33 @@ def get_connection(db_path: Path) -> Connection:
     Returns:
         SQLite connection with row factory set.
     """
-    conn = sqlite3.connect(db_path)
+    conn = sqlite3.connect(
+        db_path,
+        isolation_level=None,
+        factory=CachingConnection,
+        cached_statements=STATEMENT_CACHE_SIZE,
+    )
     conn.row_factory = sqlite3.Row
+    # Before foreign_keys = ON, which a migration must run without
+    _migrate_schema(conn, create=False)
+    for pragma in CONNECTION_PRAGMAS:
+        conn.execute(pragma)
     return conn
 
 
+# Per-thread pool of open connections: {resolved path: (conn, file identity)}
+_pool = threading.local()
+
+
+def _file_identity(path: str) -> tuple[int, int] | None:
+    """Return (device, inode) of a file, or None if it doesn't exist."""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return st.st_dev, st.st_ino
+
+
 @contextmanager
 def get_db_connection(db_path: Path) -> Iterator[Connection]:
     """Context manager for database connections.
@@ -92,6 +336,77 @@ def get_db_connection(db_path: Path) -> Iterator[Connection]:
         conn.close()
 
 
+@contextmanager
+def pooled_connection(db_path: Path) -> Iterator[Connection]:
+    """Context manager borrowing a pooled connection.
+
+    Unlike get_db_connection, connections are opened once per thread and
+    database file, then reused by later calls instead of reconnecting and
+    re-applying pragmas. They stay open on exit until close_all_connections;
+    a pooled connection is replaced if its file has been deleted or
+    recreated since it was opened (checked with a stat on every borrow).
+
+    Args:
+        db_path: Path to the SQLite database file.
+
+    Yields:
+        SQLite connection owned by the pool (do not close it).
+    """
+    conns = _pool.__dict__.setdefault("conns", {})
+    key = str(Path(db_path).resolve())
+
+    entry = conns.get(key)
+    if entry is not None and entry[1] == _file_identity(key):
+        conn = entry[0]
+    else:
+        if entry is not None:
+            entry[0].close()
+        conn = get_connection(db_path)
+        conns[key] = (conn, _file_identity(key))
+
+    yield conn
+
+
+def close_all_connections() -> None:
+    """Close every pooled connection opened by the current thread."""
+    conns = _pool.__dict__.pop("conns", {})
+    for conn, _ in conns.values():
+        conn.close()
+
+
+@contextmanager
+def transaction(conn: Connection) -> Iterator[Connection]:
+    """Context manager grouping statements into a single transaction.
+
+    The outermost block runs as BEGIN IMMEDIATE ... COMMIT; nested blocks
+    use a savepoint, so only the outermost block commits. Any exception
+    rolls the block back and is re-raised.
+
+    Args:
+        conn: Database connection from get_connection.
+
+    Yields:
+        The same connection.
+    """
+    if conn.in_transaction:
+        conn.execute("SAVEPOINT rss_rag_tx")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK TO rss_rag_tx")
+            conn.execute("RELEASE rss_rag_tx")
+            raise
+        conn.execute("RELEASE rss_rag_tx")
+    else:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+
 # ============================================================================
 # Feed CRUD Operations
 # ============================================================================
@@ -108,22 +423,25 @@ def add_feed(conn: Connection, url: str, title: str | None = None) -> int:
     Returns:
         The feed ID (existing or newly created).
     """
-    try:
-        cursor = conn.execute(
-            "INSERT INTO feeds (url, title) VALUES (?, ?)",
-            (url, title),
-        )
-        conn.commit()
-        return cursor.lastrowid  # type: ignore
-    except IntegrityError:
-        # Feed already exists, return existing ID
-        existing = get_feed_by_url(conn, url)
-        if existing:
-            return existing["id"]
-        raise
+    # DO NOTHING leaves an existing feed (and its title) unwritten, so
+    # conn.total_changes only moves when a feed is actually added; RETURNING
+    # yields no row then and the existing ID is looked up instead.
+    cursor = conn.execute(
+        """
+        INSERT INTO feeds (url, title) VALUES (?, ?)
+        ON CONFLICT(url) DO NOTHING
+        RETURNING id
+        """,
+        (url, title),
+    )
+    row = cursor.fetchone()
+    cursor.close()
+    if row is None:
+        row = conn.execute("SELECT id FROM feeds WHERE url = ?", (url,)).fetchone()
+    return row[0]
 
 
-def get_feed(conn: Connection, feed_id: int) -> dict | None:
+def get_feed(conn: Connection, feed_id: int) -> Row | None:
     """Get a feed by ID.
 
     Args:
@@ -131,14 +449,13 @@ def get_feed(conn: Connection, feed_id: int) -> dict | None:
         feed_id: Feed ID.
 
     Returns:
-        Feed data as dict, or None if not found.
+        Feed row, or None if not found.
     """
     cursor = conn.execute("SELECT * FROM feeds WHERE id = ?", (feed_id,))
-    row = cursor.fetchone()
-    return dict(row) if row else None
+    return cursor.fetchone()
 
 
-def get_feed_by_url(conn: Connection, url: str) -> dict | None:
+def get_feed_by_url(conn: Connection, url: str) -> Row | None:
     """Get a feed by URL.
 
     Args:
@@ -146,14 +463,13 @@ def get_feed_by_url(conn: Connection, url: str) -> dict | None:
         url: Feed URL.
 
     Returns:
-        Feed data as dict, or None if not found.
+        Feed row, or None if not found.
     """
     cursor = conn.execute("SELECT * FROM feeds WHERE url = ?", (url,))
-    row = cursor.fetchone()
-    return dict(row) if row else None
+    return cursor.fetchone()
 
 
-def get_all_feeds(conn: Connection, active_only: bool = True) -> list[dict]:
+def get_all_feeds(conn: Connection, active_only: bool = True) -> list[Row]:
     """Get all feeds.
 
     Args:
@@ -161,13 +477,13 @@ def get_all_feeds(conn: Connection, active_only: bool = True) -> list[dict]:
         active_only: If True, only return active feeds.
 
     Returns:
-        List of feed dicts.
+        List of feed rows, indexable by column name like a dict.
     """
     if active_only:
         cursor = conn.execute("SELECT * FROM feeds WHERE active = 1")
     else:
         cursor = conn.execute("SELECT * FROM feeds")
-    return [dict(row) for row in cursor.fetchall()]
+    return cursor.fetchall()
 
 
 def update_feed_last_fetched(conn: Connection, feed_id: int) -> None:
@@ -181,7 +497,6 @@ def update_feed_last_fetched(conn: Connection, feed_id: int) -> None:
         "UPDATE feeds SET last_fetched = CURRENT_TIMESTAMP WHERE id = ?",
         (feed_id,),
     )
-    conn.commit()
 
 
 def update_feed_title(conn: Connection, feed_id: int, title: str) -> None:
@@ -196,7 +511,6 @@ def update_feed_title(conn: Connection, feed_id: int, title: str) -> None:
         "UPDATE feeds SET title = ? WHERE id = ?",
         (title, feed_id),
     )
-    conn.commit()
 
 
 def deactivate_feed(conn: Connection, feed_id: int) -> None:
@@ -207,7 +521,6 @@ def deactivate_feed(conn: Connection, feed_id: int) -> None:
         feed_id: Feed ID.
     """
     conn.execute("UPDATE feeds SET active = 0 WHERE id = ?", (feed_id,))
-    conn.commit()
 
 
 def activate_feed(conn: Connection, feed_id: int) -> None:
@@ -218,29 +531,30 @@ def activate_feed(conn: Connection, feed_id: int) -> None:
         feed_id: Feed ID.
     """
     conn.execute("UPDATE feeds SET active = 1 WHERE id = ?", (feed_id,))
-    conn.commit()
 
 
 def delete_feed(conn: Connection, feed_id: int) -> None:
     """Delete a feed and its articles.
 
+    The children are deleted explicitly, child first, rather than left to
+    the ON DELETE CASCADE foreign keys: a connection that skipped the
+    migration (not opened by get_connection) may still have the original
+    constraints, which would reject the feed's deletion.
+
     Args:
         conn: Database connection.
         feed_id: Feed ID.
     """
-    # First delete reading history for articles from this feed
-    conn.execute(
-        """
-        DELETE FROM reading_history 
-        WHERE article_id IN (SELECT id FROM articles WHERE feed_id = ?)
-        """,
-        (feed_id,),
-    )
-    # Then delete articles
-    conn.execute("DELETE FROM articles WHERE feed_id = ?", (feed_id,))
-    # Finally delete the feed
-    conn.execute("DELETE FROM feeds WHERE id = ?", (feed_id,))
-    conn.commit()
+    with transaction(conn):
+        conn.execute(
+            """
+            DELETE FROM reading_history
+            WHERE article_id IN (SELECT id FROM articles WHERE feed_id = ?)
+            """,
+            (feed_id,),
+        )
+        conn.execute("DELETE FROM articles WHERE feed_id = ?", (feed_id,))
+        conn.execute("DELETE FROM feeds WHERE id = ?", (feed_id,))
 
 
 # ============================================================================
@@ -277,14 +591,59 @@ def add_article(
             """,
             (feed_id, title, content, link, pub_date),
         )
-        conn.commit()
         return cursor.lastrowid
     except IntegrityError:
         # Article with this link already exists
         return None
 
 
-def get_article(conn: Connection, article_id: int) -> dict | None:
+# Rows per multi-VALUES insert: 5 columns each keeps a statement well under
+# SQLite's historical limit of 999 bound parameters
+ARTICLE_INSERT_CHUNK = 100
+
+_INSERT_ARTICLE_SQL = (
+    "INSERT OR IGNORE INTO articles (feed_id, title, content, link, pub_date) "
+    "VALUES (?, ?, ?, ?, ?)"
+)
+_INSERT_ARTICLE_CHUNK_SQL = _INSERT_ARTICLE_SQL + ", (?, ?, ?, ?, ?)" * (
+    ARTICLE_INSERT_CHUNK - 1
+)
+
+
+def bulk_insert_articles(
+    conn: Connection,
+    rows: Iterable[tuple[int, str, str | None, str, datetime | None]],
+) -> int:
+    """Insert many articles using multi-row INSERT statements.
+
+    Full chunks of ARTICLE_INSERT_CHUNK rows go in one statement each; the
+    remainder is inserted row by row with executemany. Either way the SQL
+    text is fixed, so both statements stay in the connection's statement
+    cache. Articles whose link already exists are skipped.
+
+    Args:
+        conn: Database connection.
+        rows: (feed_id, title, content, link, pub_date) tuples.
+
+    Returns:
+        Number of articles actually inserted.
+    """
+    rows = iter(rows)
+    inserted = 0
+    with transaction(conn):
+        while chunk := list(islice(rows, ARTICLE_INSERT_CHUNK)):
+            if len(chunk) == ARTICLE_INSERT_CHUNK:
+                cursor = conn.execute(
+                    _INSERT_ARTICLE_CHUNK_SQL,
+                    [value for row in chunk for value in row],
+                )
+            else:
+                cursor = conn.executemany(_INSERT_ARTICLE_SQL, chunk)
+            inserted += cursor.rowcount
+    return inserted
+
+
+def get_article(conn: Connection, article_id: int) -> Row | None:
     """Get an article by ID.
 
     Args:
@@ -292,14 +651,37 @@ def get_article(conn: Connection, article_id: int) -> dict | None:
         article_id: Article ID.
 
     Returns:
-        Article data as dict, or None if not found.
+        Article row, or None if not found.
     """
     cursor = conn.execute("SELECT * FROM articles WHERE id = ?", (article_id,))
-    row = cursor.fetchone()
-    return dict(row) if row else None
+    return cursor.fetchone()
+
+
+def get_article_titles(conn: Connection, article_ids: list[int]) -> list[Row]:
+    """Get the titles of several articles in one query.
+
+    Args:
+        conn: Database connection.
+        article_ids: Article IDs; unknown IDs are ignored.
 
+    Returns:
+        (id, title) rows in ascending ID order.
+    """
+    if not article_ids:
+        return []
+    # IDs travel as one JSON array, so the SQL text is the same for any count
+    cursor = conn.execute(
+        """
+        SELECT id, title FROM articles
+        WHERE id IN (SELECT value FROM json_each(?))
+        ORDER BY id
+        """,
+        (json.dumps(article_ids),),
+    )
+    return cursor.fetchall()
 
-def get_article_by_link(conn: Connection, link: str) -> dict | None:
+
+def get_article_by_link(conn: Connection, link: str) -> Row | None:
     """Get an article by its link.
 
     Args:
@@ -307,37 +689,51 @@ def get_article_by_link(conn: Connection, link: str) -> dict | None:
         link: Article URL.
 
     Returns:
-        Article data as dict, or None if not found.
+        Article row, or None if not found.
     """
     cursor = conn.execute("SELECT * FROM articles WHERE link = ?", (link,))
-    row = cursor.fetchone()
-    return dict(row) if row else None
+    return cursor.fetchone()
 
 
-def get_articles_by_feed(conn: Connection, feed_id: int, limit: int = 50) -> list[dict]:
-    """Get articles for a specific feed.
+def iter_articles_by_feed(
+    conn: Connection, feed_id: int, limit: int | None = None
+) -> Iterator[Row]:
+    """Iterate over the articles of a feed as SQLite produces them.
 
     Args:
         conn: Database connection.
         feed_id: Feed ID.
-        limit: Maximum number of articles to return.
+        limit: Maximum number of articles, or None for all.
 
     Returns:
-        List of article dicts, ordered by pub_date descending.
+        Cursor yielding article rows, ordered by pub_date descending.
     """
-    cursor = conn.execute(
+    return conn.execute(
         """
         SELECT * FROM articles 
         WHERE feed_id = ? 
         ORDER BY pub_date DESC 
         LIMIT ?
         """,
-        (feed_id, limit),
+        (feed_id, -1 if limit is None else limit),
     )
-    return [dict(row) for row in cursor.fetchall()]
 
 
-def get_unread_articles(conn: Connection, limit: int = 50) -> list[dict]:
+def get_articles_by_feed(conn: Connection, feed_id: int, limit: int = 50) -> list[Row]:
+    """Get articles for a specific feed.
+
+    Args:
+        conn: Database connection.
+        feed_id: Feed ID.
+        limit: Maximum number of articles to return.
+
+    Returns:
+        List of article rows, ordered by pub_date descending.
+    """
+    return list(iter_articles_by_feed(conn, feed_id, limit))
+
+
+def get_unread_articles(conn: Connection, limit: int = 50) -> list[Row]:
     """Get articles that haven't been read.
 
     Args:
@@ -345,41 +741,77 @@ def get_unread_articles(conn: Connection, limit: int = 50) -> list[dict]:
         limit: Maximum number of articles to return.
 
     Returns:
-        List of unread article dicts, ordered by pub_date descending.
+        List of unread article rows, ordered by pub_date descending.
     """
     cursor = conn.execute(
         """
-        SELECT a.* FROM articles a
-        LEFT JOIN reading_history rh ON a.id = rh.article_id AND rh.action = 'read'
-        WHERE rh.id IS NULL
-        ORDER BY a.pub_date DESC
+        SELECT * FROM articles
+        WHERE is_read = 0
+        ORDER BY pub_date DESC
         LIMIT ?
         """,
         (limit,),
     )
-    return [dict(row) for row in cursor.fetchall()]
+    return cursor.fetchall()
 
 
-def get_recent_articles(conn: Connection, limit: int = 50) -> list[dict]:
-    """Get most recent articles across all feeds.
+def get_unread_article_summaries(conn: Connection, limit: int = 50) -> list[Row]:
+    """Get id, title, link and pub_date of unread articles.
+
+    Lighter than get_unread_articles for list views: article content,
+    which can be a full HTML page, is never read.
 
     Args:
         conn: Database connection.
         limit: Maximum number of articles to return.
 
     Returns:
-        List of article dicts, ordered by pub_date descending.
+        List of summary rows, ordered by pub_date descending.
     """
     cursor = conn.execute(
+        """
+        SELECT id, title, link, pub_date FROM articles
+        WHERE is_read = 0
+        ORDER BY pub_date DESC
+        LIMIT ?
+        """,
+        (limit,),
+    )
+    return cursor.fetchall()
+
+
+def iter_recent_articles(conn: Connection, limit: int | None = None) -> Iterator[Row]:
+    """Iterate over articles across all feeds, newest first.
+
+    Args:
+        conn: Database connection.
+        limit: Maximum number of articles, or None for all.
+
+    Returns:
+        Cursor yielding article rows with feed_title.
+    """
+    return conn.execute(
         """
         SELECT a.*, f.title as feed_title FROM articles a
         JOIN feeds f ON a.feed_id = f.id
         ORDER BY a.pub_date DESC
         LIMIT ?
         """,
-        (limit,),
+        (-1 if limit is None else limit,),
     )
-    return [dict(row) for row in cursor.fetchall()]
+
+
+def get_recent_articles(conn: Connection, limit: int = 50) -> list[Row]:
+    """Get most recent articles across all feeds.
+
+    Args:
+        conn: Database connection.
+        limit: Maximum number of articles to return.
+
+    Returns:
+        List of article rows, ordered by pub_date descending.
+    """
+    return list(iter_recent_articles(conn, limit))
 
 
 def update_article_lightrag_id(
@@ -396,7 +828,25 @@ def update_article_lightrag_id(
         "UPDATE articles SET lightrag_id = ? WHERE id = ?",
         (lightrag_id, article_id),
     )
-    conn.commit()
+
+
+def update_article_lightrag_ids(
+    conn: Connection, rows: Iterable[tuple[str, int]]
+) -> int:
+    """Update the LightRAG IDs of several articles in one transaction.
+
+    Args:
+        conn: Database connection.
+        rows: (lightrag_id, article_id) tuples.
+
+    Returns:
+        Number of articles updated.
+    """
+    with transaction(conn):
+        cursor = conn.executemany(
+            "UPDATE articles SET lightrag_id = ? WHERE id = ?", rows
+        )
+    return cursor.rowcount
 
 
 def article_exists(conn: Connection, link: str) -> bool:
@@ -413,7 +863,32 @@ def article_exists(conn: Connection, link: str) -> bool:
     return cursor.fetchone() is not None
 
 
-def get_articles_without_lightrag_id(conn: Connection, limit: int = 100) -> list[dict]:
+# Links per json_each probe, bounding the size of one JSON parameter
+LINK_LOOKUP_CHUNK = 500
+
+
+def get_existing_links(conn: Connection, links: Iterable[str]) -> set[str]:
+    """Return which of the given links are already stored.
+
+    Args:
+        conn: Database connection.
+        links: Article URLs.
+
+    Returns:
+        Subset of links that have an article.
+    """
+    links = iter(links)
+    existing = set()
+    while chunk := list(islice(links, LINK_LOOKUP_CHUNK)):
+        cursor = conn.execute(
+            "SELECT link FROM articles WHERE link IN (SELECT value FROM json_each(?))",
+            (json.dumps(chunk),),
+        )
+        existing.update(row[0] for row in cursor)
+    return existing
+
+
+def get_articles_without_lightrag_id(conn: Connection, limit: int = 100) -> list[Row]:
     """Get articles that haven't been indexed in LightRAG.
 
     Args:
@@ -421,7 +896,7 @@ def get_articles_without_lightrag_id(conn: Connection, limit: int = 100) -> list
         limit: Maximum number of articles to return.
 
     Returns:
-        List of article dicts without lightrag_id.
+        List of article rows without lightrag_id.
     """
     cursor = conn.execute(
         """
@@ -432,7 +907,7 @@ def get_articles_without_lightrag_id(conn: Connection, limit: int = 100) -> list
         """,
         (limit,),
     )
-    return [dict(row) for row in cursor.fetchall()]
+    return cursor.fetchall()
 
 
 # ============================================================================
@@ -464,11 +939,34 @@ def add_reading_history(
         """,
         (article_id, action, read_duration),
     )
-    conn.commit()
     return cursor.lastrowid  # type: ignore
 
 
-def get_reading_history(conn: Connection, article_id: int) -> list[dict]:
+def add_reading_history_batch(
+    conn: Connection,
+    rows: Iterable[tuple[int, str, int | None]],
+) -> int:
+    """Add several reading history entries in one transaction.
+
+    Args:
+        conn: Database connection.
+        rows: (article_id, action, read_duration) tuples.
+
+    Returns:
+        Number of entries added.
+    """
+    with transaction(conn):
+        cursor = conn.executemany(
+            """
+            INSERT INTO reading_history (article_id, action, read_duration)
+            VALUES (?, ?, ?)
+            """,
+            rows,
+        )
+    return cursor.rowcount
+
+
+def get_reading_history(conn: Connection, article_id: int) -> list[Row]:
     """Get reading history for an article.
 
     Args:
@@ -486,9 +984,10 @@ def get_reading_history(conn: Connection, article_id: int) -> list[dict]:
         """,
         (article_id,),
     )
-    return [dict(row) for row in cursor.fetchall()]
+    return cursor.fetchall()
 
 
+@cached_query
 def get_read_article_ids(conn: Connection) -> list[int]:
     """Get IDs of all articles that have been read.
 
@@ -498,26 +997,23 @@ def get_read_article_ids(conn: Connection) -> list[int]:
     Returns:
         List of article IDs that have been read.
     """
-    cursor = conn.execute(
-        """
-        SELECT DISTINCT article_id FROM reading_history 
-        WHERE action = 'read'
-        """
-    )
-    return [row["article_id"] for row in cursor.fetchall()]
+    cursor = conn.execute("SELECT id FROM articles WHERE is_read = 1")
+    return [row["id"] for row in cursor.fetchall()]
 
 
-def get_all_reading_history(conn: Connection, limit: int = 100) -> list[dict]:
-    """Get all reading history entries.
+def iter_all_reading_history(
+    conn: Connection, limit: int | None = None
+) -> Iterator[Row]:
+    """Iterate over reading history entries, newest first.
 
     Args:
         conn: Database connection.
-        limit: Maximum number of entries to return.
+        limit: Maximum number of entries, or None for all.
 
     Returns:
-        List of reading history entries with article info.
+        Cursor yielding history rows with article_title and article_link.
     """
-    cursor = conn.execute(
+    return conn.execute(
         """
         SELECT rh.*, a.title as article_title, a.link as article_link
         FROM reading_history rh
@@ -525,9 +1021,21 @@ def get_all_reading_history(conn: Connection, limit: int = 100) -> list[dict]:
         ORDER BY rh.timestamp DESC
         LIMIT ?
         """,
-        (limit,),
+        (-1 if limit is None else limit,),
     )
-    return [dict(row) for row in cursor.fetchall()]
+
+
+def get_all_reading_history(conn: Connection, limit: int = 100) -> list[Row]:
+    """Get all reading history entries.
+
+    Args:
+        conn: Database connection.
+        limit: Maximum number of entries to return.
+
+    Returns:
+        List of reading history entries with article info.
+    """
+    return list(iter_all_reading_history(conn, limit))
 
 
 # ============================================================================
@@ -535,6 +1043,7 @@ def get_all_reading_history(conn: Connection, limit: int = 100) -> list[dict]:
 # ============================================================================
 
 
+@cached_query
 def get_stats(conn: Connection) -> dict:
     """Get database statistics.
 
@@ -544,29 +1053,19 @@ def get_stats(conn: Connection) -> dict:
     Returns:
         Dict with various statistics.
     """
-    stats = {}
-
-    # Feed stats
-    cursor = conn.execute("SELECT COUNT(*) as count FROM feeds WHERE active = 1")
-    stats["active_feeds"] = cursor.fetchone()["count"]
-
-    cursor = conn.execute("SELECT COUNT(*) as count FROM feeds")
-    stats["total_feeds"] = cursor.fetchone()["count"]
-
-    # Article stats
-    cursor = conn.execute("SELECT COUNT(*) as count FROM articles")
-    stats["total_articles"] = cursor.fetchone()["count"]
-
-    cursor = conn.execute(
-        "SELECT COUNT(*) as count FROM articles WHERE lightrag_id IS NOT NULL"
-    )
-    stats["indexed_articles"] = cursor.fetchone()["count"]
-
-    # Reading stats
-    cursor = conn.execute(
-        "SELECT COUNT(DISTINCT article_id) as count FROM reading_history WHERE action = 'read'"
-    )
-    stats["read_articles"] = cursor.fetchone()["count"]
+    # One round-trip; each scalar subquery still gets its own index-only plan
+    row = conn.execute(
+        """
+        SELECT
+            (SELECT COUNT(*) FROM feeds WHERE active = 1) AS active_feeds,
+            (SELECT COUNT(*) FROM feeds) AS total_feeds,
+            (SELECT COUNT(*) FROM articles) AS total_articles,
+            (SELECT COUNT(*) FROM articles WHERE lightrag_id IS NOT NULL)
+                AS indexed_articles,
+            (SELECT COUNT(*) FROM articles WHERE is_read = 1) AS read_articles
+        """
+    ).fetchone()
+    stats = dict(row)
 
     # Unread count
     stats["unread_articles"] = stats["total_articles"] - stats["read_articles"]
@@ -2,20 +2,20 @@
 
 from __future__ import annotations
 
-import asyncio
 import logging
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Literal
 
+from rss_rag.background_loop import run_sync
 from rss_rag.config import get_config
 from rss_rag.database import (
-    get_connection,
     get_read_article_ids,
-    get_article,
-    get_unread_articles,
+    get_article_titles,
+    get_unread_article_summaries,
+    pooled_connection,
 )
-from rss_rag.ingestion import get_lightrag_instance
+from rss_rag.ingestion import get_lightrag_instance_async
 from rss_rag.llm import get_discovery_llm
 
 logger = logging.getLogger(__name__)
@@ -47,8 +47,7 @@ async def analyze_reading_patterns_async(db_path: Path) -> str | None:
     Returns:
         Summary of reading patterns, or None if insufficient data
     """
-    conn = get_connection(db_path)
-    try:
+    with pooled_connection(db_path) as conn:
         read_ids = get_read_article_ids(conn)
 
         if len(read_ids) < 3:
@@ -56,20 +55,16 @@ async def analyze_reading_patterns_async(db_path: Path) -> str | None:
             return None
 
         # Get read articles
-        read_articles = []
-        for article_id in read_ids[:20]:  # Limit to recent 20
-            article = get_article(conn, article_id)
-            if article:
-                read_articles.append(article)
+        read_articles = get_article_titles(conn, read_ids[:20])  # Limit to 20
 
-        if not read_articles:
-            return None
+    if not read_articles:
+        return None
 
-        # Build content summary for LLM analysis
-        articles_text = "\n".join([f"- {a['title']}" for a in read_articles])
+    # Build content summary for LLM analysis
+    articles_text = "\n".join([f"- {a['title']}" for a in read_articles])
 
-        llm = get_discovery_llm()
-        prompt = f"""Analyze the following list of articles that a user has read and identify their interests and reading patterns. Be concise.
+    llm = get_discovery_llm()
+    prompt = f"""Analyze the following list of articles that a user has read and identify their interests and reading patterns. Be concise.
 
 Read articles:
 {articles_text}
@@ -79,11 +74,8 @@ Identify:
 2. Any patterns (e.g., technical depth, news vs tutorials)
 3. Potential related topics they might enjoy"""
 
-        result = await llm.ainvoke(prompt)
-        return result.content
-
-    finally:
-        conn.close()
+    result = await llm.ainvoke(prompt)
+    return result.content
 
 
 async def discover_articles_async(
@@ -103,13 +95,9 @@ async def discover_articles_async(
         # Analyze reading patterns
         patterns = await analyze_reading_patterns_async(db_path)
 
-        conn = get_connection(db_path)
-        try:
+        with pooled_connection(db_path) as conn:
             # Get unread articles
-            unread = get_unread_articles(conn, limit=50)
-            read_ids = set(get_read_article_ids(conn))
-        finally:
-            conn.close()
+            unread = get_unread_article_summaries(conn, limit=50)
 
         if not unread:
             return DiscoveryResult(
@@ -122,7 +110,7 @@ async def discover_articles_async(
 
         if patterns:
             try:
-                rag = get_lightrag_instance()
+                rag = await get_lightrag_instance_async()
 
                 # Query based on reading patterns
                 query = f"Find articles related to these interests: {patterns[:500]}"
@@ -203,7 +191,7 @@ def discover_articles(
     limit: int = 5,
 ) -> DiscoveryResult:
     """Sync wrapper for discover_articles_async."""
-    return asyncio.run(discover_articles_async(db_path, limit))
+    return run_sync(discover_articles_async(db_path, limit))
 
 
 def format_discovery_result(result: DiscoveryResult) -> str:
@@ -0,0 +1,171 @@
+"""Two-level cache for the embeddings LightRAG requests during ingestion."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+from collections import OrderedDict
+from pathlib import Path
+from sqlite3 import Connection
+from typing import Awaitable, Callable
+
+import numpy as np
+
+from rss_rag.database import pooled_connection, transaction
+
+logger = logging.getLogger(__name__)
+
+# Vectors kept in memory in front of the SQLite table
+EMBEDDING_CACHE_SIZE = 10_000
+
+# Hashes looked up per SELECT, well under SQLite's host parameter limit
+_LOOKUP_CHUNK = 500
+
+EMBEDDING_CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS embedding_cache (
+    hash BLOB PRIMARY KEY,
+    model TEXT NOT NULL,
+    vec BLOB NOT NULL
+) WITHOUT ROWID;
+"""
+
+EmbedFunc = Callable[..., Awaitable[np.ndarray]]
+
+
+class EmbeddingCache:
+    """LRU (in memory) and SQLite (on disk) cache of embedding vectors.
+
+    Vectors are keyed by a hash of the model name and the text, so re-runs
+    and boilerplate shared between articles are embedded only once, and two
+    models never share an entry.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        model: str,
+        max_entries: int = EMBEDDING_CACHE_SIZE,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            db_path: SQLite file holding the persistent cache.
+            model: Embedding model name, part of every key.
+            max_entries: Vectors kept in the in-memory LRU.
+        """
+        self.db_path = Path(db_path)
+        self.model = model
+        self.max_entries = max_entries
+        self._lru: OrderedDict[bytes, np.ndarray] = OrderedDict()
+        self._schema_ready = False
+
+    def _get_conn(self) -> Connection:
+        # Borrowed from the per-thread pool: a sqlite3 connection only works
+        # on the thread that opened it
+        if not self._schema_ready:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with pooled_connection(self.db_path) as conn:
+            if not self._schema_ready:
+                conn.executescript(EMBEDDING_CACHE_SCHEMA)
+                self._schema_ready = True
+            return conn
+
+    def _key(self, text: str) -> bytes:
+        return hashlib.blake2b(
+            f"{self.model}\0{text}".encode(), digest_size=32
+        ).digest()
+
+    def _remember(self, key: bytes, vector: np.ndarray) -> None:
+        self._lru[key] = vector
+        self._lru.move_to_end(key)
+        if len(self._lru) > self.max_entries:
+            self._lru.popitem(last=False)
+
+    def get_many(self, keys: list[bytes]) -> dict[bytes, np.ndarray]:
+        """Look up vectors, first in memory and then on disk.
+
+        Args:
+            keys: Cache keys.
+
+        Returns:
+            Vectors found, by key.
+        """
+        found = {}
+        missing = []
+        for key in keys:
+            vector = self._lru.get(key)
+            if vector is not None:
+                self._lru.move_to_end(key)
+                found[key] = vector
+            else:
+                missing.append(key)
+
+        conn = self._get_conn() if missing else None
+        for start in range(0, len(missing), _LOOKUP_CHUNK):
+            chunk = missing[start : start + _LOOKUP_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            rows = conn.execute(
+                f"SELECT hash, vec FROM embedding_cache WHERE hash IN ({placeholders})",
+                chunk,
+            )
+            for key, blob in rows:
+                vector = np.frombuffer(blob, dtype=np.float32)
+                self._remember(key, vector)
+                found[key] = vector
+        return found
+
+    def put_many(self, keys: list[bytes], vectors: np.ndarray) -> None:
+        """Store vectors in memory and on disk.
+
+        Args:
+            keys: Cache keys.
+            vectors: One vector per key.
+        """
+        vectors = np.asarray(vectors, dtype=np.float32)
+        for key, vector in zip(keys, vectors):
+            self._remember(key, vector)
+        conn = self._get_conn()
+        with transaction(conn):
+            conn.executemany(
+                "INSERT OR REPLACE INTO embedding_cache (hash, model, vec) "
+                "VALUES (?, ?, ?)",
+                [(key, self.model, v.tobytes()) for key, v in zip(keys, vectors)],
+            )
+
+    def wrap(self, func: EmbedFunc, dim: int = 0) -> EmbedFunc:
+        """Wrap an async embedding function so only cache misses reach it.
+
+        Args:
+            func: Async function taking a list of texts and returning one
+                vector per text.
+            dim: Vector dimension, giving the shape of the empty array
+                returned for no texts.
+
+        Returns:
+            Async function with the same signature.
+        """
+
+        async def cached_embed(texts: list[str], *args, **kwargs) -> np.ndarray:
+            # np.vstack raises on an empty list
+            if not texts:
+                return np.empty((0, dim), dtype=np.float32)
+
+            keys = [self._key(text) for text in texts]
+            found = self.get_many(keys)
+
+            # Embed each distinct missing text once
+            pending = {}
+            for key, text in zip(keys, texts):
+                if key not in found:
+                    pending.setdefault(key, text)
+            if pending:
+                vectors = await func(list(pending.values()), *args, **kwargs)
+                self.put_many(list(pending), vectors)
+                found.update(zip(pending, np.asarray(vectors, dtype=np.float32)))
+
+            logger.debug(
+                "Embedding cache: %d texts, %d embedded", len(texts), len(pending)
+            )
+            return np.vstack([found[key] for key in keys])
+
+        return cached_embed
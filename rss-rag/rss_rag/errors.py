@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import importlib
+from functools import lru_cache
+
 
 class RSSRAGError(Exception):
     """Base exception for RSS-RAG."""
@@ -51,6 +54,50 @@ class EmbeddingError(RSSRAGError):
     pass
 
 
+# HTTP statuses worth retrying: rate limited, service unavailable
+RETRYABLE_STATUS_CODES = frozenset({429, 503})
+# Message fragments checked only for exceptions from unrecognized clients
+_RETRYABLE_MARKERS = ("rate limit", "timeout", "503", "429")
+
+
+@lru_cache(maxsize=1)
+def _api_exception_types() -> tuple[tuple[type, ...], tuple[type, ...]]:
+    """Return (retryable, known) exception types of the installed API clients.
+
+    Clients are imported lazily and skipped if missing.
+    """
+    retryable: list[type] = [TimeoutError]
+    known: list[type] = []
+    try:
+        import httpx
+
+        retryable.append(httpx.TimeoutException)
+        known.append(httpx.HTTPError)
+    except ImportError:
+        pass
+    for name in ("openai", "anthropic"):
+        try:
+            client = importlib.import_module(name)
+        except ImportError:
+            continue
+        retryable += [client.RateLimitError, client.APITimeoutError]
+        known.append(client.APIError)
+    return tuple(retryable), tuple(known)
+
+
+def _is_retryable(e: Exception) -> bool:
+    """Check whether an API call failure is transient."""
+    retryable, known = _api_exception_types()
+    if isinstance(e, retryable):
+        return True
+    if getattr(e, "status_code", None) in RETRYABLE_STATUS_CODES:
+        return True
+    if isinstance(e, known):
+        return False
+    error_str = str(e).lower()
+    return any(x in error_str for x in _RETRYABLE_MARKERS)
+
+
 def handle_api_error(func):
     """Decorator to wrap API calls with retry and error handling."""
     import functools
@@ -68,10 +115,7 @@ def handle_api_error(func):
             try:
                 return func(*args, **kwargs)
             except Exception as e:
-                error_str = str(e).lower()
-
-                # Retryable errors
-                if any(x in error_str for x in ["rate limit", "timeout", "503", "429"]):
+                if _is_retryable(e):
                     if attempt < max_retries - 1:
                         delay = retry_delay * (2**attempt)
                         logger.warning(f"Retrying {func.__name__} in {delay}s: {e}")
@@ -104,10 +148,7 @@ def handle_api_error_async(func):
             try:
                 return await func(*args, **kwargs)
             except Exception as e:
-                error_str = str(e).lower()
-
-                # Retryable errors
-                if any(x in error_str for x in ["rate limit", "timeout", "503", "429"]):
+                if _is_retryable(e):
                     if attempt < max_retries - 1:
                         delay = retry_delay * (2**attempt)
                         logger.warning(f"Retrying {func.__name__} in {delay}s: {e}")
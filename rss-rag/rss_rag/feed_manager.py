@@ -2,24 +2,30 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from time import mktime
-from typing import Iterator
+from sqlite3 import Row
+from typing import AsyncIterator, Iterator
 
 import feedparser
 from feedparser import FeedParserDict
 
+from rss_rag.api import add_feeds
+from rss_rag.background_loop import iter_sync
 from rss_rag.database import (
-    add_article,
     add_feed,
-    article_exists,
+    bulk_insert_articles,
     get_all_feeds,
-    get_connection,
+    get_existing_links,
     get_feed_by_url,
+    pooled_connection,
+    transaction,
     update_feed_last_fetched,
+    update_feed_title,
 )
 from rss_rag.config import get_config
 
@@ -75,7 +81,9 @@ def parse_pub_date(entry: FeedParserDict) -> datetime | None:
     parsed = entry.get("published_parsed") or entry.get("updated_parsed")
     if parsed:
         try:
-            return datetime.fromtimestamp(mktime(parsed))
+            # feedparser normalizes to UTC; build the naive datetime from the
+            # fields directly rather than round-tripping through local time
+            return datetime(*parsed[:6])
         except (ValueError, OverflowError):
             pass
     return None
@@ -83,22 +91,18 @@ def parse_pub_date(entry: FeedParserDict) -> datetime | None:
 
 def extract_content(entry: FeedParserDict) -> str | None:
     """Extract article content from feed entry."""
-    # Try content field first (full content)
-    if "content" in entry and entry["content"]:
-        # content is a list, get first HTML content
-        for content in entry["content"]:
-            if content.get("type", "").startswith("text/html") or content.get("value"):
-                return content.get("value")
+    # Try content field first (full content); it is a list, take the first
+    # entry that has a value or is HTML
+    for content in entry.get("content") or ():
+        value = content.get("value")
+        if value or content.get("type", "").startswith("text/html"):
+            return value
 
-    # Fallback to summary
-    if "summary" in entry:
-        return entry["summary"]
-
-    # Fallback to description
-    if "description" in entry:
-        return entry["description"]
-
-    return None
+    # Fallback to summary, then description
+    summary = entry.get("summary")
+    if summary is not None:
+        return summary
+    return entry.get("description")
 
 
 def fetch_feed(
@@ -158,7 +162,21 @@ def fetch_and_store_feed(
     Skips articles that already exist (by link).
     """
     feed_title, articles, error = fetch_feed(feed_url, max_articles)
+    return store_feed_articles(db_path, feed_url, feed_title, articles, error)
+
+
+def store_feed_articles(
+    db_path: Path,
+    feed_url: str,
+    feed_title: str | None,
+    articles: list[Article],
+    error: str | None = None,
+) -> FetchResult:
+    """Store the articles of an already fetched feed in the database.
 
+    Creates feed entry if it doesn't exist.
+    Skips articles that already exist (by link).
+    """
     if error and not articles:
         return FetchResult(
             feed_url=feed_url,
@@ -168,38 +186,33 @@ def fetch_and_store_feed(
             error=error,
         )
 
-    conn = get_connection(db_path)
-    try:
-        # Get or create feed
-        existing_feed = get_feed_by_url(conn, feed_url)
-        if existing_feed:
-            feed_id = existing_feed["id"]
-            # Update title if we now have one
-            if feed_title and not existing_feed.get("title"):
-                cursor = conn.cursor()
-                cursor.execute(
-                    "UPDATE feeds SET title = ? WHERE id = ?", (feed_title, feed_id)
-                )
-                conn.commit()
-        else:
-            feed_id = add_feed(conn, feed_url, feed_title)
-
-        # Store articles
-        new_count = 0
-        for article in articles:
-            if not article_exists(conn, article.link):
-                add_article(
-                    conn,
-                    feed_id=feed_id,
-                    title=article.title,
-                    content=article.content,
-                    link=article.link,
-                    pub_date=article.pub_date,
-                )
-                new_count += 1
-
-        # Update last fetched
-        update_feed_last_fetched(conn, feed_id)
+    with pooled_connection(db_path) as conn:
+        # One transaction per feed: a single commit instead of one per article
+        with transaction(conn):
+            # Get or create feed
+            existing_feed = get_feed_by_url(conn, feed_url)
+            if existing_feed:
+                feed_id = existing_feed["id"]
+                # Update title if we now have one
+                if feed_title and not existing_feed["title"]:
+                    update_feed_title(conn, feed_id, feed_title)
+            else:
+                feed_id = add_feed(conn, feed_url, feed_title)
+
+            # Filter known links up front so their content is never bound;
+            # the insert still ignores any duplicates within the batch
+            existing = get_existing_links(conn, (a.link for a in articles))
+            new_count = bulk_insert_articles(
+                conn,
+                (
+                    (feed_id, a.title, a.content, a.link, a.pub_date)
+                    for a in articles
+                    if a.link not in existing
+                ),
+            )
+
+            # Update last fetched
+            update_feed_last_fetched(conn, feed_id)
 
         return FetchResult(
             feed_url=feed_url,
@@ -208,43 +221,83 @@ def fetch_and_store_feed(
             articles_new=new_count,
             error=error,  # May have partial error
         )
-    finally:
-        conn.close()
-
 
-def fetch_all_feeds(
-    db_path: Path, feeds_file: Path | None = None, max_articles_per_feed: int = 50
-) -> Iterator[FetchResult]:
-    """Fetch all feeds and yield results as they complete.
-
-    If feeds_file provided, imports new feeds from it first.
-    Then fetches all active feeds from database.
-    """
-    config = get_config()
 
+def _get_feeds_to_fetch(db_path: Path, feeds_file: Path | None) -> list[Row]:
+    """Import new feeds from feeds_file (if given) and return all active feeds."""
     # Import feeds from file if provided
     if feeds_file:
         urls = parse_feeds_file(feeds_file)
-        conn = get_connection(db_path)
-        try:
-            for url in urls:
-                if not get_feed_by_url(conn, url):
-                    add_feed(conn, url)
-                    logger.info(f"Added new feed: {url}")
-        finally:
-            conn.close()
+        with pooled_connection(db_path) as conn:
+            with transaction(conn):
+                add_feeds(conn, urls)
 
     # Get all active feeds
-    conn = get_connection(db_path)
+    with pooled_connection(db_path) as conn:
+        return get_all_feeds(conn, active_only=True)
+
+
+async def fetch_all_feeds_async(
+    db_path: Path,
+    feeds_file: Path | None = None,
+    max_articles_per_feed: int = 50,
+    concurrency: int | None = None,
+) -> AsyncIterator[FetchResult]:
+    """Fetch all feeds concurrently and yield results as they complete.
+
+    Network fetches run in a dedicated pool of `concurrency` worker threads
+    (defaults to feeds.max_concurrent_fetches). Database writes stay on the
+    calling thread, one feed at a time.
+
+    If feeds_file provided, imports new feeds from it first.
+    Then fetches all active feeds from database.
+    """
+    if concurrency is None:
+        concurrency = get_config().feeds.max_concurrent_fetches
+
+    feeds = _get_feeds_to_fetch(db_path, feeds_file)
+    if not feeds:
+        return
+
+    # Not asyncio.to_thread: the default executor is capped at
+    # min(32, cpu_count + 4) threads, which would undercut `concurrency`
+    executor = ThreadPoolExecutor(
+        max_workers=max(1, min(concurrency, len(feeds))),
+        thread_name_prefix="feed-fetch",
+    )
+    loop = asyncio.get_running_loop()
+
+    async def fetch_one(feed_url: str):
+        fetched = await loop.run_in_executor(
+            executor, fetch_feed, feed_url, max_articles_per_feed
+        )
+        return feed_url, fetched
+
+    tasks = [asyncio.create_task(fetch_one(feed["url"])) for feed in feeds]
     try:
-        feeds = get_all_feeds(conn, active_only=True)
+        for next_done in asyncio.as_completed(tasks):
+            feed_url, (feed_title, articles, error) = await next_done
+            yield store_feed_articles(db_path, feed_url, feed_title, articles, error)
     finally:
-        conn.close()
+        for task in tasks:
+            task.cancel()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def fetch_all_feeds(
+    db_path: Path, feeds_file: Path | None = None, max_articles_per_feed: int = 50
+) -> Iterator[FetchResult]:
+    """Sync iterator over fetch_all_feeds_async.
 
-    # Fetch each feed
-    for feed in feeds:
-        result = fetch_and_store_feed(db_path, feed["url"], max_articles_per_feed)
-        yield result
+    Results are yielded as each feed is stored, and the fetches run on the
+    background loop, so this also works while an event loop is running.
+
+    If feeds_file provided, imports new feeds from it first.
+    Then fetches all active feeds from database.
+    """
+    yield from iter_sync(
+        fetch_all_feeds_async(db_path, feeds_file, max_articles_per_feed)
+    )
 
 
 def import_feeds_from_file(db_path: Path, feeds_file: Path) -> int:
@@ -253,18 +306,7 @@ def import_feeds_from_file(db_path: Path, feeds_file: Path) -> int:
     Returns number of new feeds added.
     """
     urls = parse_feeds_file(feeds_file)
-    new_count = 0
-
-    conn = get_connection(db_path)
-    try:
-        for url in urls:
-            if not get_feed_by_url(conn, url):
-                add_feed(conn, url)
-                new_count += 1
-                logger.info(f"Added new feed: {url}")
-            else:
-                logger.debug(f"Feed already exists: {url}")
-    finally:
-        conn.close()
 
-    return new_count
+    with pooled_connection(db_path) as conn:
+        with transaction(conn):
+            return add_feeds(conn, urls)
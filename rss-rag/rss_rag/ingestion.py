@@ -5,20 +5,37 @@ from __future__ import annotations
 import asyncio
 import hashlib
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+from functools import lru_cache
 from pathlib import Path
 from typing import AsyncIterator, Iterator
 
+from rss_rag.background_loop import iter_sync, run_sync
 from rss_rag.config import get_config
+from rss_rag.embedding_cache import EmbeddingCache
 from rss_rag.database import (
     get_connection,
-    update_article_lightrag_id,
+    pooled_connection,
+    update_article_lightrag_ids,
 )
 
 logger = logging.getLogger(__name__)
 
-# Module-level cache for LightRAG instance
+# Module-level cache for LightRAG instance, created under _rag_lock
 _rag_instance = None
+_rag_lock = asyncio.Lock()
+
+# Articles handed to LightRAG per ainsert call
+INGEST_BATCH_SIZE = 32
+
+# Ingested articles whose lightrag_id is written per transaction
+LIGHTRAG_ID_FLUSH_SIZE = 128
+
+# Logger LightRAG writes its per-chunk progress to
+LIGHTRAG_LOGGER = "lightrag"
+
+# LightRAG DocStatus of a fully processed document
+LIGHTRAG_PROCESSED = "processed"
 
 
 @dataclass
@@ -32,6 +49,8 @@ class IngestionResult:
     error: str | None = None
 
 
+# Retried articles (batch fallback, re-runs) hash the same links again
+@lru_cache(maxsize=4096)
 def _generate_doc_id(link: str) -> str:
     """Generate a unique document ID from the article link.
 
@@ -39,13 +58,30 @@ def _generate_doc_id(link: str) -> str:
         link: Article URL.
 
     Returns:
-        MD5 hash of the link as document ID.
+        128-bit BLAKE2b hash of the link as document ID.
     """
-    return hashlib.md5(link.encode()).hexdigest()
+    return hashlib.blake2b(link.encode(), digest_size=16).hexdigest()
 
 
-def get_lightrag_instance():
-    """Get or create LightRAG instance with current config.
+def _build_document(title: str, content: str | None, link: str) -> str:
+    """Build the document text LightRAG ingests for an article.
+
+    The pending-articles query in ingest_pending_articles_async builds the
+    same text in SQL; keep the two in sync.
+
+    Args:
+        title: Article title.
+        content: Article content (HTML or text).
+        link: Article URL.
+
+    Returns:
+        Document text.
+    """
+    return f"Title: {title}\n\nURL: {link}\n\n{content or ''}"
+
+
+def _create_lightrag():
+    """Create a LightRAG instance with current config.
 
     LightRAG needs:
     - working_dir: Where to store graph and embeddings
@@ -53,13 +89,9 @@ def get_lightrag_instance():
     - embedding_func: EmbeddingFunc for embeddings
 
     Returns:
-        LightRAG instance configured according to rss_rag config.
+        LightRAG instance configured according to rss_rag config, with
+        storages not yet initialized.
     """
-    global _rag_instance
-
-    if _rag_instance is not None:
-        return _rag_instance
-
     from lightrag import LightRAG
     from lightrag.llm.openai import openai_complete_if_cache, openai_embed
 
@@ -69,28 +101,81 @@ def get_lightrag_instance():
     working_dir = config.storage.lightrag_dir
     working_dir.mkdir(parents=True, exist_ok=True)
 
+    # Serve repeated texts from the embedding cache instead of the API
+    embedding_cache = EmbeddingCache(
+        working_dir / "embedding_cache.db",
+        model=openai_embed.model_name or "text-embedding-3-small",
+    )
+    embedding_func = replace(
+        openai_embed,
+        func=embedding_cache.wrap(openai_embed.func, openai_embed.embedding_dim),
+    )
+
     # Initialize LightRAG with OpenAI functions
-    _rag_instance = LightRAG(
+    rag = LightRAG(
         working_dir=str(working_dir),
         llm_model_func=openai_complete_if_cache,
         llm_model_name=config.llm.entity_extraction.model,
-        embedding_func=openai_embed,
+        embedding_func=embedding_func,
         chunk_token_size=config.lightrag.chunk_size,
         chunk_overlap_token_size=config.lightrag.chunk_overlap,
+        max_parallel_insert=config.lightrag.max_parallel_insert,
     )
 
     logger.info(f"Initialized LightRAG with working_dir: {working_dir}")
 
+    return rag
+
+
+async def get_lightrag_instance_async():
+    """Get or create the LightRAG instance, ready for use.
+
+    The first caller creates the instance and initializes its storages and
+    pipeline status; concurrent callers wait on a lock and then share it.
+    Once it exists, callers return it without taking the lock.
+
+    Returns:
+        LightRAG instance configured according to rss_rag config.
+    """
+    global _rag_instance
+
+    if _rag_instance is not None:
+        return _rag_instance
+
+    async with _rag_lock:
+        if _rag_instance is None:
+            from lightrag.kg.shared_storage import initialize_pipeline_status
+
+            rag = _create_lightrag()
+            await rag.initialize_storages()
+            await initialize_pipeline_status()
+            _rag_instance = rag
+
     return _rag_instance
 
 
+def get_lightrag_instance():
+    """Sync wrapper for get_lightrag_instance_async.
+
+    The instance is created on the background loop used by the other sync
+    wrappers, since LightRAG's storages are bound to the loop they were
+    initialized on.
+
+    Returns:
+        LightRAG instance configured according to rss_rag config.
+    """
+    return run_sync(get_lightrag_instance_async())
+
+
 def reset_lightrag_instance() -> None:
     """Reset the cached LightRAG instance.
 
-    Useful for testing or when config changes.
+    Useful for testing or when config changes. The lock is replaced too,
+    since an asyncio.Lock stays bound to the first loop that waited on it.
     """
-    global _rag_instance
+    global _rag_instance, _rag_lock
     _rag_instance = None
+    _rag_lock = asyncio.Lock()
 
 
 async def ingest_article_async(
@@ -112,18 +197,67 @@ async def ingest_article_async(
     Returns:
         IngestionResult with success status
     """
-    try:
-        # Prepare document text
-        doc_text = f"Title: {title}\n\nURL: {link}\n\n{content or ''}"
+    return await _insert_document(
+        rag, article_id, title, link, _build_document(title, content, link)
+    )
+
 
+async def _processing_errors(rag, ids: list[str]) -> dict[str, str]:
+    """Find the documents LightRAG has not finished processing.
+
+    ainsert does not raise when processing a document fails, and returns
+    right after queueing its documents if another insert keeps LightRAG's
+    pipeline busy; the document status tells whether the work was done.
+
+    Args:
+        rag: LightRAG instance
+        ids: Document IDs passed to ainsert
+
+    Returns:
+        Error message by document ID, for each document not processed
+    """
+    statuses = await rag.aget_docs_by_ids(ids)
+    errors = {}
+    for doc_id in ids:
+        status = statuses.get(doc_id)
+        if status is None:
+            errors[doc_id] = "Document not queued by LightRAG"
+        elif status.status != LIGHTRAG_PROCESSED:
+            errors[doc_id] = status.error_msg or f"Document {status.status}"
+    return errors
+
+
+async def _insert_document(
+    rag,
+    article_id: int,
+    title: str,
+    link: str,
+    document: str,
+) -> IngestionResult:
+    """Insert one prepared article document into LightRAG.
+
+    Args:
+        rag: LightRAG instance
+        article_id: Database article ID
+        title: Article title
+        link: Article URL
+        document: Document text from _build_document
+
+    Returns:
+        IngestionResult with success status
+    """
+    try:
         # Generate unique document ID from link
         doc_id = _generate_doc_id(link)
 
         # Insert into LightRAG (async)
         # Using ids parameter to track which document was inserted
-        await rag.ainsert(doc_text, ids=[doc_id], file_paths=[link])
+        await rag.ainsert(document, ids=[doc_id], file_paths=[link])
+        error = (await _processing_errors(rag, [doc_id])).get(doc_id)
+        if error is not None:
+            raise RuntimeError(error)
 
-        logger.info(f"Ingested article {article_id}: {title[:50]}...")
+        logger.info("Ingested article %d: %.50s...", article_id, title)
 
         return IngestionResult(
             article_id=article_id,
@@ -133,7 +267,7 @@ async def ingest_article_async(
         )
 
     except Exception as e:
-        logger.error(f"Failed to ingest article {article_id}: {e}")
+        logger.error("Failed to ingest article %d: %s", article_id, e)
         return IngestionResult(
             article_id=article_id,
             title=title,
@@ -161,93 +295,165 @@ def ingest_article(
     Returns:
         IngestionResult with success status
     """
-    return asyncio.run(ingest_article_async(rag, article_id, title, content, link))
+    return run_sync(ingest_article_async(rag, article_id, title, content, link))
+
+
+async def ingest_batch_async(rag, articles: list) -> list[IngestionResult]:
+    """Ingest several articles into LightRAG with one ainsert call.
+
+    Handing LightRAG the whole batch lets it pack the chunks of every
+    document into shared embedding and LLM requests. If the batch insert
+    fails, each article is retried on its own so one bad document does not
+    fail the rest. Articles LightRAG did not process are reported as failed,
+    so they stay pending.
+
+    Args:
+        rag: LightRAG instance
+        articles: Rows with id, title, link and document, the text
+            _build_document would produce
+
+    Returns:
+        IngestionResult for each article, in input order
+    """
+    docs = [a["document"] for a in articles]
+    ids = [_generate_doc_id(a["link"]) for a in articles]
+    links = [a["link"] for a in articles]
+
+    try:
+        await rag.ainsert(docs, ids=ids, file_paths=links)
+    except Exception as e:
+        logger.warning(
+            "Batch insert of %d articles failed, retrying individually: %s",
+            len(articles),
+            e,
+        )
+        return [
+            await _insert_document(rag, a["id"], a["title"], a["link"], a["document"])
+            for a in articles
+        ]
+
+    errors = await _processing_errors(rag, ids)
+    if errors:
+        logger.error(
+            "LightRAG did not process %d of %d articles", len(errors), len(articles)
+        )
+    logger.info("Ingested batch of %d articles", len(articles) - len(errors))
+
+    return [
+        IngestionResult(
+            article_id=a["id"],
+            title=a["title"],
+            success=doc_id not in errors,
+            lightrag_id=None if doc_id in errors else doc_id,
+            error=errors.get(doc_id),
+        )
+        for a, doc_id in zip(articles, ids)
+    ]
 
 
 async def ingest_pending_articles_async(
     db_path: Path,
     limit: int | None = None,
+    batch_size: int = INGEST_BATCH_SIZE,
 ) -> AsyncIterator[IngestionResult]:
     """Ingest all articles that haven't been ingested yet.
 
-    Articles with NULL lightrag_id are considered pending.
+    Articles with NULL lightrag_id are considered pending. They are streamed
+    from the database in batches of batch_size and inserted one batch at a
+    time; LightRAG parallelizes each batch up to
+    lightrag.max_parallel_insert. The next batch is only read once the
+    previous one's ainsert has returned and its results have been consumed,
+    so a large backlog is never held in memory at once. Articles whose
+    documents LightRAG did not process (see _processing_errors) are
+    reported as failed and stay pending. Successful inserts are marked as
+    ingested LIGHTRAG_ID_FLUSH_SIZE rows per transaction, with a final
+    flush when the run ends. Articles whose flush is lost to a crash stay
+    pending and are re-ingested on the next run.
 
     Args:
         db_path: Path to SQLite database
         limit: Maximum number of articles to ingest
+        batch_size: Articles per LightRAG insert
 
     Yields:
-        IngestionResult for each article
+        IngestionResult for each article, batch by batch
     """
-    rag = get_lightrag_instance()
+    rag = await get_lightrag_instance_async()
+    batch_size = max(1, batch_size)
+
+    # Pending rows are read through a dedicated connection, so the updates
+    # below never modify the table under its open cursor. The pooled
+    # connection takes the writes; they need no lock, being synchronous calls
+    # on the event loop thread.
+    reader = get_connection(db_path)
+
+    # lightrag references of successful inserts, written in bulk
+    ingested: list[tuple[str, int]] = []
+
+    def flush() -> None:
+        if ingested:
+            with pooled_connection(db_path) as conn:
+                update_article_lightrag_ids(conn, ingested)
+            ingested.clear()
+
+    # LightRAG logs every chunk at INFO; keep that quiet for bulk runs
+    # unless debug logging is on
+    lightrag_logger = logging.getLogger(LIGHTRAG_LOGGER)
+    lightrag_level = lightrag_logger.level
+    if not logger.isEnabledFor(logging.DEBUG):
+        lightrag_logger.setLevel(max(lightrag_level, logging.WARNING))
 
-    # Get pending articles (no lightrag_id)
-    conn = get_connection(db_path)
     try:
-        cursor = conn.cursor()
-        query = """
-            SELECT id, title, content, link 
-            FROM articles 
+        # Get pending articles (no lightrag_id)
+        # One statement for every limit, so its prepared form is reused;
+        # LIMIT -1 means no limit. SQLite assembles the _build_document
+        # text, so each row holds the document rather than the content and
+        # a second, larger copy of it.
+        cursor = reader.execute(
+            """
+            SELECT id, title, link,
+                'Title: ' || title || char(10, 10) || 'URL: ' || link
+                    || char(10, 10) || COALESCE(content, '') AS document
+            FROM articles
             WHERE lightrag_id IS NULL
             ORDER BY pub_date DESC
-        """
-        if limit:
-            query += f" LIMIT {limit}"
-
-        cursor.execute(query)
-        articles = cursor.fetchall()
-    finally:
-        conn.close()
-
-    logger.info(f"Found {len(articles)} articles to ingest")
-
-    for article in articles:
-        article_id = article["id"]
-        title = article["title"]
-        content = article["content"]
-        link = article["link"]
-
-        result = await ingest_article_async(
-            rag,
-            article_id=article_id,
-            title=title,
-            content=content or "",
-            link=link,
+            LIMIT ?
+            """,
+            (limit or -1,),
         )
 
-        # Update database with lightrag reference if successful
-        if result.success and result.lightrag_id:
-            conn = get_connection(db_path)
-            try:
-                update_article_lightrag_id(conn, article_id, result.lightrag_id)
-            finally:
-                conn.close()
-
-        yield result
+        # One ainsert at a time: while LightRAG's pipeline is busy, a second
+        # call only queues its documents and returns before they are
+        # processed. max_parallel_insert parallelizes inside the pipeline.
+        while batch := cursor.fetchmany(batch_size):
+            results = await ingest_batch_async(rag, batch)
+            ingested.extend((r.lightrag_id, r.article_id) for r in results if r.success)
+            if len(ingested) >= LIGHTRAG_ID_FLUSH_SIZE:
+                flush()
+            for result in results:
+                yield result
+    finally:
+        flush()
+        reader.close()
+        lightrag_logger.setLevel(lightrag_level)
 
 
 def ingest_pending_articles(
     db_path: Path,
     limit: int | None = None,
+    batch_size: int = INGEST_BATCH_SIZE,
 ) -> Iterator[IngestionResult]:
     """Sync iterator for pending article ingestion.
 
     Args:
         db_path: Path to SQLite database
         limit: Maximum number of articles to ingest
+        batch_size: Articles per LightRAG insert
 
     Yields:
-        IngestionResult for each article
+        IngestionResult for each article, as soon as it is ingested
     """
-
-    async def collect():
-        results = []
-        async for result in ingest_pending_articles_async(db_path, limit):
-            results.append(result)
-        return results
-
-    results = asyncio.run(collect())
-    yield from results
+    yield from iter_sync(ingest_pending_articles_async(db_path, limit, batch_size))
 
 
 def get_pending_count(db_path: Path) -> int:
@@ -259,13 +465,10 @@ def get_pending_count(db_path: Path) -> int:
     Returns:
         Number of articles with NULL lightrag_id
     """
-    conn = get_connection(db_path)
-    try:
+    with pooled_connection(db_path) as conn:
         cursor = conn.cursor()
         cursor.execute("SELECT COUNT(*) FROM articles WHERE lightrag_id IS NULL")
         return cursor.fetchone()[0]
-    finally:
-        conn.close()
 
 
 def get_ingested_count(db_path: Path) -> int:
@@ -277,10 +480,7 @@ def get_ingested_count(db_path: Path) -> int:
     Returns:
         Number of articles with non-NULL lightrag_id
     """
-    conn = get_connection(db_path)
-    try:
+    with pooled_connection(db_path) as conn:
         cursor = conn.cursor()
         cursor.execute("SELECT COUNT(*) FROM articles WHERE lightrag_id IS NOT NULL")
         return cursor.fetchone()[0]
-    finally:
-        conn.close()
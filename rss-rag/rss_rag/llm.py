@@ -4,12 +4,14 @@ from __future__ import annotations
 
 import logging
 from functools import lru_cache
-from typing import Literal
-
-from langchain_core.language_models import BaseChatModel
+from typing import TYPE_CHECKING, Literal
 
 from rss_rag.config import LLMConfig, get_config
 
+if TYPE_CHECKING:
+    # Annotation only; LangChain is imported with the provider on first use
+    from langchain_core.language_models import BaseChatModel
+
 logger = logging.getLogger(__name__)
 
 
@@ -20,6 +22,10 @@ def get_llm(
 ) -> BaseChatModel:
     """Get an LLM instance based on provider.
 
+    Instances are cached per (provider, model, temperature), so repeated
+    calls share one client and its pooled HTTP connections instead of
+    re-validating settings and opening new connections.
+
     Args:
         provider: LLM provider (openai, anthropic)
         model: Model name
@@ -28,6 +34,11 @@ def get_llm(
     Returns:
         LangChain chat model instance
     """
+    return _get_llm_cached(provider, model, temperature)
+
+
+@lru_cache(maxsize=None)
+def _get_llm_cached(provider: str, model: str, temperature: float) -> BaseChatModel:
     if provider == "openai":
         from langchain_openai import ChatOpenAI
 
@@ -46,6 +57,11 @@ def get_llm(
         raise ValueError(f"Unsupported LLM provider: {provider}")
 
 
+def clear_llm_instances() -> None:
+    """Clear the cached LLM instances."""
+    _get_llm_cached.cache_clear()
+
+
 def get_entity_extraction_llm() -> BaseChatModel:
     """Get the LLM configured for entity extraction."""
     config = get_config()
@@ -86,6 +102,8 @@ async def test_llm_connection(llm: BaseChatModel) -> tuple[bool, str]:
         Tuple of (success, message)
     """
     try:
+        # Deliberately bypasses cached_invoke: a cached reply would report a
+        # working connection without reaching the provider
         response = await llm.ainvoke("Say 'OK' if you can read this.")
         return True, f"Connection successful: {response.content[:50]}"
     except Exception as e:
@@ -0,0 +1,366 @@
+"""Response cache for LLM calls.
+
+Prompts are matched exactly first. With llm.semantic_cache enabled, sampled
+calls (temperature > 0), whose answers are not reproducible anyway, also
+reuse the response of a cached prompt whose embedding is close enough.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import threading
+import time
+from functools import lru_cache
+from pathlib import Path
+from sqlite3 import Connection
+from typing import TYPE_CHECKING, Callable
+
+import numpy as np
+
+from rss_rag.config import get_config
+from rss_rag.database import pooled_connection
+
+if TYPE_CHECKING:
+    from langchain_core.language_models import BaseChatModel
+
+logger = logging.getLogger(__name__)
+
+# Seconds a cached response stays valid
+LLM_CACHE_TTL = 7 * 24 * 3600
+
+# Minimum cosine similarity for a semantic hit
+SEMANTIC_THRESHOLD = 0.92
+
+# Most recent prompt embeddings kept per model for semantic lookups
+SEMANTIC_CACHE_SIZE = 1000
+
+# Concurrent requests per batch of cache misses
+BATCH_MAX_CONCURRENCY = 8
+
+LLM_CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS llm_cache (
+    key BLOB PRIMARY KEY,
+    model TEXT NOT NULL,
+    response TEXT NOT NULL,
+    vec BLOB,
+    ts REAL NOT NULL
+) WITHOUT ROWID;
+"""
+
+
+class LLMCache:
+    """Exact and semantic cache of LLM responses, stored in SQLite."""
+
+    def __init__(
+        self,
+        db_path: Path,
+        embed: Callable[[list[str]], list[np.ndarray | None]] | None = None,
+        threshold: float = SEMANTIC_THRESHOLD,
+        ttl: float = LLM_CACHE_TTL,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            db_path: SQLite file holding the cache.
+            embed: Function embedding a list of prompts in one batch, with
+                None for any prompt to skip the semantic lookup for;
+                semantic lookups are disabled without it.
+            threshold: Minimum cosine similarity for a semantic hit.
+            ttl: Seconds a cached response stays valid.
+        """
+        self.db_path = Path(db_path)
+        self.embed = embed
+        self.threshold = threshold
+        self.ttl = ttl
+        self._schema_ready = False
+        # model -> (unit prompt vectors, responses), newest last; shared by
+        # every thread using the cache, so guarded by _lock
+        self._semantic: dict[str, tuple[list[np.ndarray], list[str]]] = {}
+        self._lock = threading.Lock()
+
+    def _get_conn(self) -> Connection:
+        # A sqlite3 connection only works on the thread that opened it, and
+        # the cache serves both callers' loops and the background loop, so
+        # each thread borrows its own pooled connection
+        if not self._schema_ready:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with pooled_connection(self.db_path) as conn:
+            if not self._schema_ready:
+                conn.executescript(LLM_CACHE_SCHEMA)
+                self._schema_ready = True
+            return conn
+
+    @staticmethod
+    def _key(model: str, prompt: str) -> bytes:
+        return hashlib.blake2b(f"{model}\0{prompt}".encode(), digest_size=32).digest()
+
+    def get(self, model: str, prompt: str) -> str | None:
+        """Look up the response cached for exactly this prompt.
+
+        Args:
+            model: Model name.
+            prompt: Prompt text.
+
+        Returns:
+            Cached response, or None.
+        """
+        row = (
+            self._get_conn()
+            .execute(
+                "SELECT response FROM llm_cache WHERE key = ? AND ts >= ?",
+                (self._key(model, prompt), time.time() - self.ttl),
+            )
+            .fetchone()
+        )
+        return row[0] if row else None
+
+    def _semantic_entries(self, model: str) -> tuple[list[np.ndarray], list[str]]:
+        # Callers hold _lock
+        entries = self._semantic.get(model)
+        if entries is None:
+            rows = (
+                self._get_conn()
+                .execute(
+                    """
+                    SELECT vec, response FROM llm_cache
+                    WHERE model = ? AND vec IS NOT NULL AND ts >= ?
+                    ORDER BY ts DESC
+                    LIMIT ?
+                    """,
+                    (model, time.time() - self.ttl, SEMANTIC_CACHE_SIZE),
+                )
+                .fetchall()
+            )
+            rows.reverse()
+            entries = (
+                [np.frombuffer(vec, dtype=np.float32) for vec, _ in rows],
+                [response for _, response in rows],
+            )
+            self._semantic[model] = entries
+        return entries
+
+    def get_similar(self, model: str, vector: np.ndarray) -> str | None:
+        """Look up the response of the most similar cached prompt.
+
+        Args:
+            model: Model name.
+            vector: Unit-length prompt embedding.
+
+        Returns:
+            Cached response if its prompt is at least `threshold` similar,
+            else None.
+        """
+        with self._lock:
+            vectors, responses = self._semantic_entries(model)
+            if not vectors:
+                return None
+            scores = np.vstack(vectors) @ vector
+            best = int(np.argmax(scores))
+            if scores[best] < self.threshold:
+                return None
+            return responses[best]
+
+    def put(
+        self,
+        model: str,
+        prompt: str,
+        response: str,
+        vector: np.ndarray | None = None,
+    ) -> None:
+        """Cache a response.
+
+        Args:
+            model: Model name.
+            prompt: Prompt text.
+            response: LLM response.
+            vector: Unit-length prompt embedding, for semantic lookups.
+        """
+        blob = None
+        if vector is not None:
+            vector = vector.astype(np.float32)
+            blob = vector.tobytes()
+            with self._lock:
+                # Load stored entries before adding the new row to them
+                vectors, responses = self._semantic_entries(model)
+                vectors.append(vector)
+                responses.append(response)
+                if len(vectors) > SEMANTIC_CACHE_SIZE:
+                    del vectors[0], responses[0]
+
+        self._get_conn().execute(
+            "INSERT OR REPLACE INTO llm_cache (key, model, response, vec, ts) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (self._key(model, prompt), model, response, blob, time.time()),
+        )
+
+    async def invoke(
+        self,
+        llm: BaseChatModel,
+        prompt: str,
+        model: str,
+        temperature: float,
+    ) -> str:
+        """Return a cached response for the prompt, calling the LLM on a miss.
+
+        Args:
+            llm: Chat model to call on a miss.
+            prompt: Prompt text.
+            model: Model name, part of the cache key.
+            temperature: Sampling temperature; semantic matches are only
+                used above 0.
+
+        Returns:
+            Response text.
+        """
+        (cached,), (vector,) = await self._lookup(model, [prompt], temperature)
+        if cached is not None:
+            return cached
+
+        result = await llm.ainvoke(prompt)
+        self.put(model, prompt, result.content, vector)
+        return result.content
+
+    async def invoke_many(
+        self,
+        llm: BaseChatModel,
+        prompts: list[str],
+        model: str,
+        temperature: float,
+        max_concurrency: int = BATCH_MAX_CONCURRENCY,
+    ) -> list[str | None]:
+        """Answer several prompts, sending all cache misses in one batch.
+
+        Args:
+            llm: Chat model to call for the misses.
+            prompts: Prompt texts.
+            model: Model name, part of the cache key.
+            temperature: Sampling temperature; semantic matches are only
+                used above 0.
+            max_concurrency: Maximum concurrent requests of the batch.
+
+        Returns:
+            Response text per prompt, or None where the LLM call failed.
+        """
+        responses, vectors = await self._lookup(model, prompts, temperature)
+        misses = [i for i, response in enumerate(responses) if response is None]
+
+        if misses:
+            results = await llm.abatch(
+                [prompts[i] for i in misses],
+                config={"max_concurrency": max_concurrency},
+                return_exceptions=True,
+            )
+            for i, result in zip(misses, results):
+                if isinstance(result, Exception):
+                    logger.error("LLM call failed: %s", result)
+                    continue
+                self.put(model, prompts[i], result.content, vectors[i])
+                responses[i] = result.content
+        return responses
+
+    async def _lookup(
+        self, model: str, prompts: list[str], temperature: float
+    ) -> tuple[list[str | None], list[np.ndarray | None]]:
+        """Find cached responses for prompts.
+
+        Prompts without an exact match are embedded together, in one call
+        to the embedding function, for the semantic lookups.
+
+        Returns:
+            The cached response per prompt (None on a miss), and each
+            prompt's unit embedding where a semantic lookup was made.
+        """
+        responses = [self.get(model, prompt) for prompt in prompts]
+        vectors: list[np.ndarray | None] = [None] * len(prompts)
+        misses = [i for i, response in enumerate(responses) if response is None]
+        if len(misses) < len(prompts):
+            logger.debug("LLM cache hits (exact): %d", len(prompts) - len(misses))
+
+        if not misses or temperature <= 0 or self.embed is None:
+            return responses, vectors
+
+        embedded = await asyncio.to_thread(self.embed, [prompts[i] for i in misses])
+        hits = 0
+        for i, vector in zip(misses, embedded):
+            if vector is None:
+                continue
+            vector = np.asarray(vector, dtype=np.float32)
+            vectors[i] = vector / (np.linalg.norm(vector) or 1.0)
+            responses[i] = self.get_similar(model, vectors[i])
+            hits += responses[i] is not None
+        if hits:
+            logger.debug("LLM cache hits (semantic): %d", hits)
+        return responses, vectors
+
+
+def _embed_prompts(prompts: list[str]) -> list[np.ndarray | None]:
+    """Embed prompts with the configured embedding model, in one batch.
+
+    Prompts the model would truncate get None: prompts differing only past
+    its input window would otherwise match each other.
+    """
+    from rss_rag.embeddings import get_embedding_model
+
+    model = get_embedding_model()
+    fits = [not model.truncates(prompt) for prompt in prompts]
+    kept = [prompt for prompt, ok in zip(prompts, fits) if ok]
+    vectors = iter(model.encode(kept) if kept else ())
+    return [next(vectors) if ok else None for ok in fits]
+
+
+@lru_cache(maxsize=1)
+def get_llm_cache() -> LLMCache:
+    """Get the LLM cache stored next to the LightRAG data.
+
+    Semantic lookups are only made with llm.semantic_cache enabled, as they
+    load the embedding model.
+
+    Returns cached instance.
+    """
+    config = get_config()
+    return LLMCache(
+        config.storage.lightrag_dir / "llm_cache.db",
+        embed=_embed_prompts if config.llm.semantic_cache else None,
+    )
+
+
+async def cached_invoke(
+    llm: BaseChatModel,
+    prompt: str,
+    model: str,
+    temperature: float,
+) -> str:
+    """Invoke an LLM through the shared response cache.
+
+    Args:
+        llm: Chat model to call on a miss.
+        prompt: Prompt text.
+        model: Model name.
+        temperature: Sampling temperature.
+
+    Returns:
+        Response text.
+    """
+    return await get_llm_cache().invoke(llm, prompt, model, temperature)
+
+
+async def cached_invoke_many(
+    llm: BaseChatModel,
+    prompts: list[str],
+    model: str,
+    temperature: float,
+) -> list[str | None]:
+    """Invoke an LLM on several prompts through the shared response cache.
+
+    Args:
+        llm: Chat model to call for the misses.
+        prompts: Prompt texts.
+        model: Model name.
+        temperature: Sampling temperature.
+
+    Returns:
+        Response text per prompt, or None where the LLM call failed.
+    """
+    return await get_llm_cache().invoke_many(llm, prompts, model, temperature)
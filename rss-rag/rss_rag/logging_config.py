@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from datetime import datetime
 
@@ -11,6 +14,9 @@ from datetime import datetime
 LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 
+# Thread writing queued records to the real handlers
+_listener: QueueListener | None = None
+
 
 def setup_logging(
     level: int = logging.INFO,
@@ -19,6 +25,10 @@ def setup_logging(
 ) -> None:
     """Configure logging for the application.
 
+    The root logger only enqueues records; a listener thread formats them
+    and writes them to stderr and the log file, so logging calls never block
+    the event loop on terminal or disk I/O.
+
     Args:
         level: Base logging level
         log_file: Optional file to write logs to
@@ -27,6 +37,10 @@ def setup_logging(
     if verbose:
         level = logging.DEBUG
 
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+
     # Root logger configuration
     root_logger = logging.getLogger()
     root_logger.setLevel(level)
@@ -38,7 +52,7 @@ def setup_logging(
     console_handler = logging.StreamHandler(sys.stderr)
     console_handler.setLevel(level)
     console_handler.setFormatter(logging.Formatter(LOG_FORMAT, DATE_FORMAT))
-    root_logger.addHandler(console_handler)
+    handlers: list[logging.Handler] = [console_handler]
 
     # File handler (optional)
     if log_file:
@@ -46,7 +60,13 @@ def setup_logging(
         file_handler = logging.FileHandler(log_file)
         file_handler.setLevel(logging.DEBUG)  # Always verbose in file
         file_handler.setFormatter(logging.Formatter(LOG_FORMAT, DATE_FORMAT))
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    # Hand records to the listener thread instead of writing them inline
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    root_logger.addHandler(QueueHandler(log_queue))
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
 
     # Reduce noise from third-party libraries
     logging.getLogger("httpx").setLevel(logging.WARNING)
@@ -60,6 +80,17 @@ def setup_logging(
     )
 
 
+def stop_logging() -> None:
+    """Write out queued log records and stop the listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(stop_logging)
+
+
 def get_logger(name: str) -> logging.Logger:
     """Get a logger with the given name."""
     return logging.getLogger(name)
@@ -4,17 +4,23 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import re
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 from typing import Literal
 
+from rss_rag.background_loop import run_sync
 from rss_rag.config import get_config
-from rss_rag.ingestion import get_lightrag_instance
+from rss_rag.ingestion import get_lightrag_instance_async
 from rss_rag.llm import get_summarizer_llm
+from rss_rag.llm_cache import cached_invoke, cached_invoke_many
 
 logger = logging.getLogger(__name__)
 
+# URLs in LightRAG responses, compiled once at import
+_URL_RE = re.compile(r'https?://[^\s<>"{}|\\^`\[\]]+')
+
 
 class QueryMode(str, Enum):
     """LightRAG query modes."""
@@ -53,7 +59,7 @@ async def search_async(
         SearchResult with response and optional summary
     """
     try:
-        rag = get_lightrag_instance()
+        rag = await get_lightrag_instance_async()
 
         # Query LightRAG
         logger.info(f"Searching with mode={mode.value}: {query[:50]}...")
@@ -98,26 +104,95 @@ def search(
     summarize: bool = True,
 ) -> SearchResult:
     """Sync wrapper for search."""
-    return asyncio.run(search_async(query, mode, summarize))
+    return run_sync(search_async(query, mode, summarize))
+
+
+async def search_many_async(
+    queries: list[str],
+    mode: QueryMode = QueryMode.HYBRID,
+    summarize: bool = True,
+) -> list[SearchResult]:
+    """Search the knowledge graph for several queries at once.
+
+    The LightRAG queries run concurrently, and their summaries are requested
+    as a single LLM batch instead of one call per query.
+
+    Args:
+        queries: Search queries
+        mode: Query mode (hybrid, local, global, naive)
+        summarize: Whether to run summarizer LLM on results
+
+    Returns:
+        SearchResult per query, in input order
+    """
+    try:
+        rag = await get_lightrag_instance_async()
+    except Exception as e:
+        logger.error(f"Search failed: {e}")
+        return [
+            SearchResult(query=query, mode=mode, raw_response="", error=str(e))
+            for query in queries
+        ]
+
+    logger.info(f"Searching {len(queries)} queries with mode={mode.value}")
+    responses = await asyncio.gather(
+        *(rag.aquery(query, param={"mode": mode.value}) for query in queries),
+        return_exceptions=True,
+    )
+
+    results = []
+    for query, response in zip(queries, responses):
+        if isinstance(response, Exception):
+            logger.error(f"Search failed: {response}")
+            results.append(
+                SearchResult(
+                    query=query, mode=mode, raw_response="", error=str(response)
+                )
+            )
+        else:
+            results.append(
+                SearchResult(
+                    query=query,
+                    mode=mode,
+                    raw_response=response,
+                    sources=_extract_sources(response),
+                )
+            )
+
+    if summarize:
+        answered = [r for r in results if r.error is None and r.raw_response]
+        summaries = await _summarize_responses(
+            [(r.query, r.raw_response) for r in answered]
+        )
+        for result, summary in zip(answered, summaries):
+            result.summary = summary
+
+    return results
+
+
+def search_many(
+    queries: list[str],
+    mode: QueryMode = QueryMode.HYBRID,
+    summarize: bool = True,
+) -> list[SearchResult]:
+    """Sync wrapper for search_many_async."""
+    return run_sync(search_many_async(queries, mode, summarize))
 
 
 def _extract_sources(response: str) -> list[str]:
     """Extract URLs from response text."""
-    import re
+    # findall collects the matches in C; dict keys dedupe in first-seen order
+    return list(dict.fromkeys(_URL_RE.findall(response)))
 
-    # Match URLs in the response
-    url_pattern = r'https?://[^\s<>"{}|\\^`\[\]]+'
-    urls = re.findall(url_pattern, response)
 
-    # Deduplicate while preserving order
-    seen = set()
-    unique_urls = []
-    for url in urls:
-        if url not in seen:
-            seen.add(url)
-            unique_urls.append(url)
+def _summary_prompt(query: str, response: str) -> str:
+    """Build the summarizer prompt for a query and its search results."""
+    return f"""Summarize the following search results for the query: "{query}"
 
-    return unique_urls
+Search Results:
+{response}
+
+Provide a concise, informative summary that directly answers the query. Include key points and any relevant source URLs mentioned."""
 
 
 async def _summarize_response(query: str, response: str) -> str:
@@ -132,20 +207,50 @@ async def _summarize_response(query: str, response: str) -> str:
     """
     try:
         llm = get_summarizer_llm()
+        llm_config = get_config().llm.summarizer
 
-        prompt = f"""Summarize the following search results for the query: "{query}"
+        return await cached_invoke(
+            llm,
+            _summary_prompt(query, response),
+            llm_config.model,
+            llm_config.temperature,
+        )
 
-Search Results:
-{response}
+    except Exception as e:
+        logger.error(f"Summarization failed: {e}")
+        return response  # Return raw response on failure
 
-Provide a concise, informative summary that directly answers the query. Include key points and any relevant source URLs mentioned."""
 
-        result = await llm.ainvoke(prompt)
-        return result.content
+async def _summarize_responses(pairs: list[tuple[str, str]]) -> list[str]:
+    """Summarize several search responses with one LLM batch.
+
+    Args:
+        pairs: (query, raw response) tuples
+
+    Returns:
+        Summary per pair; the raw response where summarization failed
+    """
+    if not pairs:
+        return []
+    try:
+        llm = get_summarizer_llm()
+        llm_config = get_config().llm.summarizer
+
+        summaries = await cached_invoke_many(
+            llm,
+            [_summary_prompt(query, response) for query, response in pairs],
+            llm_config.model,
+            llm_config.temperature,
+        )
 
     except Exception as e:
         logger.error(f"Summarization failed: {e}")
-        return response  # Return raw response on failure
+        return [response for _, response in pairs]
+
+    return [
+        summary if summary is not None else response
+        for summary, (_, response) in zip(summaries, pairs)
+    ]
 
 
 def format_search_result(result: SearchResult, show_raw: bool = False) -> str:
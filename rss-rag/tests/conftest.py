@@ -0,0 +1,54 @@
+"""Shared test configuration."""
+
+import shutil
+import sys
+import types
+from unittest.mock import MagicMock
+
+import pytest
+
+from rss_rag.background_loop import run_sync
+from rss_rag.database import close_all_connections, init_db
+
+# Tests only reach these through @patch, so stand-ins are enough and skip
+# the seconds-long torch import.
+_STUB_MODULES = {
+    "sentence_transformers": ["SentenceTransformer"],
+    "langchain_openai": ["ChatOpenAI", "OpenAIEmbeddings"],
+}
+for _name, _attrs in _STUB_MODULES.items():
+    _module = types.ModuleType(_name)
+    for _attr in _attrs:
+        setattr(_module, _attr, MagicMock(name=f"{_name}.{_attr}"))
+    sys.modules.setdefault(_name, _module)
+
+
+async def _close_background_connections() -> None:
+    close_all_connections()
+
+
+def pytest_runtest_teardown(item):
+    """Close connections pooled by the code under test.
+
+    Runs before fixture finalizers, so temporary databases are closed (and
+    their WAL files cleaned up) as soon as each test ends. Sync wrappers
+    run on the background loop's thread, which has its own pool.
+    """
+    close_all_connections()
+    run_sync(_close_background_connections())
+
+
+@pytest.fixture(scope="session")
+def db_template(tmp_path_factory):
+    """Initialize one database file for db_file to copy."""
+    path = tmp_path_factory.mktemp("template") / "template.db"
+    init_db(path)
+    return path
+
+
+@pytest.fixture
+def db_file(db_template, tmp_path):
+    """Create an initialized database file, copied from the template."""
+    path = tmp_path / "test.db"
+    shutil.copyfile(db_template, path)
+    return path
@@ -0,0 +1,65 @@
+"""Tests for api module."""
+
+import pytest
+
+from rss_rag.api import add_feeds, mark_read
+from rss_rag.database import (
+    add_article,
+    add_feed,
+    get_all_feeds,
+    get_connection,
+    get_read_article_ids,
+    transaction,
+)
+
+
+@pytest.fixture
+def conn(db_file):
+    """Create a connection to a temporary database."""
+    conn = get_connection(db_file)
+    yield conn
+    conn.close()
+
+
+class TestMarkRead:
+    def test_marks_many_in_one_transaction(self, conn):
+        feed_id = add_feed(conn, "https://example.com/feed.xml")
+        ids = [
+            add_article(conn, feed_id, f"A{i}", "", f"https://example.com/{i}", None)
+            for i in range(3)
+        ]
+
+        with transaction(conn):
+            for article_id in ids:
+                article = mark_read(conn, article_id)
+                assert article["id"] == article_id
+
+        assert sorted(get_read_article_ids(conn)) == ids
+
+    def test_invalid_action(self, conn):
+        with pytest.raises(ValueError, match="Invalid action"):
+            mark_read(conn, 1, "skimmed")
+
+    def test_missing_article(self, conn):
+        with pytest.raises(ValueError, match="Article 999 not found"):
+            mark_read(conn, 999)
+
+
+class TestAddFeeds:
+    def test_skips_existing(self, conn):
+        add_feed(conn, "https://example.com/feed.xml")
+
+        count = add_feeds(
+            conn, ["https://example.com/feed.xml", "https://other.com/feed.xml"]
+        )
+
+        assert count == 1
+        assert len(get_all_feeds(conn)) == 2
+
+    def test_counts_repeated_url_once(self, conn):
+        count = add_feeds(
+            conn, ["https://example.com/feed.xml", "https://example.com/feed.xml"]
+        )
+
+        assert count == 1
+        assert len(get_all_feeds(conn)) == 1
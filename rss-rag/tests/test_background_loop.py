@@ -0,0 +1,84 @@
+"""Tests for background loop module."""
+
+import asyncio
+
+import pytest
+
+from rss_rag.background_loop import get_background_loop, iter_sync, run_sync
+
+
+class TestRunSync:
+    """Tests for run_sync."""
+
+    def test_returns_result(self):
+        """Should return the coroutine's result."""
+
+        async def answer():
+            return 42
+
+        assert run_sync(answer()) == 42
+
+    def test_reuses_one_loop(self):
+        """Should run every call on the same background loop."""
+
+        async def current_loop():
+            return asyncio.get_running_loop()
+
+        assert run_sync(current_loop()) is run_sync(current_loop())
+        assert run_sync(current_loop()) is get_background_loop()
+
+    def test_works_inside_running_loop(self):
+        """Should be callable from code already running an event loop."""
+
+        async def answer():
+            return 42
+
+        async def caller():
+            return run_sync(answer())
+
+        assert asyncio.run(caller()) == 42
+
+    def test_propagates_exceptions(self):
+        """Should raise the coroutine's exception."""
+
+        async def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            run_sync(fail())
+
+
+class TestIterSync:
+    """Tests for iter_sync."""
+
+    def test_streams_items(self):
+        """Should produce items as the caller consumes them."""
+        produced = []
+
+        async def numbers():
+            for i in range(3):
+                produced.append(i)
+                yield i
+
+        iterator = iter_sync(numbers())
+
+        assert next(iterator) == 0
+        assert produced == [0]
+        assert list(iterator) == [1, 2]
+
+    def test_closes_async_iterator_early(self):
+        """Should run the async iterator's cleanup when closed early."""
+        closed = []
+
+        async def numbers():
+            try:
+                for i in range(10):
+                    yield i
+            finally:
+                closed.append(True)
+
+        iterator = iter_sync(numbers())
+        next(iterator)
+        iterator.close()
+
+        assert closed == [True]
@@ -8,7 +8,13 @@ import tempfile
 import os
 
 from rss_rag.cli import app
-from rss_rag.database import init_db, get_connection, add_feed
+from rss_rag.database import (
+    init_db,
+    get_connection,
+    add_article,
+    add_feed,
+    update_article_lightrag_id,
+)
 
 
 runner = CliRunner()
@@ -136,6 +142,22 @@ class TestStatsCommand:
         assert "Total Feeds" in result.stdout
         assert "1" in result.stdout
 
+    def test_stats_shows_ingested_count(self, mock_config):
+        runner.invoke(app, ["init"])
+
+        conn = get_connection(mock_config.storage.sqlite_db)
+        feed_id = add_feed(conn, "https://example.com/feed", "Test Feed")
+        article_id = add_article(
+            conn, feed_id, "Article", None, "https://example.com/1", None
+        )
+        update_article_lightrag_id(conn, article_id, "doc-1")
+        conn.close()
+
+        result = runner.invoke(app, ["stats"])
+
+        assert result.exit_code == 0
+        assert "Ingested to LightRAG" in result.stdout
+
     def test_stats_no_db_error(self, mock_config):
         result = runner.invoke(app, ["stats"])
 
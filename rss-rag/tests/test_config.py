@@ -1,6 +1,6 @@
 """Tests for configuration module."""
 
-import tempfile
+import os
 from pathlib import Path
 
 import pytest
@@ -14,6 +14,7 @@ from rss_rag.config import (
     LLMConfig,
     LLMsConfig,
     StorageConfig,
+    _load_config_file,
     load_config,
     get_config,
     set_config,
@@ -74,6 +75,7 @@ class TestDefaultConfig:
         config = Config()
         assert config.feeds.fetch_interval == 3600
         assert config.feeds.max_articles_per_fetch == 50
+        assert config.feeds.max_concurrent_fetches == 16
 
 
 class TestLoadConfig:
@@ -89,7 +91,7 @@ class TestLoadConfig:
         config = load_config(None)
         assert config == Config()
 
-    def test_load_config_from_yaml(self):
+    def test_load_config_from_yaml(self, tmp_path):
         """Test loading configuration from a YAML file."""
         yaml_content = """
 storage:
@@ -105,52 +107,65 @@ lightrag:
   chunk_size: 2000
   chunk_overlap: 200
 """
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(yaml_content)
-            temp_path = Path(f.name)
-
-        try:
-            config = load_config(temp_path)
-            assert config.storage.lightrag_dir == Path("/custom/lightrag")
-            assert config.storage.sqlite_db == Path("/custom/db.sqlite")
-            assert config.embeddings.provider == "openai"
-            assert config.embeddings.model == "text-embedding-3-small"
-            assert config.lightrag.chunk_size == 2000
-            assert config.lightrag.chunk_overlap == 200
-            # Check defaults are still applied
-            assert config.feeds.fetch_interval == 3600
-        finally:
-            temp_path.unlink()
-
-    def test_load_config_empty_yaml(self):
+        temp_path = tmp_path / "config.yaml"
+        temp_path.write_text(yaml_content)
+
+        config = load_config(temp_path)
+        assert config.storage.lightrag_dir == Path("/custom/lightrag")
+        assert config.storage.sqlite_db == Path("/custom/db.sqlite")
+        assert config.embeddings.provider == "openai"
+        assert config.embeddings.model == "text-embedding-3-small"
+        assert config.lightrag.chunk_size == 2000
+        assert config.lightrag.chunk_overlap == 200
+        # Check defaults are still applied
+        assert config.feeds.fetch_interval == 3600
+
+    def test_load_config_reparses_modified_file(self, tmp_path):
+        """Test that loads are memoized until the file changes."""
+        temp_path = tmp_path / "config.yaml"
+        temp_path.write_text("feeds:\n  fetch_interval: 1800\n")
+
+        load_config(temp_path)
+        hits = _load_config_file.cache_info().hits
+        assert load_config(temp_path).feeds.fetch_interval == 1800
+        assert _load_config_file.cache_info().hits == hits + 1
+
+        temp_path.write_text("feeds:\n  fetch_interval: 900\n")
+        stat = temp_path.stat()
+        os.utime(temp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert load_config(temp_path).feeds.fetch_interval == 900
+
+    def test_load_config_returns_independent_copies(self, tmp_path):
+        """Test that modifying a loaded config doesn't leak into later loads."""
+        temp_path = tmp_path / "config.yaml"
+        temp_path.write_text("feeds:\n  fetch_interval: 1800\n")
+
+        load_config(temp_path).feeds.fetch_interval = 60
+
+        assert load_config(temp_path).feeds.fetch_interval == 1800
+
+    def test_load_config_empty_yaml(self, tmp_path):
         """Test loading from empty YAML file returns defaults."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write("")
-            temp_path = Path(f.name)
+        temp_path = tmp_path / "config.yaml"
+        temp_path.write_text("")
 
-        try:
-            config = load_config(temp_path)
-            assert config == Config()
-        finally:
-            temp_path.unlink()
+        config = load_config(temp_path)
+        assert config == Config()
 
-    def test_load_config_partial_yaml(self):
+    def test_load_config_partial_yaml(self, tmp_path):
         """Test loading partial config merges with defaults."""
         yaml_content = """
 feeds:
   fetch_interval: 1800
 """
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(yaml_content)
-            temp_path = Path(f.name)
-
-        try:
-            config = load_config(temp_path)
-            assert config.feeds.fetch_interval == 1800
-            assert config.feeds.max_articles_per_fetch == 50  # default
-            assert config.storage.sqlite_db == Path("./rss_rag.db")  # default
-        finally:
-            temp_path.unlink()
+        temp_path = tmp_path / "config.yaml"
+        temp_path.write_text(yaml_content)
+
+        config = load_config(temp_path)
+        assert config.feeds.fetch_interval == 1800
+        assert config.feeds.max_articles_per_fetch == 50  # default
+        assert config.storage.sqlite_db == Path("./rss_rag.db")  # default
 
 
 class TestConfigValidation:
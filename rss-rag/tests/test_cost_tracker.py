@@ -1,26 +1,32 @@
 """Tests for cost tracker module."""
 
 import pytest
-from pathlib import Path
-import tempfile
+import json
+import threading
 from datetime import datetime, timedelta
+from unittest.mock import patch
 
+from rss_rag import cost_tracker
 from rss_rag.cost_tracker import (
     CostTracker,
     CostSummary,
     APICall,
     format_cost_summary,
+    get_cost_tracker,
 )
+from rss_rag.config import Config, StorageConfig
 
 
 @pytest.fixture
 def tracker():
+    """Create a cost tracker that keeps calls in memory only."""
+    return CostTracker()
+
+
+@pytest.fixture
+def stored_tracker(tmp_path):
     """Create a cost tracker with temporary storage."""
-    with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as f:
-        path = Path(f.name)
-    tracker = CostTracker(path)
-    yield tracker
-    path.unlink(missing_ok=True)
+    return CostTracker(tmp_path / "costs.jsonl")
 
 
 class TestCostTracker:
@@ -36,6 +42,13 @@ class TestCostTracker:
         assert len(tracker.calls) == 1
         assert tracker.calls[0].operation == "test"
 
+    def test_cost_uses_model_pricing(self, tracker):
+        cost = tracker.record_call("test", "gpt-4o", 1_000_000, 1_000_000)
+        assert cost == pytest.approx(2.50 + 10.00)
+
+        cost = tracker.record_call("test", "unknown-model", 1_000_000, 1_000_000)
+        assert cost == pytest.approx(0.02)
+
     def test_get_summary(self, tracker):
         tracker.record_call("op1", "gpt-4o-mini", 1000, 500)
         tracker.record_call("op2", "gpt-4o-mini", 2000, 1000)
@@ -56,19 +69,118 @@ class TestCostTracker:
         assert "ingest" in summary.by_operation
         assert "search" in summary.by_operation
 
-    def test_persistence(self, tracker):
-        tracker.record_call("test", "gpt-4o-mini", 1000, 500)
+    def test_summary_since(self, tracker):
+        tracker.record_call("old", "gpt-4o-mini", 1000, 500)
+        cutoff = datetime.now()
+        tracker.record_call("new", "gpt-4o-mini", 2000, 1000)
+
+        assert tracker.get_summary(since=cutoff).total_calls == 1
+        assert tracker.get_summary(since=cutoff).by_operation.keys() == {"new"}
+        assert tracker.get_summary(since=cutoff + timedelta(days=1)).total_calls == 0
+        assert tracker.get_summary().total_calls == 2
+
+    def test_summary_is_a_copy(self, tracker):
+        tracker.record_call("op", "gpt-4o-mini", 1000, 500)
+
+        tracker.get_summary().by_operation["op"] = 100.0
+
+        assert tracker.get_summary().by_operation["op"] < 1.0
+
+    def test_persistence(self, stored_tracker):
+        stored_tracker.record_call("test", "gpt-4o-mini", 1000, 500)
+        stored_tracker.flush()
 
         # Create new tracker with same path
-        tracker2 = CostTracker(tracker.storage_path)
+        tracker2 = CostTracker(stored_tracker.storage_path)
 
         assert len(tracker2.calls) == 1
+        assert tracker2.get_summary().total_calls == 1
+
+    def test_appends_one_line_per_call(self, stored_tracker):
+        stored_tracker.record_call("op1", "gpt-4o-mini", 1000, 500)
+        stored_tracker.record_call("op2", "gpt-4o-mini", 2000, 1000)
+        stored_tracker.flush()
+
+        lines = stored_tracker.storage_path.read_text().splitlines()
+
+        assert len(lines) == 2
+        assert json.loads(lines[1])["operation"] == "op2"
+
+    def test_clear(self, stored_tracker):
+        stored_tracker.record_call("test", "gpt-4o-mini", 1000, 500)
+        stored_tracker.clear()
+
+        assert len(stored_tracker.calls) == 0
+        assert not stored_tracker.storage_path.exists()
+        assert CostTracker(stored_tracker.storage_path).calls == []
+
+    def test_concurrent_records_all_persisted(self, stored_tracker):
+        def record_many():
+            for _ in range(50):
+                stored_tracker.record_call("op", "gpt-4o-mini", 10, 5)
+
+        threads = [threading.Thread(target=record_many) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        stored_tracker.flush()
+
+        assert len(CostTracker(stored_tracker.storage_path).calls) == 200
+
+
+class TestGetCostTracker:
+    def test_migrates_legacy_json_history(self, tmp_path, monkeypatch):
+        legacy = tmp_path / "cost_history.json"
+        legacy.write_text(
+            json.dumps(
+                [
+                    {
+                        "timestamp": "2024-01-01T12:00:00",
+                        "operation": "summarization",
+                        "model": "gpt-4o-mini",
+                        "input_tokens": 1000,
+                        "output_tokens": 500,
+                        "cost_usd": 0.00045,
+                    }
+                ],
+                indent=2,
+            )
+        )
+        monkeypatch.setattr(cost_tracker, "_tracker", None)
+        config = Config(storage=StorageConfig(lightrag_dir=tmp_path))
+
+        with patch("rss_rag.config.get_config", return_value=config):
+            tracker = get_cost_tracker()
+
+        assert tracker.storage_path == tmp_path / "cost_history.jsonl"
+        assert [c.operation for c in tracker.calls] == ["summarization"]
+        assert not legacy.exists()
+        assert (tmp_path / "cost_history.json.migrated").exists()
+
 
-    def test_clear(self, tracker):
-        tracker.record_call("test", "gpt-4o-mini", 1000, 500)
-        tracker.clear()
+class TestStdlibJsonFallback:
+    def test_round_trip_without_orjson(self, stored_tracker, monkeypatch):
+        monkeypatch.setattr(cost_tracker, "orjson", None)
 
-        assert len(tracker.calls) == 0
+        stored_tracker.record_call("test", "gpt-4o-mini", 1000, 500)
+        stored_tracker.flush()
+
+        assert CostTracker(stored_tracker.storage_path).calls == stored_tracker.calls
+
+
+class TestAPICall:
+    def test_epoch_derived_from_iso_timestamp(self):
+        call = APICall(
+            timestamp="2025-01-01T12:00:00",
+            operation="test",
+            model="gpt-4o-mini",
+            input_tokens=1,
+            output_tokens=0,
+            cost_usd=0.0,
+        )
+
+        assert call.timestamp_epoch == datetime(2025, 1, 1, 12).timestamp()
 
 
 class TestFormatCostSummary:
@@ -86,3 +198,16 @@ class TestFormatCostSummary:
         assert "Total calls: 10" in formatted
         assert "Total cost: $0.0500" in formatted
         assert "ingest" in formatted
+
+    def test_sections_sorted_by_name(self):
+        summary = CostSummary(
+            total_calls=2,
+            by_operation={"search": 0.02, "ingest": 0.03},
+            by_model={"gpt-4o-mini": 0.05},
+        )
+
+        formatted = format_cost_summary(summary)
+
+        assert formatted.index("ingest") < formatted.index("search")
+        assert "By Model:" in formatted
+        assert "gpt-4o-mini: $0.0500" in formatted
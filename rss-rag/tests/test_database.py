@@ -1,56 +1,149 @@
 """Tests for database module."""
 
-import tempfile
+import sqlite3
 from datetime import datetime
-from pathlib import Path
 
 import pytest
 
 from rss_rag.database import (
+    ARTICLE_INSERT_CHUNK,
+    LINK_LOOKUP_CHUNK,
     add_article,
     add_feed,
     add_reading_history,
+    add_reading_history_batch,
     article_exists,
+    bulk_insert_articles,
+    close_all_connections,
     deactivate_feed,
     delete_feed,
     get_all_feeds,
     get_article,
     get_article_by_link,
+    get_article_titles,
     get_articles_by_feed,
     get_articles_without_lightrag_id,
     get_connection,
+    get_db_connection,
+    get_existing_links,
     get_feed,
     get_feed_by_url,
     get_read_article_ids,
     get_reading_history,
     get_recent_articles,
     get_stats,
+    get_unread_article_summaries,
     get_unread_articles,
     init_db,
+    init_schema,
+    iter_articles_by_feed,
+    iter_recent_articles,
+    pooled_connection,
+    transaction,
     update_article_lightrag_id,
+    update_article_lightrag_ids,
     update_feed_last_fetched,
     update_feed_title,
 )
 
 
 @pytest.fixture
-def db_path():
+def db_path(tmp_path):
     """Create a temporary database file."""
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        path = Path(f.name)
+    path = tmp_path / "test.db"
     init_db(path)
-    yield path
-    path.unlink()
+    return path
 
 
 @pytest.fixture
-def conn(db_path):
-    """Create a database connection."""
+def baseline_db(tmp_path):
+    """Create a database with the original schema.
+
+    It has no is_read column, no ON DELETE CASCADE and a user_version of 0.
+    """
+    path = tmp_path / "baseline.db"
+    conn = sqlite3.connect(path)
+    conn.executescript(
+        """
+        CREATE TABLE feeds (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            url TEXT UNIQUE NOT NULL,
+            title TEXT,
+            last_fetched TIMESTAMP,
+            fetch_interval INTEGER DEFAULT 3600,
+            active BOOLEAN DEFAULT 1,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        );
+        CREATE TABLE articles (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            feed_id INTEGER NOT NULL,
+            title TEXT NOT NULL,
+            content TEXT,
+            link TEXT UNIQUE NOT NULL,
+            pub_date TIMESTAMP,
+            fetched_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            lightrag_id TEXT,
+            FOREIGN KEY (feed_id) REFERENCES feeds(id)
+        );
+        CREATE TABLE reading_history (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            article_id INTEGER NOT NULL,
+            action TEXT NOT NULL,
+            timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            read_duration INTEGER,
+            FOREIGN KEY (article_id) REFERENCES articles(id)
+        );
+        CREATE INDEX idx_reading_history_article_id ON reading_history(article_id);
+        INSERT INTO feeds (id, url) VALUES (1, 'https://example.com/feed.xml');
+        INSERT INTO articles (id, feed_id, title, link)
+            VALUES (1, 1, 'Article', 'https://example.com/1');
+        INSERT INTO reading_history (article_id, action) VALUES (1, 'read');
+        """
+    )
+    conn.close()
+    return path
+
+
+@pytest.fixture(scope="session")
+def schema_template():
+    """Build the schema once into an in-memory database to copy from."""
+    template = get_connection(":memory:")
+    init_schema(template)
+    yield template
+    template.close()
+
+
+@pytest.fixture
+def conn(schema_template):
+    """Create a connection to an in-memory copy of the schema template."""
+    conn = get_connection(":memory:")
+    schema_template.backup(conn)
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def disk_conn(db_path):
+    """Create a connection to the temporary database file."""
     conn = get_connection(db_path)
     yield conn
     conn.close()
 
 
+@pytest.fixture
+def feed_id(conn):
+    """Add a feed to the test database."""
+    return add_feed(conn, "https://example.com/feed.xml")
+
+
+@pytest.fixture
+def article_id(conn, feed_id):
+    """Add an article to the test feed."""
+    return add_article(
+        conn, feed_id, "Article", "Content", "https://example.com/1", None
+    )
+
+
 class TestDatabaseInit:
     """Tests for database initialization."""
 
@@ -58,23 +151,9 @@ class TestDatabaseInit:
         """Test that init_db creates all required tables."""
         conn = get_connection(db_path)
         try:
-            # Check feeds table exists
-            cursor = conn.execute(
-                "SELECT name FROM sqlite_master WHERE type='table' AND name='feeds'"
-            )
-            assert cursor.fetchone() is not None
-
-            # Check articles table exists
-            cursor = conn.execute(
-                "SELECT name FROM sqlite_master WHERE type='table' AND name='articles'"
-            )
-            assert cursor.fetchone() is not None
-
-            # Check reading_history table exists
-            cursor = conn.execute(
-                "SELECT name FROM sqlite_master WHERE type='table' AND name='reading_history'"
-            )
-            assert cursor.fetchone() is not None
+            cursor = conn.execute("SELECT name FROM sqlite_master WHERE type='table'")
+            tables = {row["name"] for row in cursor.fetchall()}
+            assert {"feeds", "articles", "reading_history"} <= tables
         finally:
             conn.close()
 
@@ -87,6 +166,105 @@ class TestDatabaseInit:
             assert "idx_articles_feed_id" in indexes
             assert "idx_articles_link" in indexes
             assert "idx_articles_pub_date" in indexes
+            assert "idx_articles_pending" in indexes
+            assert "idx_reading_history_action" in indexes
+            assert "idx_articles_ingested" in indexes
+            assert "idx_articles_feed_pub_date" in indexes
+            assert "idx_articles_is_read" in indexes
+            assert "idx_reading_history_article_time" in indexes
+            assert "idx_reading_history_article_id" not in indexes
+        finally:
+            conn.close()
+
+    def test_feed_listing_avoids_sort(self, conn):
+        """Test that per-feed listings are read in order from the index."""
+        plan = conn.execute(
+            """
+            EXPLAIN QUERY PLAN
+            SELECT * FROM articles WHERE feed_id = ? ORDER BY pub_date DESC
+            """,
+            (1,),
+        ).fetchall()
+        details = " ".join(row["detail"] for row in plan)
+        assert "idx_articles_feed_pub_date" in details
+        assert "TEMP B-TREE" not in details
+
+    def test_unread_query_uses_is_read_index(self, conn):
+        """Test that unread listings come from the is_read index in order."""
+        plan = conn.execute(
+            """
+            EXPLAIN QUERY PLAN
+            SELECT * FROM articles WHERE is_read = 0 ORDER BY pub_date DESC
+            """
+        ).fetchall()
+        details = " ".join(row["detail"] for row in plan)
+        assert "idx_articles_is_read" in details
+        assert "TEMP B-TREE" not in details
+
+    def test_pending_query_uses_partial_index(self, conn):
+        """Test that the ingestion queue is read from the partial index."""
+        plan = conn.execute(
+            """
+            EXPLAIN QUERY PLAN
+            SELECT id FROM articles WHERE lightrag_id IS NULL ORDER BY pub_date DESC
+            """
+        ).fetchall()
+        details = " ".join(row["detail"] for row in plan)
+        assert "idx_articles_pending" in details
+        assert "TEMP B-TREE" not in details
+
+    def test_reading_history_queries_avoid_sort(self, conn):
+        """Test that history listings are read in timestamp order from indexes."""
+        for query, index in (
+            (
+                "SELECT * FROM reading_history WHERE article_id = 1 "
+                "ORDER BY timestamp DESC",
+                "idx_reading_history_article_time",
+            ),
+            (
+                "SELECT rh.*, a.title FROM reading_history rh "
+                "JOIN articles a ON rh.article_id = a.id "
+                "ORDER BY rh.timestamp DESC LIMIT 100",
+                "idx_reading_history_timestamp",
+            ),
+        ):
+            plan = conn.execute(f"EXPLAIN QUERY PLAN {query}").fetchall()
+            details = " ".join(row["detail"] for row in plan)
+            assert index in details
+            assert "TEMP B-TREE" not in details
+
+    def test_ingestion_counts_use_partial_indexes(self, conn):
+        """Test that pending and ingested counts skip the full table."""
+        for predicate, index in (
+            ("IS NULL", "idx_articles_pending"),
+            ("IS NOT NULL", "idx_articles_ingested"),
+        ):
+            plan = conn.execute(
+                "EXPLAIN QUERY PLAN "
+                f"SELECT COUNT(*) FROM articles WHERE lightrag_id {predicate}"
+            ).fetchall()
+            assert index in " ".join(row["detail"] for row in plan)
+
+    def test_connection_pragmas(self, disk_conn):
+        """Test that connections are tuned for WAL and relaxed syncing."""
+        assert disk_conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        # NORMAL == 1
+        assert disk_conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+        assert disk_conn.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+
+    def test_init_schema_analyzes_only_new_schema(self):
+        """Test that ANALYZE runs when the schema is created, not on re-init."""
+        conn = sqlite3.connect(":memory:", isolation_level=None)
+        try:
+            statements = []
+            conn.set_trace_callback(statements.append)
+            init_schema(conn)
+            assert "ANALYZE" in statements
+
+            statements.clear()
+            init_schema(conn)
+            assert "ANALYZE" not in statements
+            assert "PRAGMA optimize" in statements
         finally:
             conn.close()
 
@@ -97,6 +275,86 @@ class TestDatabaseInit:
         init_db(db_path)
 
 
+class TestTransaction:
+    """Tests for the transaction helper."""
+
+    def test_commits_on_success(self, db_path, disk_conn):
+        """Test that writes are visible to other connections after the block."""
+        with transaction(disk_conn):
+            add_feed(disk_conn, "https://example1.com/feed.xml")
+            add_feed(disk_conn, "https://example2.com/feed.xml")
+
+        other = get_connection(db_path)
+        try:
+            assert len(get_all_feeds(other)) == 2
+        finally:
+            other.close()
+
+    def test_rolls_back_on_error(self, conn):
+        """Test that an exception discards every write in the block."""
+        with pytest.raises(RuntimeError):
+            with transaction(conn):
+                add_feed(conn, "https://example.com/feed.xml")
+                raise RuntimeError("boom")
+
+        assert get_all_feeds(conn) == []
+        assert not conn.in_transaction
+
+    def test_nested_rollback_keeps_outer_writes(self, conn):
+        """Test that a failing nested block only undoes its own writes."""
+        with transaction(conn):
+            add_feed(conn, "https://example1.com/feed.xml")
+            with pytest.raises(RuntimeError):
+                with transaction(conn):
+                    add_feed(conn, "https://example2.com/feed.xml")
+                    raise RuntimeError("boom")
+
+        feeds = get_all_feeds(conn)
+        assert [f["url"] for f in feeds] == ["https://example1.com/feed.xml"]
+
+
+class TestConnectionPool:
+    """Tests for pooled connections."""
+
+    def test_get_db_connection_closes(self, db_path):
+        """Test that get_db_connection opens a private connection and closes it."""
+        with pooled_connection(db_path) as pooled:
+            pass
+        with get_db_connection(db_path) as conn:
+            assert conn is not pooled
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+
+    def test_reuses_connection(self, db_path):
+        """Test that the same thread gets the same connection back."""
+        with pooled_connection(db_path) as conn1:
+            pass
+        with pooled_connection(db_path) as conn2:
+            pass
+        assert conn1 is conn2
+
+    def test_reopens_recreated_database(self, db_path):
+        """Test that a deleted and recreated file gets a fresh connection."""
+        with pooled_connection(db_path) as conn1:
+            add_feed(conn1, "https://example.com/feed.xml")
+
+        db_path.unlink()
+        init_db(db_path)
+
+        with pooled_connection(db_path) as conn2:
+            assert conn2 is not conn1
+            assert get_all_feeds(conn2) == []
+
+    def test_close_all_connections(self, db_path):
+        """Test that closing the pool closes its connections."""
+        with pooled_connection(db_path) as conn:
+            pass
+        close_all_connections()
+
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+
+
 class TestFeedCRUD:
     """Tests for feed CRUD operations."""
 
@@ -123,6 +381,14 @@ class TestFeedCRUD:
         feed_id1 = add_feed(conn, "https://example.com/feed.xml", "Title 1")
         feed_id2 = add_feed(conn, "https://example.com/feed.xml", "Title 2")
         assert feed_id1 == feed_id2
+        assert get_feed(conn, feed_id1)["title"] == "Title 1"
+
+    def test_add_duplicate_feed_writes_nothing(self, conn):
+        """Test that a duplicate feed leaves total_changes unchanged."""
+        add_feed(conn, "https://example.com/feed.xml")
+        changes = conn.total_changes
+        add_feed(conn, "https://example.com/feed.xml")
+        assert conn.total_changes == changes
 
     def test_get_feed_by_url(self, conn):
         """Test getting a feed by URL."""
@@ -143,6 +409,7 @@ class TestFeedCRUD:
 
         feeds = get_all_feeds(conn)
         assert len(feeds) == 2
+        assert {f["title"] for f in feeds} == {"Feed 1", "Feed 2"}
 
     def test_get_all_feeds_active_only(self, conn):
         """Test getting only active feeds."""
@@ -189,13 +456,93 @@ class TestFeedCRUD:
         assert get_feed(conn, feed_id) is None
         assert len(get_articles_by_feed(conn, feed_id)) == 0
 
+    def test_delete_feed_cascades_to_history(self, conn):
+        """Test that deleting a feed removes its articles' reading history."""
+        feed_id = add_feed(conn, "https://example.com/feed.xml")
+        other_id = add_feed(conn, "https://other.com/feed.xml")
+        article_id = add_article(
+            conn, feed_id, "Article", "Content", "https://example.com/1", None
+        )
+        other_article = add_article(
+            conn, other_id, "Other", "Content", "https://other.com/1", None
+        )
+        add_reading_history(conn, article_id, "read")
+        add_reading_history(conn, other_article, "read")
+
+        delete_feed(conn, feed_id)
+
+        assert get_article(conn, article_id) is None
+        assert get_read_article_ids(conn) == [other_article]
+
+    def test_init_db_migrates_foreign_keys(self, baseline_db):
+        """Test that tables from before ON DELETE CASCADE are rebuilt."""
+        init_db(baseline_db)
+
+        conn = get_connection(baseline_db)
+        try:
+            assert get_article(conn, 1)["title"] == "Article"
+            # is_read was backfilled from the existing history
+            assert get_read_article_ids(conn) == [1]
+            delete_feed(conn, 1)
+            assert get_reading_history(conn, 1) == []
+            indexes = {
+                row["name"]
+                for row in conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type='index'"
+                )
+            }
+            assert "idx_reading_history_action" in indexes
+        finally:
+            conn.close()
+
+    def test_connection_migrates_old_database(self, baseline_db):
+        """Test that opening a database migrates it without init_db."""
+        conn = get_connection(baseline_db)
+        try:
+            assert get_stats(conn)["read_articles"] == 1
+            assert get_read_article_ids(conn) == [1]
+            foreign_keys = conn.execute("PRAGMA foreign_key_list(articles)").fetchall()
+            assert [fk["on_delete"] for fk in foreign_keys] == ["CASCADE"]
+            assert conn.execute("PRAGMA user_version").fetchone()[0] > 0
+        finally:
+            conn.close()
+
+    def test_delete_feed_without_cascade_foreign_keys(self, baseline_db):
+        """Test deleting a feed whose tables were never migrated."""
+        conn = sqlite3.connect(baseline_db, isolation_level=None)
+        try:
+            conn.execute("PRAGMA foreign_keys = ON")
+            delete_feed(conn, 1)
+            assert conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0] == 0
+            assert (
+                conn.execute("SELECT COUNT(*) FROM reading_history").fetchone()[0] == 0
+            )
+        finally:
+            conn.close()
+
+    def test_connection_enables_wal(self, baseline_db):
+        """Test a database created without WAL is switched to it on open."""
+        conn = get_connection(baseline_db)
+        try:
+            mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+            assert mode == "wal"
+        finally:
+            conn.close()
+
+    def test_connection_leaves_other_databases_alone(self, tmp_path):
+        """Test that a database without the articles table gets no schema."""
+        conn = get_connection(tmp_path / "cache.db")
+        try:
+            assert conn.execute("SELECT name FROM sqlite_master").fetchall() == []
+        finally:
+            conn.close()
+
 
 class TestArticleCRUD:
     """Tests for article CRUD operations."""
 
-    def test_add_and_get_article(self, conn):
+    def test_add_and_get_article(self, conn, feed_id):
         """Test adding and retrieving an article."""
-        feed_id = add_feed(conn, "https://example.com/feed.xml")
         pub_date = datetime(2025, 1, 1, 12, 0, 0)
 
         article_id = add_article(
@@ -216,19 +563,16 @@ class TestArticleCRUD:
         assert article["link"] == "https://example.com/article/1"
         assert article["feed_id"] == feed_id
 
-    def test_add_article_without_content(self, conn):
+    def test_add_article_without_content(self, conn, feed_id):
         """Test adding an article without content."""
-        feed_id = add_feed(conn, "https://example.com/feed.xml")
         article_id = add_article(
             conn, feed_id, "Title", None, "https://example.com/1", None
         )
         article = get_article(conn, article_id)
         assert article["content"] is None
 
-    def test_duplicate_article_link_handled(self, conn):
+    def test_duplicate_article_link_handled(self, conn, feed_id):
         """Test that duplicate article links return None."""
-        feed_id = add_feed(conn, "https://example.com/feed.xml")
-
         article_id1 = add_article(
             conn, feed_id, "Article 1", "Content", "https://example.com/1", None
         )
@@ -239,17 +583,83 @@ class TestArticleCRUD:
         assert article_id1 is not None
         assert article_id2 is None
 
-    def test_article_exists(self, conn):
+    def test_bulk_insert_articles(self, conn, feed_id):
+        """Test inserting many articles at once, skipping existing links."""
+        add_article(conn, feed_id, "Existing", None, "https://example.com/0", None)
+
+        inserted = bulk_insert_articles(
+            conn,
+            [
+                (feed_id, f"Article {i}", "Content", f"https://example.com/{i}", None)
+                for i in range(3)
+            ],
+        )
+
+        assert inserted == 2
+        assert len(get_articles_by_feed(conn, feed_id)) == 3
+        assert get_article_by_link(conn, "https://example.com/0")["title"] == (
+            "Existing"
+        )
+
+    def test_bulk_insert_articles_spans_chunks(self, conn, feed_id):
+        """Test that batches larger than one INSERT statement are all stored."""
+        rows = [
+            (feed_id, f"Article {i}", None, f"https://example.com/{i}", None)
+            for i in range(ARTICLE_INSERT_CHUNK * 2 + 1)
+        ]
+
+        assert bulk_insert_articles(conn, rows) == len(rows)
+        # Generators work too, and re-inserting skips everything
+        assert bulk_insert_articles(conn, (row for row in rows)) == 0
+
+    def test_bulk_insert_articles_empty(self, conn):
+        """Test that an empty batch inserts nothing."""
+        assert bulk_insert_articles(conn, []) == 0
+
+    def test_get_article_titles(self, conn, feed_id):
+        """Test fetching titles for several IDs at once."""
+        ids = [
+            add_article(conn, feed_id, f"Article {i}", None, f"https://e.com/{i}", None)
+            for i in range(3)
+        ]
+
+        rows = get_article_titles(conn, [ids[2], ids[0], 999])
+
+        assert [tuple(row) for row in rows] == [
+            (ids[0], "Article 0"),
+            (ids[2], "Article 2"),
+        ]
+        assert get_article_titles(conn, []) == []
+
+    def test_article_exists(self, conn, feed_id):
         """Test checking if an article exists."""
-        feed_id = add_feed(conn, "https://example.com/feed.xml")
         add_article(conn, feed_id, "Article", "Content", "https://example.com/1", None)
 
         assert article_exists(conn, "https://example.com/1") is True
         assert article_exists(conn, "https://example.com/2") is False
 
-    def test_get_article_by_link(self, conn):
+    def test_get_existing_links(self, conn, feed_id):
+        """Test looking up many links at once, across IN chunks."""
+        add_article(conn, feed_id, "A", None, "https://example.com/a", None)
+        add_article(conn, feed_id, "B", None, "https://example.com/b", None)
+        links = [f"https://example.com/{i}" for i in range(LINK_LOOKUP_CHUNK)]
+        links += ["https://example.com/a", "https://example.com/b"]
+
+        assert get_existing_links(conn, links) == {
+            "https://example.com/a",
+            "https://example.com/b",
+        }
+        assert get_existing_links(conn, []) == set()
+
+    def test_get_existing_links_escapes_json(self, conn, feed_id):
+        """Test that links needing JSON escaping are matched exactly."""
+        link = 'https://example.com/"quoted"\\path?q=ü'
+        add_article(conn, feed_id, "A", None, link, None)
+
+        assert get_existing_links(conn, [link, "https://example.com/x"]) == {link}
+
+    def test_get_article_by_link(self, conn, feed_id):
         """Test getting an article by its link."""
-        feed_id = add_feed(conn, "https://example.com/feed.xml")
         add_article(
             conn, feed_id, "Test Article", "Content", "https://example.com/1", None
         )
@@ -258,57 +668,72 @@ class TestArticleCRUD:
         assert article is not None
         assert article["title"] == "Test Article"
 
-    def test_get_articles_by_feed(self, conn):
+    def test_get_articles_by_feed(self, conn, feed_id):
         """Test getting articles for a specific feed."""
-        feed_id = add_feed(conn, "https://example.com/feed.xml")
-
-        for i in range(5):
-            add_article(
-                conn,
-                feed_id,
-                f"Article {i}",
-                "Content",
-                f"https://example.com/{i}",
-                datetime(2025, 1, i + 1),
-            )
+        bulk_insert_articles(
+            conn,
+            [
+                (
+                    feed_id,
+                    f"Article {i}",
+                    "Content",
+                    f"https://example.com/{i}",
+                    datetime(2025, 1, i + 1),
+                )
+                for i in range(5)
+            ],
+        )
 
         articles = get_articles_by_feed(conn, feed_id, limit=3)
         assert len(articles) == 3
 
     def test_get_unread_articles(self, conn):
         """Test getting unread articles."""
-        feed_id = add_feed(conn, "https://example.com/feed.xml")
+        with transaction(conn):
+            feed_id = add_feed(conn, "https://example.com/feed.xml")
 
-        article_id1 = add_article(
-            conn, feed_id, "Article 1", "Content", "https://example.com/1", None
-        )
-        add_article(
-            conn, feed_id, "Article 2", "Content", "https://example.com/2", None
-        )
+            article_id1 = add_article(
+                conn, feed_id, "Article 1", "Content", "https://example.com/1", None
+            )
+            add_article(
+                conn, feed_id, "Article 2", "Content", "https://example.com/2", None
+            )
 
-        # Mark first article as read
-        add_reading_history(conn, article_id1, "read")
+            # Mark first article as read
+            add_reading_history(conn, article_id1, "read")
 
         unread = get_unread_articles(conn)
         assert len(unread) == 1
         assert unread[0]["title"] == "Article 2"
 
-    def test_update_article_lightrag_id(self, conn):
+    def test_update_article_lightrag_id(self, conn, article_id):
         """Test updating article's LightRAG ID."""
-        feed_id = add_feed(conn, "https://example.com/feed.xml")
-        article_id = add_article(
-            conn, feed_id, "Article", "Content", "https://example.com/1", None
-        )
-
         update_article_lightrag_id(conn, article_id, "lightrag-123")
 
         article = get_article(conn, article_id)
         assert article["lightrag_id"] == "lightrag-123"
 
-    def test_get_articles_without_lightrag_id(self, conn):
-        """Test getting articles without LightRAG ID."""
-        feed_id = add_feed(conn, "https://example.com/feed.xml")
+    def test_update_article_lightrag_ids(self, conn, feed_id):
+        """Test updating several LightRAG IDs at once."""
+        article_ids = [
+            add_article(
+                conn, feed_id, f"Article {i}", None, f"https://example.com/{i}", None
+            )
+            for i in range(3)
+        ]
+
+        updated = update_article_lightrag_ids(
+            conn, [(f"lightrag-{i}", i) for i in article_ids[:2]]
+        )
 
+        assert updated == 2
+        assert get_article(conn, article_ids[0])["lightrag_id"] == (
+            f"lightrag-{article_ids[0]}"
+        )
+        assert get_article(conn, article_ids[2])["lightrag_id"] is None
+
+    def test_get_articles_without_lightrag_id(self, conn, feed_id):
+        """Test getting articles without LightRAG ID."""
         article_id1 = add_article(
             conn, feed_id, "Article 1", "Content", "https://example.com/1", None
         )
@@ -326,43 +751,56 @@ class TestArticleCRUD:
         """Test getting recent articles."""
         feed_id = add_feed(conn, "https://example.com/feed.xml", "My Feed")
 
-        for i in range(3):
+        bulk_insert_articles(
+            conn,
+            [
+                (
+                    feed_id,
+                    f"Article {i}",
+                    "Content",
+                    f"https://example.com/{i}",
+                    datetime(2025, 1, i + 1),
+                )
+                for i in range(3)
+            ],
+        )
+
+        articles = get_recent_articles(conn, limit=2)
+        assert len(articles) == 2
+        # Should include feed_title
+        assert articles[0]["feed_title"] == "My Feed"
+
+    def test_iter_articles_without_limit(self, conn):
+        """Test streaming every article of a feed from the cursor."""
+        feed_id = add_feed(conn, "https://example.com/feed.xml", "My Feed")
+        for i in range(60):
             add_article(
                 conn,
                 feed_id,
                 f"Article {i}",
-                "Content",
+                None,
                 f"https://example.com/{i}",
-                datetime(2025, 1, i + 1),
+                datetime(2025, 1, 1, 0, i),
             )
 
-        articles = get_recent_articles(conn, limit=2)
-        assert len(articles) == 2
-        # Should include feed_title
-        assert articles[0]["feed_title"] == "My Feed"
+        rows = iter_articles_by_feed(conn, feed_id)
+
+        assert next(rows)["title"] == "Article 59"
+        assert sum(1 for _ in rows) == 59
+        assert len(list(iter_recent_articles(conn, limit=10))) == 10
 
 
 class TestReadingHistory:
     """Tests for reading history operations."""
 
-    def test_add_reading_history(self, conn):
+    def test_add_reading_history(self, conn, article_id):
         """Test adding reading history."""
-        feed_id = add_feed(conn, "https://example.com/feed.xml")
-        article_id = add_article(
-            conn, feed_id, "Article", "Content", "https://example.com/1", None
-        )
-
         history_id = add_reading_history(conn, article_id, "read", 120)
         assert history_id is not None
         assert history_id > 0
 
-    def test_get_reading_history(self, conn):
+    def test_get_reading_history(self, conn, article_id):
         """Test getting reading history for an article."""
-        feed_id = add_feed(conn, "https://example.com/feed.xml")
-        article_id = add_article(
-            conn, feed_id, "Article", "Content", "https://example.com/1", None
-        )
-
         add_reading_history(conn, article_id, "read", 120)
         add_reading_history(conn, article_id, "saved")
 
@@ -371,33 +809,73 @@ class TestReadingHistory:
 
     def test_get_read_article_ids(self, conn):
         """Test getting IDs of read articles."""
-        feed_id = add_feed(conn, "https://example.com/feed.xml")
+        with transaction(conn):
+            feed_id = add_feed(conn, "https://example.com/feed.xml")
 
-        article_id1 = add_article(
-            conn, feed_id, "Article 1", "Content", "https://example.com/1", None
-        )
-        article_id2 = add_article(
-            conn, feed_id, "Article 2", "Content", "https://example.com/2", None
-        )
-        add_article(
-            conn, feed_id, "Article 3", "Content", "https://example.com/3", None
-        )
+            article_id1 = add_article(
+                conn, feed_id, "Article 1", "Content", "https://example.com/1", None
+            )
+            article_id2 = add_article(
+                conn, feed_id, "Article 2", "Content", "https://example.com/2", None
+            )
+            add_article(
+                conn, feed_id, "Article 3", "Content", "https://example.com/3", None
+            )
 
-        add_reading_history(conn, article_id1, "read")
-        add_reading_history(conn, article_id2, "read")
+            add_reading_history(conn, article_id1, "read")
+            add_reading_history(conn, article_id2, "read")
 
         read_ids = get_read_article_ids(conn)
         assert len(read_ids) == 2
         assert article_id1 in read_ids
         assert article_id2 in read_ids
 
-    def test_reading_history_with_duration(self, conn):
-        """Test reading history with read duration."""
-        feed_id = add_feed(conn, "https://example.com/feed.xml")
+    def test_only_read_action_sets_is_read(self, conn, feed_id):
+        """Test that the trigger flags articles on 'read' entries only."""
+        opened = add_article(conn, feed_id, "Opened", None, "https://e.com/1", None)
+        read = add_article(conn, feed_id, "Read", None, "https://e.com/2", None)
+
+        add_reading_history(conn, opened, "opened")
+        add_reading_history(conn, read, "read")
+        add_reading_history(conn, read, "read")
+
+        assert get_article(conn, opened)["is_read"] == 0
+        assert get_article(conn, read)["is_read"] == 1
+        assert [a["id"] for a in get_unread_articles(conn)] == [opened]
+
+    def test_get_unread_article_summaries(self, conn, feed_id):
+        """Test that unread summaries leave out article content."""
         article_id = add_article(
-            conn, feed_id, "Article", "Content", "https://example.com/1", None
+            conn, feed_id, "Article", "<p>Long body</p>", "https://e.com/1", None
+        )
+
+        summaries = get_unread_article_summaries(conn)
+
+        assert len(summaries) == 1
+        assert summaries[0].keys() == ["id", "title", "link", "pub_date"]
+        assert summaries[0]["id"] == article_id
+
+    def test_add_reading_history_batch(self, conn, feed_id):
+        """Test logging several events in one call."""
+        article_id = add_article(
+            conn, feed_id, "Article", None, "https://example.com/1", None
+        )
+
+        added = add_reading_history_batch(
+            conn,
+            [
+                (article_id, "opened", None),
+                (article_id, "read", 120),
+                (article_id, "starred", None),
+            ],
         )
 
+        assert added == 3
+        assert len(get_reading_history(conn, article_id)) == 3
+        assert get_read_article_ids(conn) == [article_id]
+
+    def test_reading_history_with_duration(self, conn, article_id):
+        """Test reading history with read duration."""
         add_reading_history(conn, article_id, "read", read_duration=300)
 
         history = get_reading_history(conn, article_id)
@@ -418,23 +896,23 @@ class TestStats:
 
     def test_get_stats(self, conn):
         """Test getting statistics."""
-        # Add some data
-        feed_id1 = add_feed(conn, "https://example1.com/feed.xml")
-        feed_id2 = add_feed(conn, "https://example2.com/feed.xml")
-        deactivate_feed(conn, feed_id2)
+        with transaction(conn):
+            feed_id1 = add_feed(conn, "https://example1.com/feed.xml")
+            feed_id2 = add_feed(conn, "https://example2.com/feed.xml")
+            deactivate_feed(conn, feed_id2)
 
-        article_id1 = add_article(
-            conn, feed_id1, "Article 1", "Content", "https://example.com/1", None
-        )
-        article_id2 = add_article(
-            conn, feed_id1, "Article 2", "Content", "https://example.com/2", None
-        )
-        add_article(
-            conn, feed_id1, "Article 3", "Content", "https://example.com/3", None
-        )
+            article_id1 = add_article(
+                conn, feed_id1, "Article 1", "Content", "https://example.com/1", None
+            )
+            article_id2 = add_article(
+                conn, feed_id1, "Article 2", "Content", "https://example.com/2", None
+            )
+            add_article(
+                conn, feed_id1, "Article 3", "Content", "https://example.com/3", None
+            )
 
-        update_article_lightrag_id(conn, article_id1, "lightrag-1")
-        add_reading_history(conn, article_id2, "read")
+            update_article_lightrag_id(conn, article_id1, "lightrag-1")
+            add_reading_history(conn, article_id2, "read")
 
         stats = get_stats(conn)
         assert stats["total_feeds"] == 2
@@ -443,3 +921,40 @@ class TestStats:
         assert stats["indexed_articles"] == 1
         assert stats["read_articles"] == 1
         assert stats["unread_articles"] == 2
+
+
+class TestQueryCache:
+    """Tests for cached aggregate queries."""
+
+    def test_reuses_result_until_write(self, conn):
+        """Test that repeat calls skip the query until this connection writes."""
+        statements = []
+        conn.set_trace_callback(statements.append)
+
+        get_stats(conn)
+        get_stats(conn)
+        assert sum("COUNT(" in s for s in statements) == 1
+
+        add_feed(conn, "https://example.com/feed.xml")
+        assert get_stats(conn)["total_feeds"] == 1
+
+    def test_sees_writes_from_other_connections(self, db_path, disk_conn):
+        """Test that a commit on another connection invalidates the cache."""
+        feed_id = add_feed(disk_conn, "https://example.com/feed.xml")
+        article_id = add_article(
+            disk_conn, feed_id, "Article", None, "https://example.com/1", None
+        )
+        assert get_read_article_ids(disk_conn) == []
+
+        other = get_connection(db_path)
+        try:
+            add_reading_history(other, article_id, "read")
+        finally:
+            other.close()
+
+        assert get_read_article_ids(disk_conn) == [article_id]
+
+    def test_returns_copies(self, conn):
+        """Test that mutating a result does not corrupt the cache."""
+        get_stats(conn)["total_feeds"] = 99
+        assert get_stats(conn)["total_feeds"] == 0
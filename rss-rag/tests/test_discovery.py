@@ -1,9 +1,7 @@
 """Tests for discovery module."""
 
 import pytest
-from pathlib import Path
-from unittest.mock import patch, MagicMock, AsyncMock
-import tempfile
+from unittest.mock import MagicMock, AsyncMock
 
 from rss_rag.discovery import (
     Recommendation,
@@ -16,40 +14,50 @@ from rss_rag.database import (
     get_connection,
     add_feed,
     add_article,
+    bulk_insert_articles,
     add_reading_history,
+    transaction,
 )
 
 
-@pytest.fixture
-def db_path():
-    """Create a temporary database with test data."""
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        path = Path(f.name)
+@pytest.fixture(scope="module")
+def db_path(tmp_path_factory):
+    """Create a temporary database with test data.
+
+    Discovery only reads, so the tests of this module share one database.
+    """
+    path = tmp_path_factory.mktemp("discovery") / "test.db"
     init_db(path)
 
     # Add test data
     conn = get_connection(path)
-    feed_id = add_feed(conn, "https://example.com/feed", "Test Feed")
+    # Seeding doesn't need to survive a crash
+    conn.execute("PRAGMA synchronous = OFF")
+    with transaction(conn):
+        feed_id = add_feed(conn, "https://example.com/feed", "Test Feed")
 
-    # Add articles
-    for i in range(5):
-        add_article(
+        # Add articles
+        bulk_insert_articles(
             conn,
-            feed_id,
-            title=f"Test Article {i+1}",
-            content=f"Content for article {i+1}",
-            link=f"https://example.com/article{i+1}",
-            pub_date=None,
+            [
+                (
+                    feed_id,
+                    f"Test Article {i}",
+                    f"Content for article {i}",
+                    f"https://example.com/article{i}",
+                    None,
+                )
+                for i in range(1, 6)
+            ],
         )
 
-    # Mark some as read
-    add_reading_history(conn, 1, "read")
-    add_reading_history(conn, 2, "read")
+        # Mark some as read
+        add_reading_history(conn, 1, "read")
+        add_reading_history(conn, 2, "read")
 
     conn.close()
 
-    yield path
-    path.unlink()
+    return path
 
 
 class TestRecommendation:
@@ -117,29 +125,31 @@ class TestFormatDiscoveryResult:
 
 
 class TestDiscoverArticles:
-    @patch("rss_rag.discovery.get_lightrag_instance")
-    @patch("rss_rag.discovery.get_discovery_llm")
-    def test_returns_recommendations(self, mock_llm, mock_rag, db_path):
+    def test_returns_recommendations(self, monkeypatch, db_path):
         # Mock LLM
         mock_llm_instance = MagicMock()
         mock_llm_instance.ainvoke = AsyncMock(
             return_value=MagicMock(content="Interested in tech")
         )
-        mock_llm.return_value = mock_llm_instance
+        monkeypatch.setattr(
+            "rss_rag.discovery.get_discovery_llm", lambda: mock_llm_instance
+        )
 
         # Mock RAG
         mock_rag_instance = MagicMock()
         mock_rag_instance.aquery = AsyncMock(return_value="Related articles found")
-        mock_rag.return_value = mock_rag_instance
+        monkeypatch.setattr(
+            "rss_rag.discovery.get_lightrag_instance_async",
+            AsyncMock(return_value=mock_rag_instance),
+        )
 
         result = discover_articles(db_path, limit=3)
 
         assert result.error is None
         assert len(result.recommendations) <= 3
 
-    def test_handles_no_reading_history(self):
-        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-            path = Path(f.name)
+    def test_handles_no_reading_history(self, tmp_path):
+        path = tmp_path / "test.db"
         init_db(path)
 
         # Add articles but no reading history
@@ -152,5 +162,3 @@ class TestDiscoverArticles:
 
         # Should still return unread articles
         assert result.error is None
-
-        path.unlink()
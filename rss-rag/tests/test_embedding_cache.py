@@ -0,0 +1,93 @@
+"""Tests for embedding cache module."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import numpy as np
+import pytest
+
+from rss_rag.background_loop import run_sync
+from rss_rag.embedding_cache import EmbeddingCache
+
+
+def fake_embed():
+    """Async embedding function returning [len(text), 1.0] per text."""
+    return AsyncMock(
+        side_effect=lambda texts, **kwargs: np.array([[len(t), 1.0] for t in texts])
+    )
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return tmp_path / "embedding_cache.db"
+
+
+class TestEmbeddingCache:
+    """Tests for EmbeddingCache."""
+
+    def test_only_misses_are_embedded(self, cache_path):
+        """Should call the wrapped function for uncached texts only."""
+        cache = EmbeddingCache(cache_path, model="test-model")
+        embed = fake_embed()
+        cached_embed = cache.wrap(embed)
+
+        asyncio.run(cached_embed(["a", "bb"]))
+        result = asyncio.run(cached_embed(["bb", "ccc", "ccc"]))
+
+        assert embed.call_args_list[1].args[0] == ["ccc"]
+        np.testing.assert_array_equal(result, [[2, 1], [3, 1], [3, 1]])
+        assert result.dtype == np.float32
+
+    def test_empty_input(self, cache_path):
+        """Should return an empty (0, dim) array without calling the function."""
+        cache = EmbeddingCache(cache_path, model="test-model")
+        embed = fake_embed()
+
+        result = asyncio.run(cache.wrap(embed, dim=2)([]))
+
+        assert result.shape == (0, 2)
+        assert result.dtype == np.float32
+        embed.assert_not_called()
+
+    def test_persists_across_instances(self, cache_path):
+        """Should serve vectors stored by an earlier cache from disk."""
+        first = EmbeddingCache(cache_path, model="test-model")
+        asyncio.run(first.wrap(fake_embed())(["hello"]))
+
+        embed = fake_embed()
+        second = EmbeddingCache(cache_path, model="test-model")
+        result = asyncio.run(second.wrap(embed)(["hello"]))
+
+        embed.assert_not_awaited()
+        np.testing.assert_array_equal(result, [[5, 1]])
+
+    def test_shared_across_threads(self, cache_path):
+        """Should serve one cache from the caller's and the background loop."""
+        cache = EmbeddingCache(cache_path, model="test-model", max_entries=0)
+        embed = fake_embed()
+        cached_embed = cache.wrap(embed)
+
+        asyncio.run(cached_embed(["hello"]))
+        result = run_sync(cached_embed(["hello"]))
+
+        embed.assert_awaited_once()
+        np.testing.assert_array_equal(result, [[5, 1]])
+
+    def test_models_do_not_share_entries(self, cache_path):
+        """Should key vectors by model name."""
+        first = EmbeddingCache(cache_path, model="model-a")
+        asyncio.run(first.wrap(fake_embed())(["hello"]))
+
+        embed = fake_embed()
+        second = EmbeddingCache(cache_path, model="model-b")
+        asyncio.run(second.wrap(embed)(["hello"]))
+
+        embed.assert_awaited_once()
+
+    def test_memory_cache_is_bounded(self, cache_path):
+        """Should evict the least recently used vectors from memory."""
+        cache = EmbeddingCache(cache_path, model="test-model", max_entries=2)
+
+        asyncio.run(cache.wrap(fake_embed())(["a", "bb", "ccc"]))
+
+        assert len(cache._lru) == 2
@@ -10,11 +10,17 @@ from rss_rag.embeddings import (
     get_embedding_model,
     clear_embedding_cache,
 )
-from rss_rag.config import Config, EmbeddingsConfig, set_config
+from rss_rag.config import Config, EmbeddingsConfig
 
 
 class TestSentenceTransformerEmbeddings:
-    @patch("sentence_transformers.SentenceTransformer")
+    @pytest.fixture
+    def mock_st(self, monkeypatch):
+        """Replace the SentenceTransformer class with a mock."""
+        mock_st = MagicMock()
+        monkeypatch.setattr("sentence_transformers.SentenceTransformer", mock_st)
+        return mock_st
+
     def test_initialization(self, mock_st):
         mock_model = MagicMock()
         mock_model.get_sentence_embedding_dimension.return_value = 384
@@ -25,7 +31,38 @@ class TestSentenceTransformerEmbeddings:
         assert embeddings.model_name == "all-MiniLM-L6-v2"
         assert embeddings.dimension == 384
 
-    @patch("sentence_transformers.SentenceTransformer")
+    def test_half_precision_on_cuda(self, mock_st):
+        mock_model = mock_st.return_value
+        mock_model.device.type = "cuda"
+
+        SentenceTransformerEmbeddings()
+
+        mock_model.half.assert_called_once()
+
+    def test_full_precision_on_cpu(self, mock_st):
+        mock_model = mock_st.return_value
+        mock_model.device.type = "cpu"
+
+        SentenceTransformerEmbeddings()
+
+        mock_model.half.assert_not_called()
+
+    def test_quantized_onnx_backend(self, mock_st):
+        mock_st.return_value.get_sentence_embedding_dimension.return_value = 384
+
+        embeddings = SentenceTransformerEmbeddings(
+            "all-MiniLM-L6-v2",
+            backend="onnx",
+            model_file="onnx/model_qint8_avx512_vnni.onnx",
+        )
+
+        mock_st.assert_called_once_with(
+            "all-MiniLM-L6-v2",
+            backend="onnx",
+            model_kwargs={"file_name": "onnx/model_qint8_avx512_vnni.onnx"},
+        )
+        assert embeddings.dimension == 384
+
     def test_encode(self, mock_st):
         mock_model = MagicMock()
         mock_model.get_sentence_embedding_dimension.return_value = 384
@@ -36,6 +73,24 @@ class TestSentenceTransformerEmbeddings:
         result = embeddings.encode(["text1", "text2"])
 
         assert result.shape == (2, 384)
+        mock_model.encode.assert_called_once_with(
+            ["text1", "text2"],
+            batch_size=32,
+            convert_to_numpy=True,
+            show_progress_bar=False,
+        )
+
+    def test_truncates_long_text(self, mock_st):
+        mock_model = mock_st.return_value
+        mock_model.max_seq_length = 3
+        mock_model.tokenizer.side_effect = lambda text, **kwargs: {
+            "input_ids": text.split()
+        }
+
+        embeddings = SentenceTransformerEmbeddings()
+
+        assert not embeddings.truncates("one two three")
+        assert embeddings.truncates("one two three four")
 
 
 class TestOpenAIEmbeddings:
@@ -49,29 +104,44 @@ class TestOpenAIEmbeddings:
         assert embeddings.model_name == "text-embedding-3-small"
         assert embeddings.dimension == 1536
 
+    @patch("langchain_openai.OpenAIEmbeddings")
+    def test_encode_returns_float32(self, mock_openai):
+        mock_openai.return_value.embed_documents.return_value = [[0.1, 0.2], [0.3, 0.4]]
+        mock_openai.return_value.embed_query.return_value = [0.5, 0.6]
+
+        embeddings = OpenAIEmbeddings("text-embedding-3-small")
+        batch = embeddings.encode(["a", "b"])
+        single = embeddings.encode_single("c")
+
+        assert batch.shape == (2, 2)
+        assert batch.dtype == np.float32
+        assert single.dtype == np.float32
+
 
 class TestGetEmbeddingModel:
+    @pytest.fixture(autouse=True)
+    def clear_model(self):
+        """Keep patched models from leaking between tests."""
+        clear_embedding_cache()
+        yield
+        clear_embedding_cache()
+
     @patch("sentence_transformers.SentenceTransformer")
     def test_get_sentence_transformers_model(self, mock_st):
-        clear_embedding_cache()
         config = Config(embeddings=EmbeddingsConfig(provider="sentence-transformers"))
-        set_config(config)
 
         mock_model = MagicMock()
         mock_model.get_sentence_embedding_dimension.return_value = 384
         mock_st.return_value = mock_model
 
-        model = get_embedding_model()
+        with patch("rss_rag.embeddings.get_config", return_value=config):
+            model = get_embedding_model()
 
         assert isinstance(model, SentenceTransformerEmbeddings)
 
-        clear_embedding_cache()
-
     @patch.object(EmbeddingsConfig, "__init__", lambda self, **kwargs: None)
     def test_unsupported_provider_raises(self):
         """Test that unsupported provider raises ValueError."""
-        clear_embedding_cache()
-
         # Create a config with mocked unsupported provider
         config = MagicMock()
         config.embeddings = MagicMock()
@@ -80,5 +150,3 @@ class TestGetEmbeddingModel:
         with patch("rss_rag.embeddings.get_config", return_value=config):
             with pytest.raises(ValueError, match="Unsupported embedding provider"):
                 get_embedding_model()
-
-        clear_embedding_cache()
@@ -1,7 +1,6 @@
 """Tests for error handling module."""
 
 import pytest
-from unittest.mock import MagicMock, patch
 import asyncio
 
 from rss_rag.errors import (
@@ -14,6 +13,17 @@ from rss_rag.errors import (
 )
 
 
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    """Skip retry backoff delays."""
+
+    async def async_no_sleep(*args):
+        pass
+
+    monkeypatch.setattr("time.sleep", lambda *args: None)
+    monkeypatch.setattr("asyncio.sleep", async_no_sleep)
+
+
 class TestCustomExceptions:
     def test_base_exception(self):
         with pytest.raises(RSSRAGError):
@@ -46,8 +56,7 @@ class TestHandleApiError:
                 raise Exception("Rate limit exceeded")
             return "success"
 
-        with patch("time.sleep"):  # Skip actual sleep
-            result = rate_limited()
+        result = rate_limited()
 
         assert result == "success"
         assert len(attempts) == 2
@@ -57,9 +66,8 @@ class TestHandleApiError:
         def always_fails():
             raise Exception("Rate limit exceeded")
 
-        with patch("time.sleep"):
-            with pytest.raises(LLMError):
-                always_fails()
+        with pytest.raises(LLMError):
+            always_fails()
 
     def test_non_retryable_error(self):
         @handle_api_error
@@ -68,3 +76,54 @@ class TestHandleApiError:
 
         with pytest.raises(LLMError, match="Authentication failed"):
             auth_error()
+
+    def test_retries_on_status_code(self):
+        attempts = []
+
+        class ServiceError(Exception):
+            status_code = 503
+
+        @handle_api_error
+        def unavailable():
+            attempts.append(1)
+            if len(attempts) < 2:
+                raise ServiceError("upstream busy")
+            return "success"
+
+        assert unavailable() == "success"
+        assert len(attempts) == 2
+
+    def test_typed_client_errors_skip_message_scan(self):
+        import httpx
+        import openai
+
+        attempts = []
+        response = httpx.Response(401, request=httpx.Request("POST", "https://x"))
+
+        @handle_api_error
+        def auth_error():
+            attempts.append(1)
+            raise openai.AuthenticationError(
+                "token timeout", response=response, body=None
+            )
+
+        with pytest.raises(LLMError):
+            auth_error()
+        assert len(attempts) == 1
+
+    def test_async_retries_on_rate_limit_error(self):
+        import httpx
+        import openai
+
+        attempts = []
+        response = httpx.Response(429, request=httpx.Request("POST", "https://x"))
+
+        @handle_api_error_async
+        async def rate_limited():
+            attempts.append(1)
+            if len(attempts) < 2:
+                raise openai.RateLimitError("slow down", response=response, body=None)
+            return "success"
+
+        assert asyncio.run(rate_limited()) == "success"
+        assert len(attempts) == 2
@@ -1,10 +1,12 @@
 """Tests for feed_manager module."""
 
+import asyncio
 import pytest
 from pathlib import Path
 from datetime import datetime
-from unittest.mock import patch, MagicMock
-import tempfile
+from unittest.mock import MagicMock
+import threading
+from types import SimpleNamespace
 
 from rss_rag.feed_manager import (
     parse_feeds_file,
@@ -12,39 +14,46 @@ from rss_rag.feed_manager import (
     extract_content,
     fetch_feed,
     fetch_and_store_feed,
+    fetch_all_feeds,
     import_feeds_from_file,
+    store_feed_articles,
     Article,
 )
 from rss_rag.database import (
-    init_db,
+    add_feed,
     get_connection,
     get_all_feeds,
     get_articles_by_feed,
+    pooled_connection,
 )
 
 
 @pytest.fixture
-def temp_feeds_file():
+def temp_feeds_file(tmp_path):
     """Create a temporary feeds file."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-        f.write("# Comment line\n")
-        f.write("https://example.com/feed1.xml\n")
-        f.write("\n")  # Empty line
-        f.write("https://example.com/feed2.xml\n")
-        f.write("# Another comment\n")
-        path = Path(f.name)
-    yield path
-    path.unlink()
+    path = tmp_path / "feeds.txt"
+    path.write_text(
+        "# Comment line\n"
+        "https://example.com/feed1.xml\n"
+        "\n"  # Empty line
+        "https://example.com/feed2.xml\n"
+        "# Another comment\n"
+    )
+    return path
 
 
 @pytest.fixture
-def db_path():
+def db_path(db_file):
     """Create a temporary database."""
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        path = Path(f.name)
-    init_db(path)
-    yield path
-    path.unlink()
+    return db_file
+
+
+@pytest.fixture
+def mock_parse(monkeypatch):
+    """Replace feedparser.parse with a mock."""
+    mock_parse = MagicMock()
+    monkeypatch.setattr("rss_rag.feed_manager.feedparser.parse", mock_parse)
+    return mock_parse
 
 
 class TestParseFeedsFile:
@@ -65,49 +74,44 @@ class TestParseFeedsFile:
 
 class TestParsePubDate:
     def test_parses_published_parsed(self):
-        entry = MagicMock()
-        entry.get = lambda k, d=None: (
-            (2024, 1, 15, 12, 0, 0, 0, 0, 0) if k == "published_parsed" else None
-        )
+        entry = {"published_parsed": (2024, 1, 15, 12, 0, 0, 0, 0, 0)}
         result = parse_pub_date(entry)
         assert isinstance(result, datetime)
         assert result.year == 2024
         assert result.month == 1
         assert result.day == 15
 
+    def test_falls_back_to_updated_parsed(self):
+        entry = {"updated_parsed": (2024, 3, 10, 2, 30, 15, 6, 70, 0)}
+        assert parse_pub_date(entry) == datetime(2024, 3, 10, 2, 30, 15)
+
     def test_handles_missing_date(self):
-        entry = MagicMock()
-        entry.get = lambda k, d=None: None
+        entry = {}
         result = parse_pub_date(entry)
         assert result is None
 
 
 class TestExtractContent:
-    def test_extracts_from_content_field(self):
-        entry = {"content": [{"type": "text/html", "value": "<p>Hello</p>"}]}
-        result = extract_content(entry)
-        assert result == "<p>Hello</p>"
-
-    def test_fallback_to_summary(self):
-        entry = {"summary": "Summary text"}
-        result = extract_content(entry)
-        assert result == "Summary text"
-
-    def test_fallback_to_description(self):
-        entry = {"description": "Description text"}
-        result = extract_content(entry)
-        assert result == "Description text"
-
-    def test_returns_none_if_no_content(self):
-        entry = {}
-        result = extract_content(entry)
-        assert result is None
+    @pytest.mark.parametrize(
+        "entry, expected",
+        [
+            (
+                {"content": [{"type": "text/html", "value": "<p>Hello</p>"}]},
+                "<p>Hello</p>",
+            ),
+            ({"summary": "Summary text"}, "Summary text"),
+            ({"description": "Description text"}, "Description text"),
+            ({}, None),
+        ],
+        ids=["content", "summary", "description", "none"],
+    )
+    def test_extract_content(self, entry, expected):
+        assert extract_content(entry) == expected
 
 
 class TestFetchFeed:
-    @patch("rss_rag.feed_manager.feedparser.parse")
     def test_fetches_and_parses_articles(self, mock_parse):
-        mock_parse.return_value = MagicMock(
+        mock_parse.return_value = SimpleNamespace(
             bozo=False,
             feed={"title": "Test Feed"},
             entries=[
@@ -133,9 +137,8 @@ class TestFetchFeed:
         assert articles[0].link == "https://example.com/article1"
         assert error is None
 
-    @patch("rss_rag.feed_manager.feedparser.parse")
     def test_handles_bozo_error(self, mock_parse):
-        mock_parse.return_value = MagicMock(
+        mock_parse.return_value = SimpleNamespace(
             bozo=True,
             bozo_exception=Exception("Parse error"),
             feed={},
@@ -150,9 +153,8 @@ class TestFetchFeed:
 
 
 class TestFetchAndStoreFeed:
-    @patch("rss_rag.feed_manager.feedparser.parse")
     def test_stores_articles_in_database(self, mock_parse, db_path):
-        mock_parse.return_value = MagicMock(
+        mock_parse.return_value = SimpleNamespace(
             bozo=False,
             feed={"title": "Test Feed"},
             entries=[
@@ -181,9 +183,8 @@ class TestFetchAndStoreFeed:
         assert articles[0]["title"] == "Article 1"
         conn.close()
 
-    @patch("rss_rag.feed_manager.feedparser.parse")
     def test_skips_duplicate_articles(self, mock_parse, db_path):
-        mock_parse.return_value = MagicMock(
+        mock_parse.return_value = SimpleNamespace(
             bozo=False,
             feed={"title": "Test Feed"},
             entries=[
@@ -202,6 +203,108 @@ class TestFetchAndStoreFeed:
         assert result1.articles_new == 1
         assert result2.articles_new == 0  # Already exists
 
+    def test_stores_feed_in_one_commit(self, db_path):
+        feed_url = "https://example.com/feed"
+        articles = [
+            Article(f"Article {i}", None, f"https://example.com/{i}", None, feed_url)
+            for i in range(5)
+        ]
+        statements = []
+        with pooled_connection(db_path) as conn:
+            conn.set_trace_callback(statements.append)
+
+        try:
+            result = store_feed_articles(db_path, feed_url, "Test Feed", articles)
+        finally:
+            with pooled_connection(db_path) as conn:
+                conn.set_trace_callback(None)
+
+        assert result.articles_new == 5
+        assert sum(s.startswith("COMMIT") for s in statements) == 1
+
+
+class TestFetchAllFeeds:
+    def test_fetches_every_feed(self, mock_parse, temp_feeds_file, db_path):
+        def parse(url):
+            return SimpleNamespace(
+                bozo=False,
+                feed={"title": f"Feed {url[-9]}"},
+                entries=[
+                    {
+                        "title": "Article",
+                        "link": f"{url}/article",
+                        "summary": "Content",
+                    },
+                ],
+            )
+
+        mock_parse.side_effect = parse
+
+        results = list(fetch_all_feeds(db_path, temp_feeds_file))
+
+        assert len(results) == 2
+        assert {r.feed_url for r in results} == {
+            "https://example.com/feed1.xml",
+            "https://example.com/feed2.xml",
+        }
+        assert all(r.articles_new == 1 for r in results)
+
+    def test_reports_failed_feeds(self, mock_parse, temp_feeds_file, db_path):
+        mock_parse.side_effect = Exception("Network down")
+
+        results = list(fetch_all_feeds(db_path, temp_feeds_file))
+
+        assert len(results) == 2
+        assert all(r.error for r in results)
+
+    def test_fetches_run_concurrently(self, mock_parse, db_path):
+        feed_count = 8
+        conn = get_connection(db_path)
+        for i in range(feed_count):
+            add_feed(conn, f"https://example{i}.com/feed.xml")
+        conn.close()
+
+        # Every fetch blocks until all of them are in flight at once
+        barrier = threading.Barrier(feed_count, timeout=5)
+
+        def parse(url):
+            barrier.wait()
+            return SimpleNamespace(bozo=False, feed={}, entries=[])
+
+        mock_parse.side_effect = parse
+
+        results = list(fetch_all_feeds(db_path))
+
+        assert len(results) == feed_count
+        assert not any(r.error for r in results)
+
+    def test_streams_results(self, mock_parse, temp_feeds_file, db_path):
+        # The second fetch waits until the first result has been consumed
+        first_consumed = threading.Event()
+
+        def parse(url):
+            if url.endswith("feed2.xml") and not first_consumed.wait(timeout=5):
+                raise TimeoutError("first result was not yielded")
+            return SimpleNamespace(bozo=False, feed={}, entries=[])
+
+        mock_parse.side_effect = parse
+
+        results = fetch_all_feeds(db_path, temp_feeds_file)
+        first = next(results)
+        first_consumed.set()
+        rest = list(results)
+
+        assert first.feed_url == "https://example.com/feed1.xml"
+        assert [r.error for r in rest] == [None]
+
+    def test_works_inside_running_loop(self, mock_parse, temp_feeds_file, db_path):
+        mock_parse.return_value = SimpleNamespace(bozo=False, feed={}, entries=[])
+
+        async def fetch():
+            return list(fetch_all_feeds(db_path, temp_feeds_file))
+
+        assert len(asyncio.run(fetch())) == 2
+
 
 class TestImportFeedsFromFile:
     def test_imports_feeds(self, temp_feeds_file, db_path):
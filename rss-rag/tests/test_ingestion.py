@@ -1,55 +1,91 @@
 """Tests for ingestion module."""
 
-import tempfile
-from pathlib import Path
+import asyncio
+import logging
+import shutil
+import sys
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from rss_rag.database import add_article, add_feed, get_connection, init_db
+from rss_rag.database import (
+    add_article,
+    add_feed,
+    bulk_insert_articles,
+    get_connection,
+    pooled_connection,
+    update_article_lightrag_ids,
+)
 from rss_rag.ingestion import (
     IngestionResult,
+    _build_document,
     _generate_doc_id,
     get_ingested_count,
     get_pending_count,
     ingest_article,
+    get_lightrag_instance_async,
+    ingest_pending_articles,
     reset_lightrag_instance,
 )
 
 
-@pytest.fixture
-def db_path():
-    """Create a temporary database with test data."""
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        path = Path(f.name)
-    init_db(path)
+@pytest.fixture(scope="module")
+def seeded_template(db_template, tmp_path_factory):
+    """Build a database with test data once for db_path to copy."""
+    path = tmp_path_factory.mktemp("seeded") / "seeded.db"
+    shutil.copyfile(db_template, path)
 
     # Add test data
     conn = get_connection(path)
     feed_id = add_feed(conn, "https://example.com/feed", "Test Feed")
-    add_article(
-        conn,
-        feed_id,
-        title="Test Article 1",
-        content="Test content 1",
-        link="https://example.com/article1",
-        pub_date=None,
-    )
-    add_article(
+    bulk_insert_articles(
         conn,
-        feed_id,
-        title="Test Article 2",
-        content="Test content 2",
-        link="https://example.com/article2",
-        pub_date=None,
+        [
+            (
+                feed_id,
+                f"Test Article {i}",
+                f"Test content {i}",
+                f"https://example.com/article{i}",
+                None,
+            )
+            for i in (1, 2)
+        ],
     )
     conn.close()
 
-    yield path
-    path.unlink(missing_ok=True)
+    return path
+
 
+@pytest.fixture
+def db_path(seeded_template, tmp_path):
+    """Create a temporary database with test data."""
+    path = tmp_path / "test.db"
+    shutil.copyfile(seeded_template, path)
+    return path
 
-@pytest.fixture(autouse=True)
+
+@pytest.fixture
+def conn(db_path):
+    """Borrow the pooled connection the count helpers also use."""
+    with pooled_connection(db_path) as conn:
+        yield conn
+
+
+def mock_lightrag(**ainsert_kwargs):
+    """Mock LightRAG whose inserted documents all end up processed."""
+    rag = MagicMock()
+    rag.ainsert = AsyncMock(**ainsert_kwargs)
+    rag.aget_docs_by_ids = AsyncMock(
+        side_effect=lambda ids: {
+            doc_id: SimpleNamespace(status="processed", error_msg=None)
+            for doc_id in ids
+        }
+    )
+    return rag
+
+
+@pytest.fixture
 def reset_rag():
     """Reset LightRAG instance before and after each test."""
     reset_lightrag_instance()
@@ -57,6 +93,43 @@ def reset_rag():
     reset_lightrag_instance()
 
 
+@pytest.mark.usefixtures("reset_rag")
+class TestGetLightRAGInstance:
+    """Tests for get_lightrag_instance_async function."""
+
+    @patch("rss_rag.ingestion._create_lightrag")
+    def test_concurrent_callers_share_one_instance(self, mock_create):
+        """Should create and initialize LightRAG once for concurrent callers."""
+
+        async def initialize_storages():
+            await asyncio.sleep(0.01)
+
+        mock_rag = MagicMock()
+        mock_rag.initialize_storages = AsyncMock(side_effect=initialize_storages)
+        mock_create.return_value = mock_rag
+
+        shared_storage = MagicMock()
+        shared_storage.initialize_pipeline_status = AsyncMock()
+        modules = {
+            "lightrag": MagicMock(),
+            "lightrag.kg": MagicMock(),
+            "lightrag.kg.shared_storage": shared_storage,
+        }
+
+        async def get_many():
+            return await asyncio.gather(
+                *(get_lightrag_instance_async() for _ in range(5))
+            )
+
+        with patch.dict(sys.modules, modules):
+            instances = asyncio.run(get_many())
+
+        assert all(rag is mock_rag for rag in instances)
+        mock_create.assert_called_once()
+        mock_rag.initialize_storages.assert_awaited_once()
+        shared_storage.initialize_pipeline_status.assert_awaited_once()
+
+
 class TestGenerateDocId:
     """Tests for _generate_doc_id function."""
 
@@ -77,7 +150,7 @@ class TestGenerateDocId:
         """Should return a string."""
         doc_id = _generate_doc_id("https://example.com/article")
         assert isinstance(doc_id, str)
-        assert len(doc_id) == 32  # MD5 hex digest length
+        assert len(doc_id) == 32  # 16-byte BLAKE2b hex digest length
 
 
 class TestGetPendingCount:
@@ -88,25 +161,17 @@ class TestGetPendingCount:
         count = get_pending_count(db_path)
         assert count == 2
 
-    def test_excludes_ingested_articles(self, db_path):
+    def test_excludes_ingested_articles(self, db_path, conn):
         """Should not count articles that have lightrag_id."""
         # Mark one as ingested
-        conn = get_connection(db_path)
-        cursor = conn.cursor()
-        cursor.execute("UPDATE articles SET lightrag_id = 'test-id' WHERE id = 1")
-        conn.commit()
-        conn.close()
+        conn.execute("UPDATE articles SET lightrag_id = 'test-id' WHERE id = 1")
 
         count = get_pending_count(db_path)
         assert count == 1
 
-    def test_returns_zero_when_all_ingested(self, db_path):
+    def test_returns_zero_when_all_ingested(self, db_path, conn):
         """Should return 0 when all articles are ingested."""
-        conn = get_connection(db_path)
-        cursor = conn.cursor()
-        cursor.execute("UPDATE articles SET lightrag_id = 'test-id'")
-        conn.commit()
-        conn.close()
+        conn.execute("UPDATE articles SET lightrag_id = 'test-id'")
 
         count = get_pending_count(db_path)
         assert count == 0
@@ -115,18 +180,14 @@ class TestGetPendingCount:
 class TestGetIngestedCount:
     """Tests for get_ingested_count function."""
 
-    def test_counts_ingested_articles(self, db_path):
+    def test_counts_ingested_articles(self, db_path, conn):
         """Should count articles with non-NULL lightrag_id."""
         # Initially none ingested
         count = get_ingested_count(db_path)
         assert count == 0
 
         # Mark one as ingested
-        conn = get_connection(db_path)
-        cursor = conn.cursor()
-        cursor.execute("UPDATE articles SET lightrag_id = 'test-id' WHERE id = 1")
-        conn.commit()
-        conn.close()
+        conn.execute("UPDATE articles SET lightrag_id = 'test-id' WHERE id = 1")
 
         count = get_ingested_count(db_path)
         assert count == 1
@@ -137,8 +198,7 @@ class TestIngestArticle:
 
     def test_successful_ingestion(self):
         """Should return success result on successful ingestion."""
-        mock_rag = MagicMock()
-        mock_rag.ainsert = AsyncMock()
+        mock_rag = mock_lightrag()
 
         result = ingest_article(
             mock_rag,
@@ -156,8 +216,7 @@ class TestIngestArticle:
 
     def test_failed_ingestion(self):
         """Should return error result on failed ingestion."""
-        mock_rag = MagicMock()
-        mock_rag.ainsert = AsyncMock(side_effect=Exception("API Error"))
+        mock_rag = mock_lightrag(side_effect=Exception("API Error"))
 
         result = ingest_article(
             mock_rag,
@@ -171,10 +230,28 @@ class TestIngestArticle:
         assert result.article_id == 1
         assert "API Error" in result.error
 
+    def test_unprocessed_document_fails(self):
+        """Should fail when LightRAG only queued the document."""
+        mock_rag = mock_lightrag()
+        mock_rag.aget_docs_by_ids.side_effect = lambda ids: {
+            ids[0]: SimpleNamespace(status="pending", error_msg=None)
+        }
+
+        result = ingest_article(
+            mock_rag,
+            article_id=1,
+            title="Test Article",
+            content="Test content",
+            link="https://example.com/test",
+        )
+
+        assert result.success is False
+        assert result.lightrag_id is None
+        assert result.error == "Document pending"
+
     def test_empty_content_handling(self):
         """Should handle empty content gracefully."""
-        mock_rag = MagicMock()
-        mock_rag.ainsert = AsyncMock()
+        mock_rag = mock_lightrag()
 
         result = ingest_article(
             mock_rag,
@@ -190,8 +267,7 @@ class TestIngestArticle:
 
     def test_none_content_handling(self):
         """Should handle None content gracefully."""
-        mock_rag = MagicMock()
-        mock_rag.ainsert = AsyncMock()
+        mock_rag = mock_lightrag()
 
         result = ingest_article(
             mock_rag,
@@ -204,6 +280,195 @@ class TestIngestArticle:
         assert result.success is True
 
 
+class TestIngestPendingArticles:
+    """Tests for ingest_pending_articles function."""
+
+    @patch("rss_rag.ingestion.get_lightrag_instance_async")
+    def test_ingests_and_marks_all_pending(self, mock_get_rag, db_path):
+        """Should ingest every pending article and store its lightrag_id."""
+        mock_rag = mock_lightrag()
+        mock_get_rag.return_value = mock_rag
+
+        results = list(ingest_pending_articles(db_path))
+
+        assert len(results) == 2
+        assert all(r.success for r in results)
+        assert get_pending_count(db_path) == 0
+
+    @patch("rss_rag.ingestion.get_lightrag_instance_async")
+    def test_inserts_articles_in_batches(self, mock_get_rag, db_path):
+        """Should hand LightRAG each batch of articles in a single call."""
+        mock_rag = mock_lightrag()
+        mock_get_rag.return_value = mock_rag
+
+        list(ingest_pending_articles(db_path))
+
+        mock_rag.ainsert.assert_awaited_once()
+        docs = mock_rag.ainsert.call_args.args[0]
+        assert len(docs) == 2
+        assert len(mock_rag.ainsert.call_args.kwargs["ids"]) == 2
+
+    @patch("rss_rag.ingestion.get_lightrag_instance_async")
+    def test_documents_match_build_document(self, mock_get_rag, db_path):
+        """Should hand LightRAG the same text _build_document produces."""
+        conn = get_connection(db_path)
+        add_article(conn, 1, "No Content", None, "https://example.com/empty", None)
+        conn.close()
+
+        mock_rag = mock_lightrag()
+        mock_get_rag.return_value = mock_rag
+
+        list(ingest_pending_articles(db_path))
+
+        docs = mock_rag.ainsert.call_args.args[0]
+        assert sorted(docs) == sorted(
+            [
+                _build_document(
+                    "Test Article 1", "Test content 1", "https://example.com/article1"
+                ),
+                _build_document(
+                    "Test Article 2", "Test content 2", "https://example.com/article2"
+                ),
+                _build_document("No Content", None, "https://example.com/empty"),
+            ]
+        )
+
+    @patch("rss_rag.ingestion.get_lightrag_instance_async")
+    def test_failed_batch_retries_articles_individually(self, mock_get_rag, db_path):
+        """Should fall back to per-article inserts when a batch insert fails."""
+
+        async def insert(docs, **kwargs):
+            if isinstance(docs, list):
+                raise Exception("Batch too large")
+            if "Article 2" in docs:
+                raise Exception("Bad document")
+
+        mock_rag = mock_lightrag(side_effect=insert)
+        mock_get_rag.return_value = mock_rag
+
+        results = list(ingest_pending_articles(db_path))
+
+        assert {r.title: r.success for r in results} == {
+            "Test Article 1": True,
+            "Test Article 2": False,
+        }
+        assert get_pending_count(db_path) == 1
+
+    @patch("rss_rag.ingestion.get_lightrag_instance_async")
+    def test_unprocessed_articles_stay_pending(self, mock_get_rag, db_path):
+        """Should not mark articles LightRAG failed to process as ingested."""
+        failed_id = _generate_doc_id("https://example.com/article2")
+        mock_rag = mock_lightrag()
+        mock_rag.aget_docs_by_ids.side_effect = lambda ids: {
+            doc_id: SimpleNamespace(
+                status="failed" if doc_id == failed_id else "processed",
+                error_msg="LLM timeout" if doc_id == failed_id else None,
+            )
+            for doc_id in ids
+        }
+        mock_get_rag.return_value = mock_rag
+
+        results = list(ingest_pending_articles(db_path))
+
+        assert {r.title: r.error for r in results} == {
+            "Test Article 1": None,
+            "Test Article 2": "LLM timeout",
+        }
+        assert get_pending_count(db_path) == 1
+
+    @patch("rss_rag.ingestion.get_lightrag_instance_async")
+    def test_failed_articles_stay_pending(self, mock_get_rag, db_path):
+        """Should leave articles pending when their insert fails."""
+        mock_rag = mock_lightrag(side_effect=Exception("API Error"))
+        mock_get_rag.return_value = mock_rag
+
+        results = list(ingest_pending_articles(db_path))
+
+        assert not any(r.success for r in results)
+        assert get_pending_count(db_path) == 2
+
+    @patch("rss_rag.ingestion.get_lightrag_instance_async")
+    def test_marks_ingested_articles_in_one_transaction(self, mock_get_rag, db_path):
+        """Should write the lightrag_ids of several batches together."""
+        mock_rag = mock_lightrag()
+        mock_get_rag.return_value = mock_rag
+
+        with patch(
+            "rss_rag.ingestion.update_article_lightrag_ids",
+            wraps=update_article_lightrag_ids,
+        ) as mock_update:
+            list(ingest_pending_articles(db_path, batch_size=1))
+
+        mock_update.assert_called_once()
+        assert get_pending_count(db_path) == 0
+
+    @patch("rss_rag.ingestion.get_lightrag_instance_async")
+    def test_respects_limit(self, mock_get_rag, db_path):
+        """Should ingest at most limit articles."""
+        mock_rag = mock_lightrag()
+        mock_get_rag.return_value = mock_rag
+
+        results = list(ingest_pending_articles(db_path, limit=1))
+
+        assert len(results) == 1
+        assert get_pending_count(db_path) == 1
+
+    @patch("rss_rag.ingestion.get_lightrag_instance_async")
+    def test_reads_next_batch_after_insert(self, mock_get_rag, db_path):
+        """Should not start the next batch before its results are consumed."""
+        mock_rag = mock_lightrag()
+        mock_get_rag.return_value = mock_rag
+
+        results = ingest_pending_articles(db_path, batch_size=1)
+        next(results)
+
+        assert mock_rag.ainsert.await_count == 1
+        assert len(list(results)) == 1
+        assert mock_rag.ainsert.await_count == 2
+
+    @patch("rss_rag.ingestion.get_lightrag_instance_async")
+    def test_quiets_lightrag_logger_during_run(self, mock_get_rag, db_path):
+        """Should raise LightRAG's log level while ingesting, then restore it."""
+        lightrag_logger = logging.getLogger("lightrag")
+        levels = []
+
+        async def insert(*args, **kwargs):
+            levels.append(lightrag_logger.level)
+
+        mock_rag = mock_lightrag(side_effect=insert)
+        mock_get_rag.return_value = mock_rag
+
+        lightrag_logger.setLevel(logging.INFO)
+        try:
+            list(ingest_pending_articles(db_path))
+            assert levels == [logging.WARNING]
+            assert lightrag_logger.level == logging.INFO
+        finally:
+            lightrag_logger.setLevel(logging.NOTSET)
+
+    @patch("rss_rag.ingestion.get_lightrag_instance_async")
+    def test_inserts_one_batch_at_a_time(self, mock_get_rag, db_path):
+        """Should never have two LightRAG inserts in flight."""
+        in_flight = 0
+        peak = 0
+
+        async def slow_insert(*args, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        mock_rag = mock_lightrag(side_effect=slow_insert)
+        mock_get_rag.return_value = mock_rag
+
+        results = list(ingest_pending_articles(db_path, batch_size=1))
+
+        assert all(r.success for r in results)
+        assert mock_rag.ainsert.await_count == 2
+        assert peak == 1
+
+
 class TestIngestionResult:
     """Tests for IngestionResult dataclass."""
 
@@ -3,7 +3,15 @@
 import pytest
 from unittest.mock import patch, MagicMock
 
-from rss_rag.llm import get_llm
+from rss_rag.llm import clear_llm_instances, get_llm
+
+
+@pytest.fixture(autouse=True)
+def clear_llms():
+    """Keep patched provider classes from leaking between tests."""
+    clear_llm_instances()
+    yield
+    clear_llm_instances()
 
 
 class TestGetLLM:
@@ -32,3 +40,15 @@ class TestGetLLM:
     def test_unsupported_provider_raises(self):
         with pytest.raises(ValueError, match="Unsupported LLM provider"):
             get_llm("unsupported", "model")
+
+    @patch("langchain_openai.ChatOpenAI")
+    def test_reuses_instances(self, mock_openai):
+        mock_openai.side_effect = lambda **kwargs: MagicMock()
+
+        first = get_llm("openai", "gpt-4o-mini", temperature=0.3)
+        second = get_llm("openai", "gpt-4o-mini", temperature=0.3)
+        other = get_llm("openai", "gpt-4o-mini", temperature=0.0)
+
+        assert first is second
+        assert other is not first
+        assert mock_openai.call_count == 2
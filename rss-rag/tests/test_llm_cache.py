@@ -0,0 +1,176 @@
+"""Tests for LLM cache module."""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import numpy as np
+import pytest
+
+from rss_rag.background_loop import run_sync
+from rss_rag.config import Config, LLMsConfig, StorageConfig
+from rss_rag.llm_cache import LLMCache, _embed_prompts, get_llm_cache
+
+
+def mock_llm(content="Summary"):
+    llm = MagicMock()
+    llm.ainvoke = AsyncMock(return_value=MagicMock(content=content))
+    return llm
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return LLMCache(tmp_path / "llm_cache.db")
+
+
+class TestLLMCache:
+    """Tests for LLMCache."""
+
+    def test_exact_hit_skips_llm(self, cache):
+        """Should answer a repeated prompt from the cache."""
+        llm = mock_llm()
+
+        first = asyncio.run(cache.invoke(llm, "prompt", "gpt-4o-mini", 0.0))
+        second = asyncio.run(cache.invoke(llm, "prompt", "gpt-4o-mini", 0.0))
+
+        assert first == second == "Summary"
+        llm.ainvoke.assert_awaited_once()
+
+    def test_models_do_not_share_entries(self, cache):
+        """Should key responses by model name."""
+        llm = mock_llm()
+
+        asyncio.run(cache.invoke(llm, "prompt", "model-a", 0.0))
+        asyncio.run(cache.invoke(llm, "prompt", "model-b", 0.0))
+
+        assert llm.ainvoke.await_count == 2
+
+    def test_shared_across_threads(self, cache):
+        """Should serve one cache from the caller's and the background loop."""
+        llm = mock_llm()
+
+        asyncio.run(cache.invoke(llm, "prompt", "gpt-4o-mini", 0.0))
+        result = run_sync(cache.invoke(llm, "prompt", "gpt-4o-mini", 0.0))
+
+        assert result == "Summary"
+        llm.ainvoke.assert_awaited_once()
+
+    def test_expired_entries_are_ignored(self, tmp_path):
+        """Should call the LLM again once an entry is older than the TTL."""
+        cache = LLMCache(tmp_path / "llm_cache.db", ttl=60)
+        cache.put("gpt-4o-mini", "prompt", "Old")
+        cache._get_conn().execute("UPDATE llm_cache SET ts = ?", (time.time() - 120,))
+
+        assert cache.get("gpt-4o-mini", "prompt") is None
+
+    def test_semantic_hit_for_similar_prompt(self, tmp_path):
+        """Should reuse the response of a near-identical sampled prompt."""
+        vectors = {"prompt one": [1.0, 0.0], "prompt 1": [0.99, 0.05]}
+        cache = LLMCache(
+            tmp_path / "llm_cache.db", embed=lambda ps: [vectors[p] for p in ps]
+        )
+        llm = mock_llm()
+
+        asyncio.run(cache.invoke(llm, "prompt one", "gpt-4o-mini", 0.3))
+        result = asyncio.run(cache.invoke(llm, "prompt 1", "gpt-4o-mini", 0.3))
+
+        assert result == "Summary"
+        llm.ainvoke.assert_awaited_once()
+
+    def test_no_semantic_match_at_zero_temperature(self, tmp_path):
+        """Should only match exact prompts for deterministic calls."""
+        embed = MagicMock(return_value=np.array([1.0, 0.0]))
+        cache = LLMCache(tmp_path / "llm_cache.db", embed=embed)
+        llm = mock_llm()
+
+        asyncio.run(cache.invoke(llm, "prompt one", "gpt-4o-mini", 0.0))
+        asyncio.run(cache.invoke(llm, "prompt 1", "gpt-4o-mini", 0.0))
+
+        assert llm.ainvoke.await_count == 2
+        embed.assert_not_called()
+
+    def test_no_semantic_match_when_embed_declines(self, tmp_path):
+        """Should only match exact prompts the embed function skips."""
+        cache = LLMCache(tmp_path / "llm_cache.db", embed=lambda ps: [None] * len(ps))
+        llm = mock_llm()
+
+        asyncio.run(cache.invoke(llm, "prompt one", "gpt-4o-mini", 0.3))
+        asyncio.run(cache.invoke(llm, "prompt 1", "gpt-4o-mini", 0.3))
+
+        assert llm.ainvoke.await_count == 2
+
+    def test_invoke_many_embeds_misses_in_one_batch(self, cache):
+        """Should embed every prompt without an exact match in one call."""
+        asyncio.run(cache.invoke(mock_llm("Cached"), "known", "gpt-4o-mini", 0.3))
+        cache.embed = MagicMock(side_effect=lambda ps: [[1.0, 0.0]] * len(ps))
+        llm = MagicMock()
+        llm.abatch = AsyncMock(return_value=[MagicMock(content="New")] * 2)
+
+        asyncio.run(cache.invoke_many(llm, ["known", "a", "b"], "gpt-4o-mini", 0.3))
+
+        cache.embed.assert_called_once_with(["a", "b"])
+
+    def test_semantic_entries_persist(self, tmp_path):
+        """Should load stored prompt embeddings in a new cache."""
+        path = tmp_path / "llm_cache.db"
+        first = LLMCache(path, embed=lambda ps: [[1.0, 0.0]] * len(ps))
+        asyncio.run(first.invoke(mock_llm(), "prompt one", "gpt-4o-mini", 0.3))
+
+        llm = mock_llm("Other")
+        second = LLMCache(path, embed=lambda ps: [[1.0, 0.0]] * len(ps))
+        result = asyncio.run(second.invoke(llm, "prompt 1", "gpt-4o-mini", 0.3))
+
+        assert result == "Summary"
+        llm.ainvoke.assert_not_awaited()
+
+    def test_invoke_many_batches_misses(self, cache):
+        """Should send only uncached prompts, in one batch."""
+        asyncio.run(cache.invoke(mock_llm("Cached"), "known", "gpt-4o-mini", 0.0))
+        llm = MagicMock()
+        llm.abatch = AsyncMock(
+            return_value=[MagicMock(content="New"), Exception("Rate limited")]
+        )
+
+        responses = asyncio.run(
+            cache.invoke_many(llm, ["known", "new", "failing"], "gpt-4o-mini", 0.0)
+        )
+
+        assert responses == ["Cached", "New", None]
+        assert llm.abatch.call_args.args[0] == ["new", "failing"]
+        assert cache.get("gpt-4o-mini", "new") == "New"
+        assert cache.get("gpt-4o-mini", "failing") is None
+
+
+class TestGetLLMCache:
+    """Tests for get_llm_cache and its prompt embedding."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        get_llm_cache.cache_clear()
+        yield
+        get_llm_cache.cache_clear()
+
+    @pytest.mark.parametrize("semantic_cache", [False, True])
+    def test_semantic_tier_is_opt_in(self, tmp_path, semantic_cache):
+        config = Config(
+            storage=StorageConfig(lightrag_dir=tmp_path),
+            llm=LLMsConfig(semantic_cache=semantic_cache),
+        )
+
+        with patch("rss_rag.llm_cache.get_config", return_value=config):
+            cache = get_llm_cache()
+
+        assert cache.db_path == tmp_path / "llm_cache.db"
+        assert (cache.embed is _embed_prompts) is semantic_cache
+
+    def test_truncated_prompts_are_not_embedded(self):
+        model = MagicMock()
+        model.truncates.side_effect = lambda prompt: prompt.startswith("long")
+        model.encode.return_value = np.array([[1.0, 0.0]])
+
+        with patch("rss_rag.embeddings.get_embedding_model", return_value=model):
+            vectors = _embed_prompts(["long prompt", "short prompt"])
+
+        assert vectors[0] is None
+        np.testing.assert_array_equal(vectors[1], [1.0, 0.0])
+        model.encode.assert_called_once_with(["short prompt"])
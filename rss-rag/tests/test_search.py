@@ -5,33 +5,57 @@ from unittest.mock import patch, MagicMock, AsyncMock
 
 from rss_rag.search import (
     search,
+    search_many,
     QueryMode,
     SearchResult,
     _extract_sources,
     format_search_result,
 )
+from rss_rag.llm_cache import LLMCache
 
 
-class TestExtractSources:
-    def test_extracts_urls(self):
-        text = "Check out https://example.com/article1 and http://test.com/page"
-        sources = _extract_sources(text)
+@pytest.fixture(autouse=True)
+def llm_cache(tmp_path):
+    """Keep summaries in a temporary cache instead of the storage dir."""
+    cache = LLMCache(tmp_path / "llm_cache.db")
+    with patch("rss_rag.llm_cache.get_llm_cache", return_value=cache):
+        yield cache
+
 
-        assert len(sources) == 2
-        assert "https://example.com/article1" in sources
-        assert "http://test.com/page" in sources
+@pytest.fixture
+def mock_rag(monkeypatch):
+    """Replace the LightRAG accessor with a mock."""
+    mock_rag = AsyncMock()
+    monkeypatch.setattr("rss_rag.search.get_lightrag_instance_async", mock_rag)
+    return mock_rag
 
-    def test_deduplicates_urls(self):
-        text = "See https://example.com twice: https://example.com"
-        sources = _extract_sources(text)
 
-        assert len(sources) == 1
+@pytest.fixture
+def mock_llm(monkeypatch):
+    """Replace the summarizer LLM accessor with a mock."""
+    mock_llm = MagicMock()
+    monkeypatch.setattr("rss_rag.search.get_summarizer_llm", mock_llm)
+    return mock_llm
 
-    def test_handles_no_urls(self):
-        text = "No URLs here"
-        sources = _extract_sources(text)
 
-        assert sources == []
+class TestExtractSources:
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            (
+                "Check out https://example.com/article1 and http://test.com/page",
+                ["https://example.com/article1", "http://test.com/page"],
+            ),
+            (
+                "See https://example.com twice: https://example.com",
+                ["https://example.com"],
+            ),
+            ("No URLs here", []),
+        ],
+        ids=["extracts", "deduplicates", "none"],
+    )
+    def test_extract_sources(self, text, expected):
+        assert _extract_sources(text) == expected
 
 
 class TestFormatSearchResult:
@@ -79,8 +103,6 @@ class TestFormatSearchResult:
 
 
 class TestSearch:
-    @patch("rss_rag.search.get_lightrag_instance")
-    @patch("rss_rag.search.get_summarizer_llm")
     def test_successful_search(self, mock_llm, mock_rag):
         mock_rag_instance = MagicMock()
         mock_rag_instance.aquery = AsyncMock(return_value="Found article about topic")
@@ -95,7 +117,6 @@ class TestSearch:
         assert result.error is None
         assert "Found article" in result.raw_response
 
-    @patch("rss_rag.search.get_lightrag_instance")
     def test_search_without_summary(self, mock_rag):
         mock_rag_instance = MagicMock()
         mock_rag_instance.aquery = AsyncMock(return_value="Direct response")
@@ -106,7 +127,6 @@ class TestSearch:
         assert result.summary is None
         assert result.raw_response == "Direct response"
 
-    @patch("rss_rag.search.get_lightrag_instance")
     def test_search_handles_error(self, mock_rag):
         mock_rag.side_effect = Exception("Connection error")
 
@@ -116,9 +136,44 @@ class TestSearch:
         assert "Connection error" in result.error
 
 
+class TestSearchMany:
+    def test_summarizes_in_one_batch(self, mock_llm, mock_rag):
+        mock_rag_instance = MagicMock()
+        mock_rag_instance.aquery = AsyncMock(side_effect=lambda q, param: f"About {q}")
+        mock_rag.return_value = mock_rag_instance
+
+        mock_llm_instance = MagicMock()
+        mock_llm_instance.abatch = AsyncMock(
+            side_effect=lambda prompts, **kwargs: [
+                MagicMock(content=f"Summary {i}") for i in range(len(prompts))
+            ]
+        )
+        mock_llm.return_value = mock_llm_instance
+
+        results = search_many(["first", "second"])
+
+        assert [r.raw_response for r in results] == ["About first", "About second"]
+        assert [r.summary for r in results] == ["Summary 0", "Summary 1"]
+        mock_llm_instance.abatch.assert_awaited_once()
+
+    def test_failed_query_does_not_fail_others(self, mock_rag):
+        async def aquery(query, param):
+            if query == "bad":
+                raise Exception("Query error")
+            return "Direct response"
+
+        mock_rag_instance = MagicMock()
+        mock_rag_instance.aquery = AsyncMock(side_effect=aquery)
+        mock_rag.return_value = mock_rag_instance
+
+        results = search_many(["good", "bad"], summarize=False)
+
+        assert results[0].raw_response == "Direct response"
+        assert results[0].error is None
+        assert "Query error" in results[1].error
+
+
 class TestQueryMode:
-    def test_all_modes_exist(self):
-        assert QueryMode.HYBRID.value == "hybrid"
-        assert QueryMode.LOCAL.value == "local"
-        assert QueryMode.GLOBAL.value == "global"
-        assert QueryMode.NAIVE.value == "naive"
+    @pytest.mark.parametrize("mode", ["hybrid", "local", "global", "naive"])
+    def test_mode_values(self, mode):
+        assert QueryMode[mode.upper()].value == mode